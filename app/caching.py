@@ -0,0 +1,212 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import config
+
+try:
+    import redis
+except ImportError:  # optional dependency, only needed for CACHE_BACKEND=redis
+    redis = None
+
+
+MISSING = object()
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class LRUCache:
+    """In-process LRU with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._data = OrderedDict()
+        # Counters (list generations) live outside the LRU so they are never evicted.
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._data[key]
+                self.stats.incr("evictions")
+                entry = None
+            if entry is None:
+                self.stats.incr("misses")
+                return MISSING
+            self._data.move_to_end(key)
+        self.stats.incr("hits")
+        return entry[1]
+
+    def get_many(self, keys: List[str]) -> List[Any]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.stats.incr("evictions")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self.stats.incr("invalidations")
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class LocalSharedCache(LRUCache):
+    """
+    Stand-in for a shared cache server in tests and single-host setups.
+
+    Values are pickled on the way in and out, so code written against it
+    behaves as it would against Redis (no shared mutable objects).
+    """
+
+    def get(self, key: str) -> Any:
+        value = super().get(key)
+        return value if value is MISSING else pickle.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        super().set(key, pickle.dumps(value), ttl)
+
+
+class RedisCache:
+    """Shared cache across workers and hosts; evictions are Redis' own and are not counted."""
+
+    def __init__(self, url: str, ttl: float = 300, prefix: str = "cinema:"):
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Any:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            self.stats.incr("misses")
+            return MISSING
+        self.stats.incr("hits")
+        return pickle.loads(raw)
+
+    def get_many(self, keys: List[str]) -> List[Any]:
+        # One MGET round-trip instead of one GET per key.
+        values = []
+        for raw in self.client.mget([self.prefix + key for key in keys]) if keys else []:
+            if raw is None:
+                self.stats.incr("misses")
+                values.append(MISSING)
+            else:
+                self.stats.incr("hits")
+                values.append(pickle.loads(raw))
+        return values
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=int(ttl if ttl is not None else self.ttl))
+
+    def delete(self, key: str) -> None:
+        if self.client.delete(self.prefix + key):
+            self.stats.incr("invalidations")
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def counter(self, key: str) -> int:
+        raw = self.client.get(self.prefix + key)
+        return int(raw) if raw is not None else 0
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+
+class NullCache:
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Any:
+        self.stats.incr("misses")
+        return MISSING
+
+    def get_many(self, keys: List[str]) -> List[Any]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def incr(self, key: str) -> int:
+        return 0
+
+    def counter(self, key: str) -> int:
+        return 0
+
+    def clear(self) -> None:
+        pass
+
+
+def generation(cache, namespace: str) -> int:
+    """Current list generation of ``namespace``; bump_generation() invalidates every list key."""
+    return cache.counter(f"{namespace}:gen")
+
+
+def bump_generation(cache, namespace: str) -> None:
+    cache.incr(f"{namespace}:gen")
+    cache.stats.incr("invalidations")
+
+
+def build_cache(backend: str = None):
+    backend = (backend or config.CACHE_BACKEND).lower()
+    if backend == "local":
+        return LRUCache(config.CACHE_MAX_ENTRIES, config.CACHE_TTL_SECONDS)
+    if backend == "shared":
+        return LocalSharedCache(config.CACHE_MAX_ENTRIES, config.CACHE_TTL_SECONDS)
+    if backend == "redis":
+        return RedisCache(config.CACHE_REDIS_URL, config.CACHE_TTL_SECONDS)
+    if backend == "none":
+        return NullCache()
+    raise ValueError(f"Unknown CACHE_BACKEND '{backend}'")
+
+
+catalog_cache = build_cache()
@@ -0,0 +1,92 @@
+import time
+import threading
+from typing import Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+import config
+from metrics import Histogram
+
+
+class _CheckoutMetrics:
+    """Checkout wait-time tracking shared by the sync and async pools."""
+
+    def _init_metrics(self):
+        self.wait_time = Histogram()
+        self.timeouts = 0
+        self._metrics_lock = threading.Lock()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            self.wait_time.observe(time.perf_counter() - start)
+
+    def stats(self) -> Dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeouts": self.timeouts,
+            "wait_seconds": self.wait_time.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(_CheckoutMetrics, QueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_metrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_time = self.wait_time
+        pool.timeouts = self.timeouts
+        return pool
+
+
+class InstrumentedAsyncQueuePool(_CheckoutMetrics, AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_metrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_time = self.wait_time
+        pool.timeouts = self.timeouts
+        return pool
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict:
+    """Keyword arguments for create_engine/create_async_engine from config."""
+    if url.startswith("sqlite"):
+        # SQLite keeps SQLAlchemy's default pool; sizing does not apply.
+        return {}
+
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+    if config.DB_STATEMENT_TIMEOUT_MS and url.startswith("postgresql"):
+        timeout = str(config.DB_STATEMENT_TIMEOUT_MS)
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def pool_stats(engine) -> Dict:
+    pool = engine.pool
+    if isinstance(pool, _CheckoutMetrics):
+        return pool.stats()
+    return {"status": pool.status()}
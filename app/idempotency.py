@@ -0,0 +1,342 @@
+import asyncio
+import datetime
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+from starlette.responses import JSONResponse, Response
+import config
+
+# Outcomes of IdempotencyStore.begin().
+NEW = "new"
+PENDING = "pending"
+DONE = "done"
+MISMATCH = "mismatch"
+
+MAX_KEY_LENGTH = 255
+
+
+class StoredResponse(NamedTuple):
+    status_code: int
+    content_type: Optional[str]
+    # None when the body was larger than IDEMPOTENCY_MAX_BODY_BYTES.
+    body: Optional[bytes]
+
+
+class IdempotencyStats:
+    def __init__(self):
+        self.stored = 0
+        self.replayed = 0
+        self.in_progress = 0
+        self.mismatched = 0
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "stored": self.stored,
+                "replayed": self.replayed,
+                "in_progress": self.in_progress,
+                "mismatched": self.mismatched,
+            }
+
+
+class MemoryIdempotencyStore:
+    """Per-process store; bounded LRU with a per-key TTL."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = IdempotencyStats()
+        # key -> [expires, fingerprint, StoredResponse or None while pending]
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def begin(self, key: str, fingerprint: str) -> Tuple[str, Optional[StoredResponse]]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] < now:
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self._data[key] = [now + self.ttl, fingerprint, None]
+                while len(self._data) > self.max_entries:
+                    self._data.popitem(last=False)
+                return NEW, None
+            self._data.move_to_end(key)
+            if entry[1] != fingerprint:
+                return MISMATCH, None
+            if entry[2] is None:
+                return PENDING, None
+            return DONE, entry[2]
+
+    def complete(self, key: str, response: StoredResponse) -> None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                entry[2] = response
+
+    def abandon(self, key: str) -> None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[2] is None:
+                del self._data[key]
+
+    def purge(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._data.items() if entry[0] < now]
+            for key in expired:
+                del self._data[key]
+        return len(expired)
+
+
+class DatabaseIdempotencyStore:
+    """
+    Store backed by the idempotency_keys table, so a retry that lands on a
+    different worker still finds the first response. Claiming a key is a
+    single INSERT; the primary key decides which of two racing requests runs.
+    A claim is a lease: once ``lease`` seconds pass without a response, the
+    worker that held it is taken for dead and a retry may claim the key again.
+    """
+
+    blocking = True
+
+    def __init__(self, session_factory=None, ttl: float = 86400, lease: float = 60):
+        if session_factory is None:
+            from database import SessionLocal as session_factory
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.lease = lease
+        self.stats = IdempotencyStats()
+
+    def begin(self, key: str, fingerprint: str) -> Tuple[str, Optional[StoredResponse]]:
+        from sqlalchemy.exc import IntegrityError
+        from models import IdempotencyRecord
+
+        now = datetime.datetime.utcnow()
+        with self.session_factory() as db:
+            for _ in range(2):
+                record = db.get(IdempotencyRecord, key)
+                if record is not None and record.expires_at < now:
+                    db.delete(record)
+                    db.commit()
+                    record = None
+                if record is not None:
+                    if record.fingerprint != fingerprint:
+                        return MISMATCH, None
+                    if record.status_code is None:
+                        return self._take_over(db, record, now)
+                    return DONE, StoredResponse(record.status_code, record.content_type, record.body)
+                try:
+                    db.add(IdempotencyRecord(
+                        key=key,
+                        fingerprint=fingerprint,
+                        claimed_at=now,
+                        expires_at=now + datetime.timedelta(seconds=self.ttl)
+                    ))
+                    db.commit()
+                    return NEW, None
+                except IntegrityError:
+                    # Another worker claimed the key first; read its record.
+                    db.rollback()
+            return PENDING, None
+
+    def _take_over(self, db, record, now: datetime.datetime) -> Tuple[str, Optional[StoredResponse]]:
+        """Claim a pending key whose lease ran out; of several retries only one wins."""
+        from models import IdempotencyRecord
+
+        if record.claimed_at is not None and record.claimed_at > now - datetime.timedelta(seconds=self.lease):
+            return PENDING, None
+        taken = db.query(IdempotencyRecord).filter(
+            IdempotencyRecord.key == record.key,
+            IdempotencyRecord.status_code.is_(None),
+            IdempotencyRecord.claimed_at == record.claimed_at
+        ).update({IdempotencyRecord.claimed_at: now}, synchronize_session=False)
+        db.commit()
+        return (NEW, None) if taken else (PENDING, None)
+
+    def complete(self, key: str, response: StoredResponse) -> None:
+        from models import IdempotencyRecord
+
+        with self.session_factory() as db:
+            db.query(IdempotencyRecord).filter(IdempotencyRecord.key == key).update(
+                {
+                    IdempotencyRecord.status_code: response.status_code,
+                    IdempotencyRecord.content_type: response.content_type,
+                    IdempotencyRecord.body: response.body,
+                },
+                synchronize_session=False
+            )
+            db.commit()
+
+    def abandon(self, key: str) -> None:
+        from models import IdempotencyRecord
+
+        with self.session_factory() as db:
+            db.query(IdempotencyRecord).filter(
+                IdempotencyRecord.key == key,
+                IdempotencyRecord.status_code.is_(None)
+            ).delete(synchronize_session=False)
+            db.commit()
+
+    def purge(self) -> int:
+        from models import IdempotencyRecord
+
+        with self.session_factory() as db:
+            deleted = db.query(IdempotencyRecord).filter(
+                IdempotencyRecord.expires_at < datetime.datetime.utcnow()
+            ).delete(synchronize_session=False)
+            db.commit()
+        return deleted
+
+
+def build_store(backend: str = None):
+    backend = (backend or config.IDEMPOTENCY_BACKEND).lower()
+    if backend == "memory":
+        return MemoryIdempotencyStore(config.IDEMPOTENCY_MAX_ENTRIES, config.IDEMPOTENCY_TTL_SECONDS)
+    if backend == "db":
+        return DatabaseIdempotencyStore(ttl=config.IDEMPOTENCY_TTL_SECONDS, lease=config.IDEMPOTENCY_LEASE_SECONDS)
+    if backend == "none":
+        return None
+    raise ValueError(f"Unknown IDEMPOTENCY_BACKEND '{backend}'")
+
+
+class IdempotencyMiddleware:
+    """
+    Honors the Idempotency-Key header on POST requests.
+
+    The first request with a key runs normally and its response (status,
+    content type and body) is stored. A retry with the same key and the same
+    method, path and body gets the stored response back without touching the
+    route, so no second write transaction runs. The same key with a different
+    request is rejected with 422, and a retry that arrives while the first
+    request is still running gets 409, as does a retry of a request whose
+    response was too large to keep. 5xx responses are not stored, so the
+    client can retry them. Multipart uploads (file imports) pass straight
+    through: they are not buffered to fingerprint them.
+    """
+
+    def __init__(self, app, store=None):
+        self.app = app
+        self.store = store
+
+    async def _call(self, method, *args):
+        if self.store.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def __call__(self, scope, receive, send):
+        if self.store is None or scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        raw_key = headers.get(b"idempotency-key")
+        if not raw_key or headers.get(b"content-type", b"").lower().startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+        if len(raw_key) > MAX_KEY_LENGTH:
+            await JSONResponse(
+                {"detail": f"Idempotency-Key longer than {MAX_KEY_LENGTH} characters"},
+                status_code=400
+            )(scope, receive, send)
+            return
+
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        body = b"".join(chunks)
+
+        digest = hashlib.sha256()
+        for part in (scope["method"].encode(), scope["path"].encode(), scope.get("query_string", b""), body):
+            digest.update(part)
+            digest.update(b"\0")
+        key = f"{scope['path']}|{raw_key.decode('latin-1')}"
+
+        state, stored = await self._call(self.store.begin, key, digest.hexdigest())
+        if state == DONE and stored.body is None:
+            self.store.stats.incr("replayed")
+            await JSONResponse(
+                {"detail": (
+                    f"A request with this Idempotency-Key already completed with status "
+                    f"{stored.status_code}; its response was too large to replay"
+                )},
+                status_code=409
+            )(scope, receive, send)
+            return
+        if state == DONE:
+            self.store.stats.incr("replayed")
+            await Response(
+                content=stored.body,
+                status_code=stored.status_code,
+                media_type=stored.content_type,
+                headers={"Idempotent-Replayed": "true"}
+            )(scope, receive, send)
+            return
+        if state == PENDING:
+            self.store.stats.incr("in_progress")
+            await JSONResponse(
+                {"detail": "A request with this Idempotency-Key is still in progress"},
+                status_code=409
+            )(scope, receive, send)
+            return
+        if state == MISMATCH:
+            self.store.stats.incr("mismatched")
+            await JSONResponse(
+                {"detail": "Idempotency-Key was already used for a different request"},
+                status_code=422
+            )(scope, receive, send)
+            return
+
+        body_sent = False
+
+        async def replay_receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        response = {"status": None, "content_type": None, "body": [], "size": 0}
+
+        async def capture_send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                for name, value in message.get("headers", []):
+                    if name.lower() == b"content-type":
+                        response["content_type"] = value.decode("latin-1")
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                response["size"] += len(chunk)
+                if response["size"] <= config.IDEMPOTENCY_MAX_BODY_BYTES:
+                    response["body"].append(chunk)
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except BaseException:
+            await self._call(self.store.abandon, key)
+            raise
+
+        status = response["status"]
+        if status is None or status >= 500:
+            await self._call(self.store.abandon, key)
+            return
+        # Too large to keep, but done all the same: a retry must not run it again.
+        body = b"".join(response["body"]) if response["size"] <= config.IDEMPOTENCY_MAX_BODY_BYTES else None
+        await self._call(self.store.complete, key, StoredResponse(status, response["content_type"], body))
+        self.store.stats.incr("stored")
+
+
+idempotency_store = build_store()
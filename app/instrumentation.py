@@ -0,0 +1,261 @@
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import config
+from metrics import Histogram
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("cinema.slow_query")
+
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250, 1000)
+ROW_BUCKETS = (0, 1, 10, 50, 100, 500, 1000, 5000, 10000, 100000)
+
+
+class RequestStats:
+    """SQL work attributed to the current request."""
+
+    __slots__ = ("statements", "db_seconds", "rows")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+
+
+# Set by MetricsMiddleware for the duration of a request. Sync routes run in
+# a worker thread that inherits a copy of the context, so they still see the
+# same RequestStats object.
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+_LITERALS = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"%\(\w+\)s|(?<![:\w]):\w+|\$\d+"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?)"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize SQL so the same query shape with different parameters groups together."""
+    for pattern, replacement in _LITERALS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+class RouteMetrics:
+    def __init__(self):
+        self.duration = Histogram()
+        self.db_duration = Histogram()
+        self.statements = Histogram(COUNT_BUCKETS)
+        self.rows = Histogram(ROW_BUCKETS)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = {}
+        self.slow_queries: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        key = (method, route)
+        with self._lock:
+            metrics = self.routes.get(key)
+            if metrics is None:
+                metrics = self.routes[key] = RouteMetrics()
+            self.responses[(method, route, status)] = self.responses.get((method, route, status), 0) + 1
+        metrics.duration.observe(seconds)
+        metrics.db_duration.observe(stats.db_seconds)
+        metrics.statements.observe(stats.statements)
+        metrics.rows.observe(stats.rows)
+
+    def slow_query(self, shape: str) -> None:
+        with self._lock:
+            self.slow_queries[shape] = self.slow_queries.get(shape, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes.clear()
+            self.responses.clear()
+            self.slow_queries.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        # Hooks were installed while this statement was already running.
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+        # DBAPI rowcount: rows returned for SELECT on psycopg2/asyncpg, rows
+        # affected for DML; -1 where the driver does not know (sqlite SELECT).
+        if cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+    if config.SLOW_QUERY_MS and elapsed * 1000 >= config.SLOW_QUERY_MS:
+        shape = fingerprint(statement)
+        registry.slow_query(shape)
+        slow_query_logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {shape}")
+
+
+_installed = False
+
+
+def install_sql_hooks() -> None:
+    """Listen on every Engine (sync, and async via its sync_engine); safe to call twice."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = True
+
+
+def uninstall_sql_hooks() -> None:
+    global _installed
+    if not _installed:
+        return
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = False
+
+
+def route_template(scope) -> str:
+    """
+    The full template of the route that matched, prefix included
+    (``/plays/{play_id}``), or "unmatched".
+
+    A route included with a prefix may only know its own part of the path
+    (``/{play_id}``), and the scope does not say which prefix it was mounted
+    under. It is recovered from the request path instead: filling the path
+    parameters into the route's template gives the part of the path it
+    matched, and whatever comes before that is the prefix.
+    """
+    path_format = getattr(scope.get("route"), "path_format", None)
+    if path_format is None:
+        return "unmatched"
+    matched = path_format
+    for name, value in scope.get("path_params", {}).items():
+        matched = matched.replace("{" + name + "}", str(value))
+    path = scope["path"]
+    if matched and path.endswith(matched):
+        return path[:len(path) - len(matched)] + path_format
+    return path_format
+
+
+class MetricsMiddleware:
+    """
+    Times every HTTP request and attributes the SQL it ran to the matched
+    route template (``/plays/{play_id}``, not the raw path), so label
+    cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current.reset(token)
+            registry.observe(
+                scope["method"],
+                route_template(scope),
+                status,
+                elapsed,
+                stats
+            )
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _labels(labels: Dict) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _histogram_lines(name: str, labels: Dict, snapshot: Dict):
+    base = _labels(labels)
+    sep = "," if base else ""
+    for bound, count in snapshot["buckets"].items():
+        yield f'{name}_bucket{{{base}{sep}le="{bound}"}} {count}'
+    yield f"{name}_sum{{{base}}} {snapshot['sum']}"
+    yield f"{name}_count{{{base}}} {snapshot['count']}"
+
+
+def render_prometheus(extra_counters: Dict[str, Dict[str, int]] = None, pools: Dict[str, Dict] = None) -> str:
+    """Render the registry (plus pool and subsystem counters) in the Prometheus text format."""
+    lines = []
+    histograms = (
+        ("http_request_duration_seconds", "Wall time per request", "duration"),
+        ("http_request_db_seconds", "Time spent executing SQL per request", "db_duration"),
+        ("http_request_db_statements", "SQL statements per request", "statements"),
+        ("http_request_db_rows", "Rows returned or affected per request", "rows"),
+    )
+    with registry._lock:
+        routes = list(registry.routes.items())
+        responses = list(registry.responses.items())
+        slow = list(registry.slow_queries.items())
+
+    for name, help_text, attr in histograms:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for (method, route), metrics in routes:
+            lines.extend(_histogram_lines(name, {"method": method, "route": route}, getattr(metrics, attr).snapshot()))
+
+    lines.append("# HELP http_responses_total Responses by route and status code")
+    lines.append("# TYPE http_responses_total counter")
+    for (method, route, status), count in responses:
+        lines.append(f"http_responses_total{{{_labels({'method': method, 'route': route, 'status': status})}}} {count}")
+
+    lines.append("# HELP db_slow_queries_total Statements slower than SLOW_QUERY_MS by fingerprint")
+    lines.append("# TYPE db_slow_queries_total counter")
+    for shape, count in slow:
+        lines.append(f"db_slow_queries_total{{{_labels({'fingerprint': shape})}}} {count}")
+
+    for engine_name, stats in (pools or {}).items():
+        if "wait_seconds" not in stats:
+            continue
+        labels = {"engine": engine_name}
+        for gauge in ("size", "checked_out", "checked_in", "overflow"):
+            lines.append(f"db_pool_{gauge}{{{_labels(labels)}}} {stats[gauge]}")
+        lines.append(f"db_pool_timeouts_total{{{_labels(labels)}}} {stats['timeouts']}")
+        lines.extend(_histogram_lines("db_pool_wait_seconds", labels, stats["wait_seconds"]))
+
+    for prefix, counters in (extra_counters or {}).items():
+        for name, value in counters.items():
+            lines.append(f"{prefix}_{name}_total {value}")
+    return "\n".join(lines) + "\n"
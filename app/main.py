@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+import config
+from database import init_db
+from idempotency import IdempotencyMiddleware, idempotency_store
+from instrumentation import MetricsMiddleware, install_sql_hooks
+from sweeper import run_analytics_folder, run_sweeper
+from warmup import warm_up
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The server only starts accepting connections once this startup half
+    # returns, and /readyz stays 503 until the worker is warm.
+    app.state.ready = False
+    if config.DB_CREATE_ON_STARTUP:
+        init_db()
+    if config.WARMUP_ENABLED:
+        try:
+            await warm_up(app.state.db_mode)
+        except Exception:
+            # A cold worker is still a working one; /readyz reports the database.
+            logger.exception("Worker warm-up failed")
+    stop = asyncio.Event()
+    jobs = []
+    if config.HOLD_SWEEPER_ENABLED:
+        jobs.append(asyncio.create_task(run_sweeper(stop)))
+    if config.ANALYTICS_FOLD_ENABLED:
+        jobs.append(asyncio.create_task(run_analytics_folder(stop)))
+    app.state.ready = True
+    yield
+    # Fail readiness first so the load balancer drains this worker.
+    app.state.ready = False
+    stop.set()
+    for job in jobs:
+        await job
+
+
+def create_app(db_mode: str = None) -> FastAPI:
+    db_mode = (db_mode or config.DB_MODE).lower()
+    if db_mode == "async":
+        from routers.aio import actor, customer, director, play, showtime, ticket
+    elif db_mode == "sync":
+        from routers import actor, customer, director, play, showtime, ticket
+    else:
+        raise ValueError(f"Unknown DB_MODE '{db_mode}', expected 'sync' or 'async'")
+    from routers import analytics, cache, export, health, hold, imports, pool, schedule, search, seat, telemetry
+
+    app = FastAPI(title="Cinema API", lifespan=lifespan)
+    app.state.db_mode = db_mode
+    app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
+    if config.METRICS_ENABLED:
+        # Added last so it wraps everything, including idempotent replays.
+        install_sql_hooks()
+        app.add_middleware(MetricsMiddleware)
+    app.include_router(play.router, prefix="/plays", tags=["plays"])
+    app.include_router(director.router, prefix="/directors", tags=["directors"])
+    app.include_router(actor.router, prefix="/actors", tags=["actors"])
+    app.include_router(customer.router, prefix="/customers", tags=["customers"])
+    app.include_router(showtime.router, prefix="/showtimes", tags=["showtimes"])
+    app.include_router(seat.router, prefix="/showtimes", tags=["seats"])
+    app.include_router(ticket.router, prefix="/tickets", tags=["tickets"])
+    app.include_router(hold.router, prefix="/holds", tags=["tickets"])
+    app.include_router(schedule.router, prefix="/schedule", tags=["schedule"])
+    app.include_router(search.router, prefix="/search", tags=["search"])
+    app.include_router(export.router, prefix="/exports", tags=["exports"])
+    app.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+    app.include_router(imports.router, prefix="/imports", tags=["imports"])
+    app.include_router(pool.router, prefix="/pool", tags=["ops"])
+    app.include_router(cache.router, prefix="/cache", tags=["ops"])
+    app.include_router(telemetry.router, tags=["ops"])
+    app.include_router(health.router, tags=["ops"])
+    return app
+
+
+app = create_app()
@@ -0,0 +1,122 @@
+"""Operational commands.
+
+    python app/manage.py migrate
+    python app/manage.py rebuild-availability
+    python app/manage.py rebuild-schedule
+    python app/manage.py rebuild-analytics
+    python app/manage.py import customers crm.csv --copy
+    python app/manage.py purge-idempotency
+"""
+import argparse
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "routers")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from database import SessionLocal
+
+
+def migrate(args):
+    from database import init_db
+
+    init_db()
+    print("Schema is up to date")
+
+
+def rebuild_availability(args):
+    from crud import availability as crud_availability
+
+    with SessionLocal() as db:
+        count = crud_availability.rebuild_availability(db)
+    print(f"Rebuilt availability counters for {count} showtimes")
+
+
+def rebuild_schedule(args):
+    from crud import schedule as crud_schedule
+
+    with SessionLocal() as db:
+        count = crud_schedule.rebuild_schedule(db)
+    print(f"Rebuilt {count} schedule entries")
+
+
+def rebuild_analytics(args):
+    from crud import analytics as crud_analytics
+
+    with SessionLocal() as db:
+        count = crud_analytics.rebuild_analytics(db)
+    print(f"Rebuilt {count} analytics rollup rows")
+
+
+def import_file(args):
+    from crud import importer as crud_importer
+
+    with SessionLocal() as db, open(args.path, newline="", encoding="utf-8") as stream:
+        report = crud_importer.import_csv(
+            db, args.kind, stream, chunk_size=args.chunk_size, use_copy=args.copy
+        )
+    print(f"Loaded {report.rows_loaded}/{report.rows_read} rows, {report.error_count} errors")
+    for error in report.errors:
+        print(f"  line {error['line']}: {error['error']}")
+
+
+def purge_idempotency(args):
+    from idempotency import idempotency_store
+
+    if idempotency_store is None:
+        print("Idempotency keys are disabled")
+        return
+    print(f"Purged {idempotency_store.purge()} expired idempotency keys")
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(prog="manage.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schema = commands.add_parser(
+        "migrate",
+        help="Create missing tables and indexes; run once per deployment, before the workers start"
+    )
+    schema.set_defaults(func=migrate)
+
+    rebuild = commands.add_parser(
+        "rebuild-availability",
+        help="Recompute per-showtime sold/capacity counters from the tickets table"
+    )
+    rebuild.set_defaults(func=rebuild_availability)
+
+    schedule = commands.add_parser(
+        "rebuild-schedule",
+        help="Recreate the day/location schedule buckets from showtimes and plays"
+    )
+    schedule.set_defaults(func=rebuild_schedule)
+
+    analytics = commands.add_parser(
+        "rebuild-analytics",
+        help="Recompute the play, location and daily sales rollups from the tickets table"
+    )
+    analytics.set_defaults(func=rebuild_analytics)
+
+    load = commands.add_parser("import", help="Stream a CSV file into plays, customers or showtimes")
+    load.add_argument("kind", choices=("plays", "customers", "showtimes"))
+    load.add_argument("path")
+    load.add_argument("--chunk-size", type=int, default=5000)
+    load.add_argument("--copy", action="store_true", help="Use PostgreSQL COPY via a staging table")
+    load.set_defaults(func=import_file)
+
+    purge = commands.add_parser(
+        "purge-idempotency",
+        help="Delete expired Idempotency-Key responses (IDEMPOTENCY_BACKEND=db)"
+    )
+    purge.set_defaults(func=purge_idempotency)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(bind=Engine) -> Iterator[QueryCounter]:
+    """
+    Record every statement executed on ``bind`` (an Engine, or the Engine
+    class for all engines) by the current thread while the block runs.
+    """
+    counter = QueryCounter()
+    thread = threading.get_ident()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == thread:
+            counter.statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(limit: int, bind=Engine) -> Iterator[QueryCounter]:
+    """Fail when the block emits more than ``limit`` SQL statements, e.g. an N+1 regression."""
+    with count_queries(bind) as counter:
+        yield counter
+    if counter.count > limit:
+        listing = "\n".join(f"  {i + 1}. {sql}" for i, sql in enumerate(counter.statements))
+        raise AssertionError(f"Expected at most {limit} statements, got {counter.count}:\n{listing}")
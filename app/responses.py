@@ -0,0 +1,33 @@
+import datetime
+import decimal
+import json
+from typing import Any
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional, FastJSONResponse falls back to the json module
+    orjson = None
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Encodes plain dicts/lists straight to JSON bytes (orjson when installed).
+
+    Meant for payloads that are already in response shape, such as the row
+    dicts from crud.keyset.paginate_rows(); nothing is validated on the way
+    out, so callers must select exactly the columns of the documented model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
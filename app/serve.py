@@ -0,0 +1,188 @@
+"""Production launcher: migrate once, then fork N workers on one socket.
+
+    python app/serve.py --workers 4 --host 0.0.0.0 --port 8000
+
+The master applies the schema once (manage.py migrate does the same on its
+own; pass --skip-migrate when a deploy step already ran it), imports the app
+and binds the listening socket, and only then forks. Workers inherit the
+imported modules copy-on-write instead of re-importing every router, get
+fresh database pools after the fork (see database._after_fork_in_child),
+and run their own lifespan: pool and cache warm-up, then the hold sweeper.
+More than one worker needs the shared cache and idempotency backends (redis
+and db); serve.py refuses to start several with the per-process ones, and
+unless --workers or WEB_WORKERS asks for more it starts a single worker
+while they are configured.
+Each one reports ready on /readyz. The master restarts workers that die and
+passes SIGTERM on for a graceful stop; Ctrl-C reaches the whole process
+group by itself. POSIX only (os.fork).
+"""
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "app"), os.path.join(ROOT, "routers")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+import config
+
+logger = logging.getLogger("serve")
+
+# A worker that dies sooner than this after its start is restarted with a
+# delay, so a broken deploy does not turn into a fork loop.
+MIN_WORKER_LIFETIME_SECONDS = 1.0
+
+# Backends whose state lives in one process. With several workers each would
+# keep its own copy: a write invalidates the catalog cache of one worker only,
+# and a retried Idempotency-Key that lands on another worker runs again.
+PER_PROCESS_BACKENDS = {
+    "CACHE_BACKEND": ("local", "shared"),
+    "IDEMPOTENCY_BACKEND": ("memory",),
+}
+
+
+def per_process_backends() -> list:
+    """The ``NAME=value`` settings that select a per-process backend."""
+    return [
+        f"{name}={getattr(config, name)}"
+        for name, backends in PER_PROCESS_BACKENDS.items()
+        if getattr(config, name) in backends
+    ]
+
+
+def default_workers() -> int:
+    """WEB_WORKERS, else one per CPU; a single worker while a per-process backend is configured."""
+    if config.WEB_WORKERS:
+        return config.WEB_WORKERS
+    if per_process_backends():
+        return 1
+    return os.cpu_count() or 1
+
+
+def migrate() -> None:
+    from database import engine, init_db
+
+    start = time.perf_counter()
+    init_db()
+    # Nothing pooled may survive into the children.
+    engine.dispose()
+    logger.info(f"Schema applied in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def bind(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app, sock: socket.socket, args) -> None:
+    import uvicorn
+
+    # The master's supervising handlers do not apply here; uvicorn installs its own.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    server = uvicorn.Server(uvicorn.Config(
+        app,
+        lifespan="on",
+        log_level=args.log_level,
+        access_log=False,
+        timeout_graceful_shutdown=args.graceful_timeout
+    ))
+    server.run(sockets=[sock])
+
+
+def spawn(app, sock: socket.socket, args) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    code = 0
+    try:
+        run_worker(app, sock, args)
+    except BaseException:
+        logger.exception("Worker crashed")
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="serve.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="Default: WEB_WORKERS, else one per CPU")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--graceful-timeout", type=int, default=30)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--skip-migrate", action="store_true", help="The schema was already applied out of band")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper())
+    if args.workers is None:
+        args.workers = default_workers()
+        if args.workers == 1 and not config.WEB_WORKERS and per_process_backends():
+            logger.info(
+                f"Starting a single worker: {', '.join(per_process_backends())} is per process; "
+                "use CACHE_BACKEND=redis and IDEMPOTENCY_BACKEND=db for more"
+            )
+    if args.workers > 1 and per_process_backends():
+        parser.error(
+            f"{', '.join(per_process_backends())} cannot be shared between workers; "
+            "run several workers with CACHE_BACKEND=redis (or none) and IDEMPOTENCY_BACKEND=db (or none)"
+        )
+
+    if not args.skip_migrate:
+        migrate()
+    # Workers never touch the schema; that happened once, above.
+    config.DB_CREATE_ON_STARTUP = False
+
+    start = time.perf_counter()
+    from main import app
+    logger.info(f"App imported in {(time.perf_counter() - start) * 1000:.0f} ms ({app.state.db_mode} mode)")
+
+    sock = bind(args.host, args.port, args.backlog)
+    workers = {}
+    for _ in range(max(1, args.workers)):
+        workers[spawn(app, sock, args)] = time.monotonic()
+    logger.info(f"Serving on {args.host}:{args.port} with {len(workers)} workers")
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        if signum == signal.SIGTERM:
+            for pid in workers:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = workers.pop(pid, None)
+        if stopping or started is None:
+            continue
+        logger.warning(f"Worker {pid} exited with status {status}; restarting")
+        if time.monotonic() - started < MIN_WORKER_LIFETIME_SECONDS:
+            time.sleep(MIN_WORKER_LIFETIME_SECONDS)
+        workers[spawn(app, sock, args)] = time.monotonic()
+    sock.close()
+    logger.info("All workers stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+import config
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def sweep_once() -> int:
+    """
+    Expire holds batch by batch until a partial batch shows the backlog is
+    gone. Holds that fail to expire are skipped for the rest of this sweep
+    and retried by the next one.
+    """
+    from crud import holds as crud_holds
+
+    total = 0
+    skipped = set()
+    with SessionLocal() as db:
+        while True:
+            failed_before = len(skipped)
+            expired = crud_holds.expire_holds(db, config.HOLD_SWEEP_BATCH_SIZE, skipped)
+            total += expired
+            if expired + len(skipped) - failed_before < config.HOLD_SWEEP_BATCH_SIZE:
+                return total
+
+
+def fold_once() -> int:
+    """Fold pending sales deltas into the analytics rollups until none are left."""
+    from crud import analytics as crud_analytics
+
+    total = 0
+    with SessionLocal() as db:
+        while True:
+            folded = crud_analytics.fold_deltas(db, config.ANALYTICS_FOLD_BATCH_SIZE)
+            total += folded
+            if folded < config.ANALYTICS_FOLD_BATCH_SIZE:
+                return total
+
+
+async def _every(name: str, interval: float, job, stop: asyncio.Event) -> None:
+    logger.info(f"{name} started (every {interval}s)")
+    while not stop.is_set():
+        try:
+            # Blocking DB work stays off the event loop.
+            await asyncio.to_thread(job)
+        except Exception:
+            logger.exception(f"{name} failed")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info(f"{name} stopped")
+
+
+async def run_sweeper(stop: asyncio.Event) -> None:
+    await _every("Hold sweeper", config.HOLD_SWEEP_INTERVAL_SECONDS, sweep_once, stop)
+
+
+async def run_analytics_folder(stop: asyncio.Event) -> None:
+    await _every("Analytics folder", config.ANALYTICS_FOLD_INTERVAL_SECONDS, fold_once, stop)
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import time
+import config
+from database import SessionLocal, engine, get_async_engine
+
+logger = logging.getLogger(__name__)
+
+
+def warm_pool(connections: int) -> int:
+    """
+    Open ``connections`` pooled connections at once and hand them back, so the
+    first requests of a fresh worker do not pay for TCP/TLS/auth handshakes.
+    Capped at DB_POOL_SIZE: overflow connections would be closed on return.
+    """
+    opened = []
+    try:
+        for _ in range(max(0, min(connections, config.DB_POOL_SIZE))):
+            conn = engine.connect()
+            opened.append(conn)
+            conn.exec_driver_sql("SELECT 1")
+    finally:
+        for conn in opened:
+            conn.close()
+    return len(opened)
+
+
+async def warm_async_pool(connections: int) -> int:
+    """warm_pool() for the async engine; every connection opened so far is returned even if a later one fails."""
+    async_engine = get_async_engine()
+    opened = []
+    try:
+        for _ in range(max(0, min(connections, config.DB_POOL_SIZE))):
+            conn = await async_engine.connect()
+            opened.append(conn)
+            await conn.exec_driver_sql("SELECT 1")
+    finally:
+        for conn in opened:
+            await conn.close()
+    return len(opened)
+
+
+def warm_caches() -> None:
+    """Load the default first page of each catalog list through the read-through cache."""
+    from crud import actors as crud_actors
+    from crud import directors as crud_directors
+    from crud import play as crud_play
+
+    with SessionLocal() as db:
+        if config.FAST_LIST_RESPONSES:
+            crud_play.get_play_rows(db)
+        else:
+            crud_play.get_plays(db)
+        crud_play.get_play_versions(db)
+        crud_actors.get_actors(db)
+        crud_directors.get_directors(db)
+
+
+async def warm_up(db_mode: str) -> float:
+    """Pool and cache warm-up for one worker; returns the seconds it took."""
+    start = time.perf_counter()
+    if db_mode == "async":
+        await warm_async_pool(config.WARMUP_CONNECTIONS)
+    else:
+        await asyncio.to_thread(warm_pool, config.WARMUP_CONNECTIONS)
+    if config.CACHE_BACKEND != "none":
+        await asyncio.to_thread(warm_caches)
+    elapsed = time.perf_counter() - start
+    logger.info(f"Worker warmed up in {elapsed * 1000:.0f} ms")
+    return elapsed
@@ -0,0 +1,86 @@
+"""Analytics query latency vs ticket volume: rollup tables against live joins.
+
+    python benchmarks/bench_analytics.py --steps 10000,100000,1000000
+"""
+import argparse
+import datetime
+import statistics
+import time
+
+from common import make_session_factory, report, seed_catalog
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", default="10000,100000,1000000")
+    args = parser.parse_args()
+    steps = [int(step) for step in args.steps.split(",")]
+
+    from sqlalchemy import func, insert
+    from models import Play, Showtime, Ticket
+    from crud import analytics as crud_analytics
+
+    engine, SessionLocal = make_session_factory()
+    first_day = datetime.date(2026, 1, 1)
+    rows = []
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(db, plays=200, showtimes_per_play=20, customers=1)
+        issued = 0
+        for target in steps:
+            for start in range(issued, target, 50_000):
+                db.execute(insert(Ticket), [
+                    {
+                        "customer_id": customer_ids[0],
+                        "showtime_id": showtime_ids[i % len(showtime_ids)],
+                        "seat_number": f"S{i}",
+                        "created_at": datetime.datetime(2026, 1, 1) + datetime.timedelta(minutes=i % (60 * 24 * 90)),
+                    }
+                    for i in range(start, min(start + 50_000, target))
+                ])
+            db.commit()
+            issued = target
+            crud_analytics.rebuild_analytics(db)
+
+            cases = (
+                (
+                    "top plays",
+                    lambda: crud_analytics.top_plays(db, 10),
+                    lambda: db.query(Play.id, Play.title, func.count(Ticket.id).label("sold"))
+                    .join(Showtime, Showtime.play_id == Play.id)
+                    .join(Ticket, Ticket.showtime_id == Showtime.id)
+                    .group_by(Play.id, Play.title)
+                    .order_by(func.count(Ticket.id).desc())
+                    .limit(10).all(),
+                ),
+                (
+                    "occupancy by location",
+                    lambda: crud_analytics.occupancy_by_location(db),
+                    lambda: db.query(Showtime.location, func.count(Ticket.id))
+                    .join(Ticket, Ticket.showtime_id == Showtime.id)
+                    .group_by(Showtime.location).all(),
+                ),
+                (
+                    "daily sales, 90 days",
+                    lambda: crud_analytics.daily_sales(db, first_day, first_day + datetime.timedelta(days=89)),
+                    lambda: db.query(func.date(Ticket.created_at), func.count(Ticket.id))
+                    .group_by(func.date(Ticket.created_at)).all(),
+                ),
+            )
+            for label, rollup, live in cases:
+                rows.append((f"{target:>10,} tickets: {label}, rollup (ms)", f"{median_ms(rollup):.2f}"))
+                rows.append((f"{target:>10,} tickets: {label}, live join (ms)", f"{median_ms(live):.2f}"))
+
+    report(f"Analytics query cost ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
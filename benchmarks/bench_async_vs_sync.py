@@ -0,0 +1,66 @@
+"""Latency/throughput of the sync and async router stacks under load.
+
+Drives the ASGI app in-process with ``--concurrency`` simultaneous clients,
+so a saturated threadpool in sync mode shows up directly in the numbers.
+
+    BENCH_DATABASE_URL=postgresql://... python benchmarks/bench_async_vs_sync.py
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from common import bench_url, make_session_factory, percentile, report, seed_catalog
+
+
+async def drive(app, paths, concurrency: int, requests: int):
+    import httpx
+
+    latencies = []
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(random.choice(paths))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            while not queue.empty():
+                path = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    url = bench_url()
+    os.environ["DATABASE_URL"] = url
+    _, SessionLocal = make_session_factory(url)
+    with SessionLocal() as db:
+        play_ids, showtime_ids, _ = seed_catalog(db)
+
+    from main import create_app
+
+    paths = [f"/plays/{i}" for i in play_ids] + [f"/showtimes/{i}" for i in showtime_ids]
+    for mode in ("sync", "async"):
+        latencies, elapsed = asyncio.run(drive(create_app(mode), paths, args.concurrency, args.requests))
+        report(f"{mode} routers, {args.concurrency} concurrent clients", [
+            ("requests/sec", f"{args.requests / elapsed:,.0f}"),
+            ("p50 latency (ms)", f"{percentile(latencies, 50) * 1000:.2f}"),
+            ("p95 latency (ms)", f"{percentile(latencies, 95) * 1000:.2f}"),
+            ("p99 latency (ms)", f"{percentile(latencies, 99) * 1000:.2f}"),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Availability lookup latency vs ticket volume: counter table against COUNT(*).
+
+    python benchmarks/bench_availability.py --steps 10000,100000,1000000
+"""
+import argparse
+import statistics
+import time
+
+from common import make_session_factory, report, seed_catalog
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", default="10000,100000,1000000")
+    args = parser.parse_args()
+    steps = [int(step) for step in args.steps.split(",")]
+
+    from sqlalchemy import func, insert
+    from models import Showtime, Ticket
+    from crud import availability as crud_availability
+
+    engine, SessionLocal = make_session_factory()
+    rows = []
+    with SessionLocal() as db:
+        play_ids, showtime_ids, customer_ids = seed_catalog(db, plays=10, showtimes_per_play=20, customers=1)
+        play_id = play_ids[0]
+        issued = 0
+        for target in steps:
+            for start in range(issued, target, 50_000):
+                db.execute(insert(Ticket), [
+                    {"customer_id": customer_ids[0], "showtime_id": showtime_ids[i % len(showtime_ids)], "seat_number": f"S{i}"}
+                    for i in range(start, min(start + 50_000, target))
+                ])
+            db.commit()
+            issued = target
+            crud_availability.rebuild_availability(db)
+
+            counter_ms = median_ms(lambda: crud_availability.get_availability(db, play_id))
+            count_ms = median_ms(lambda: db.query(Showtime.id, func.count(Ticket.id))
+                                 .outerjoin(Ticket, Ticket.showtime_id == Showtime.id)
+                                 .filter(Showtime.play_id == play_id)
+                                 .group_by(Showtime.id).all())
+            rows.append((f"{target:>10,} tickets: counter table (ms)", f"{counter_ms:.2f}"))
+            rows.append((f"{target:>10,} tickets: COUNT(*) per showtime (ms)", f"{count_ms:.2f}"))
+
+    report(f"GET /showtimes/availability cost ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
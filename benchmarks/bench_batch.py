@@ -0,0 +1,114 @@
+"""Round-trip savings of POST /<resource>/batch over one GET per item.
+
+Drives the ASGI app in-process: ``--ids`` single GETs against one batch
+request for the same IDs, per resource, with statement counts.
+
+    python benchmarks/bench_batch.py --ids 50
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+from common import bench_url, make_session_factory, report, seed_catalog
+
+
+async def measure(client, fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+class StatementCounter:
+    """Counts statements from every thread; sync routes run in the threadpool."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __enter__(self):
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        event.listen(Engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        event.remove(Engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+async def run(app, resources, ids_per_request: int, repeat: int):
+    import httpx
+
+    rows = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for name, all_ids in resources:
+            ids = random.sample(all_ids, min(ids_per_request, len(all_ids)))
+
+            async def one_by_one():
+                for i in ids:
+                    (await client.get(f"/{name}/{i}")).raise_for_status()
+
+            async def batched():
+                (await client.post(f"/{name}/batch", json={"ids": ids})).raise_for_status()
+
+            with StatementCounter() as single_queries:
+                await one_by_one()
+            with StatementCounter() as batch_queries:
+                await batched()
+            single_ms = await measure(client, one_by_one, repeat)
+            batch_ms = await measure(client, batched, repeat)
+            rows.append((f"{name}: {len(ids)} GETs (ms / statements)", f"{single_ms:.2f} / {single_queries.count}"))
+            rows.append((f"{name}: 1 batch (ms / statements)", f"{batch_ms:.2f} / {batch_queries.count}  ({single_ms / batch_ms:.1f}x)"))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ids", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--mode", choices=("sync", "async"), default="sync")
+    args = parser.parse_args()
+
+    url = bench_url()
+    os.environ["DATABASE_URL"] = url
+    os.environ.setdefault("CACHE_BACKEND", "none")
+    engine, SessionLocal = make_session_factory(url)
+    with SessionLocal() as db:
+        from sqlalchemy import insert
+        from models import Actor, Ticket
+
+        play_ids, showtime_ids, customer_ids = seed_catalog(db, plays=100, showtimes_per_play=10, customers=1000)
+        db.execute(insert(Actor), [{"name": f"Actor {i}", "bio": "bio"} for i in range(1000)])
+        db.execute(insert(Ticket), [
+            {"customer_id": customer_ids[i % len(customer_ids)], "showtime_id": showtime_ids[i % len(showtime_ids)], "seat_number": f"S{i}"}
+            for i in range(5000)
+        ])
+        db.commit()
+        actor_ids = [row.id for row in db.query(Actor.id)]
+        ticket_ids = [row.id for row in db.query(Ticket.id)]
+
+    from main import create_app
+
+    resources = [
+        ("actors", actor_ids),
+        ("showtimes", showtime_ids),
+        ("customers", customer_ids),
+        ("tickets", ticket_ids),
+    ]
+    rows = asyncio.run(run(create_app(args.mode), resources, args.ids, args.repeat))
+    report(f"Batch reads, {args.ids} ids ({engine.dialect.name}, {args.mode}; catalog cache off)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Rows/sec for bulk ticket issuance vs one create_ticket call per seat.
+
+    python benchmarks/bench_bulk_tickets.py --tickets 500
+"""
+import argparse
+
+from common import make_session_factory, report, seed_catalog, timed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickets", type=int, default=500)
+    args = parser.parse_args()
+
+    from crud import tickets as crud_tickets
+    from schemas import TicketCreate
+
+    engine, SessionLocal = make_session_factory()
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(db, plays=1, showtimes_per_play=2, customers=1)
+
+    single = [
+        TicketCreate(customer_id=customer_ids[0], showtime_id=showtime_ids[0], seat_number=f"S{i}")
+        for i in range(args.tickets)
+    ]
+    bulk = [
+        TicketCreate(customer_id=customer_ids[0], showtime_id=showtime_ids[1], seat_number=f"S{i}")
+        for i in range(args.tickets)
+    ]
+
+    def one_by_one():
+        with SessionLocal() as db:
+            for ticket in single:
+                crud_tickets.create_ticket(db, ticket)
+
+    def batched():
+        with SessionLocal() as db:
+            return crud_tickets.create_tickets_bulk(db, bulk)
+
+    _, single_s = timed(one_by_one)
+    ids, bulk_s = timed(batched)
+    assert len(ids) == args.tickets
+
+    report(f"{args.tickets} tickets ({engine.dialect.name})", [
+        ("single-ticket path rows/sec", f"{args.tickets / single_s:,.0f}"),
+        ("bulk path rows/sec", f"{args.tickets / bulk_s:,.0f}"),
+        ("speedup", f"{single_s / bulk_s:.1f}x"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Statement counts for ticket/showtime pages with and without ?expand.
+
+Fails (AssertionError) if an expanded page needs more than a fixed number of
+statements, whatever the page size.
+
+    python benchmarks/bench_eager_loading.py --rows 100
+"""
+import argparse
+
+from common import make_session_factory, report, seed_catalog
+
+
+def touch_tickets(tickets):
+    for ticket in tickets:
+        if ticket.showtime is not None:
+            ticket.showtime.play
+        ticket.customer
+
+
+def touch_showtimes(showtimes):
+    for showtime in showtimes:
+        showtime.play
+        list(showtime.tickets)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert
+    from models import Showtime, Ticket
+    from crud import showtime as crud_showtime
+    from crud import tickets as crud_tickets
+    from querycount import assert_max_queries, count_queries
+
+    engine, SessionLocal = make_session_factory()
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(db, plays=args.rows, showtimes_per_play=1, customers=args.rows)
+        db.execute(insert(Ticket), [
+            {"customer_id": customer_ids[i], "showtime_id": showtime_ids[i], "seat_number": "A1"}
+            for i in range(args.rows)
+        ])
+        db.commit()
+
+    rows = []
+    with SessionLocal() as db:
+        with count_queries(engine) as lazy:
+            touch_tickets(db.query(Ticket).order_by(Ticket.id).limit(args.rows).all())
+        rows.append((f"tickets, lazy loading ({args.rows} rows)", lazy.count))
+
+    with SessionLocal() as db:
+        with assert_max_queries(1, engine) as eager:
+            tickets, _ = crud_tickets.get_tickets(db, limit=args.rows, expand="showtime.play,customer")
+            touch_tickets(tickets)
+        rows.append(("tickets, expand=showtime.play,customer", eager.count))
+
+    with SessionLocal() as db:
+        with count_queries(engine) as lazy:
+            touch_showtimes(db.query(Showtime).order_by(Showtime.id).limit(args.rows).all())
+        rows.append((f"showtimes, lazy loading ({args.rows} rows)", lazy.count))
+
+    with SessionLocal() as db:
+        with assert_max_queries(2, engine) as eager:
+            showtimes, _ = crud_showtime.get_showtimes(db, limit=args.rows, expand="play,tickets")
+            touch_showtimes(showtimes)
+        rows.append(("showtimes, expand=play,tickets", eager.count))
+
+    report(f"SQL statements per page ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Rows/sec and peak RSS of the streaming ticket export.
+
+Peak RSS should stay flat as --rows grows; run with increasing sizes.
+
+    python benchmarks/bench_export.py --rows 1000000 --format csv
+"""
+import argparse
+import resource
+import sys
+import time
+
+from common import make_session_factory, report, seed_catalog
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    args = parser.parse_args()
+
+    from sqlalchemy import insert
+    from models import Ticket
+    from crud import exports as crud_exports
+
+    engine, SessionLocal = make_session_factory()
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(db, customers=1)
+        for start in range(0, args.rows, 50_000):
+            db.execute(insert(Ticket), [
+                {"customer_id": customer_ids[0], "showtime_id": showtime_ids[i % len(showtime_ids)], "seat_number": f"S{i}"}
+                for i in range(start, min(start + 50_000, args.rows))
+            ])
+        db.commit()
+
+    rss_before = peak_rss_mb()
+    encode = crud_exports.csv_lines if args.format == "csv" else crud_exports.ndjson_lines
+    written = 0
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        rows = crud_exports.stream_rows(db, crud_exports.ticket_export_query())
+        for chunk in encode(rows, crud_exports.TICKET_COLUMNS):
+            written += len(chunk)
+    elapsed = time.perf_counter() - start
+
+    report(f"{args.rows:,} tickets as {args.format} ({engine.dialect.name})", [
+        ("rows/sec", f"{args.rows / elapsed:,.0f}"),
+        ("output (MB)", f"{written / 1e6:.1f}"),
+        ("peak RSS before export (MB)", f"{rss_before:.1f}"),
+        ("peak RSS after export (MB)", f"{peak_rss_mb():.1f}"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Query plans and latencies for filtered showtime and ticket listings.
+
+    python benchmarks/bench_filters.py --showtimes 100000 --tickets 2000000
+"""
+import argparse
+import datetime
+import random
+import statistics
+import time
+
+from common import make_session_factory, report, seed_catalog
+
+
+def explain(db, query) -> str:
+    from sqlalchemy import text
+
+    compiled = query.statement.compile(db.bind, compile_kwargs={"literal_binds": True})
+    if db.bind.dialect.name == "sqlite":
+        rows = db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).fetchall()
+        return "; ".join(row[-1] for row in rows)
+    rows = db.execute(text(f"EXPLAIN ANALYZE {compiled}")).fetchall()
+    return "\n    ".join(row[0] for row in rows)
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--plays", type=int, default=1000)
+    parser.add_argument("--showtimes", type=int, default=100_000)
+    parser.add_argument("--tickets", type=int, default=2_000_000)
+    parser.add_argument("--customers", type=int, default=100_000)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert
+    from models import Showtime, Ticket
+    from crud import showtime as crud_showtime
+    from crud import tickets as crud_tickets
+
+    engine, SessionLocal = make_session_factory()
+    start = datetime.datetime(2026, 1, 1, 19, 30)
+    with SessionLocal() as db:
+        play_ids, _, customer_ids = seed_catalog(
+            db, plays=args.plays, showtimes_per_play=0, customers=args.customers
+        )
+        db.execute(insert(Showtime), [
+            {
+                "play_id": random.choice(play_ids),
+                "show_date": start + datetime.timedelta(hours=random.randrange(24 * 365)),
+                "location": f"Hall {i % 20}",
+            }
+            for i in range(args.showtimes)
+        ])
+        showtime_ids = [row.id for row in db.query(Showtime.id)]
+        for offset in range(0, args.tickets, 50_000):
+            db.execute(insert(Ticket), [
+                {
+                    "customer_id": random.choice(customer_ids),
+                    "showtime_id": showtime_ids[i % len(showtime_ids)],
+                    "seat_number": f"S{i // len(showtime_ids)}",
+                }
+                for i in range(offset, min(offset + 50_000, args.tickets))
+            ])
+        db.commit()
+
+    rows = []
+    with SessionLocal() as db:
+        window_from = start + datetime.timedelta(days=30)
+        window_to = window_from + datetime.timedelta(days=7)
+        cases = [
+            (
+                "showtimes by play + date window",
+                crud_showtime.filter_showtimes(db.query(Showtime), play_ids[0], window_from, window_to),
+                lambda: crud_showtime.get_showtimes(db, play_id=play_ids[0], start_time_from=window_from, start_time_to=window_to),
+            ),
+            (
+                "tickets by showtime",
+                crud_tickets.filter_tickets(db.query(Ticket), showtime_id=showtime_ids[0]),
+                lambda: crud_tickets.get_tickets(db, showtime_id=showtime_ids[0]),
+            ),
+            (
+                "tickets by customer",
+                crud_tickets.filter_tickets(db.query(Ticket), customer_id=customer_ids[0]),
+                lambda: crud_tickets.get_tickets(db, customer_id=customer_ids[0]),
+            ),
+        ]
+        for label, query, run in cases:
+            rows.append((f"{label} (ms)", f"{median_ms(run):.2f}"))
+            print(f"\n{label} plan:\n    {explain(db, query)}")
+
+    report(f"{args.showtimes:,} showtimes / {args.tickets:,} tickets ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
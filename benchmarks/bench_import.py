@@ -0,0 +1,59 @@
+"""Customer CSV import throughput: multi-row upsert (and COPY on Postgres) vs create_customer.
+
+    python benchmarks/bench_import.py --rows 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from common import make_session_factory, report
+
+
+def write_csv(path: str, rows: int, duplicate_every: int = 10) -> None:
+    with open(path, "w", newline="") as f:
+        f.write("name,email\n")
+        for i in range(rows):
+            # Every tenth row repeats an earlier email to exercise the upsert.
+            n = i - 1 if duplicate_every and i % duplicate_every == 0 and i else i
+            f.write(f"Customer {i},customer{n}@example.com\n")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--baseline-rows", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    from crud import customers as crud_customers
+    from crud import importer as crud_importer
+    from schemas import CustomerCreate
+
+    engine, SessionLocal = make_session_factory()
+    path = os.path.join(tempfile.mkdtemp(prefix="cinema-import-"), "customers.csv")
+    write_csv(path, args.rows)
+
+    rows = []
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        for i in range(args.baseline_rows):
+            crud_customers.create_customer(db, CustomerCreate(name=f"Baseline {i}", email=f"baseline{i}@example.com"))
+        rows.append(("create_customer per row (rows/sec)", f"{args.baseline_rows / (time.perf_counter() - start):,.0f}"))
+
+    modes = [("multi-row upsert", False)]
+    if engine.dialect.name == "postgresql":
+        modes.append(("COPY + upsert", True))
+    for label, use_copy in modes:
+        with SessionLocal() as db, open(path, newline="") as stream:
+            start = time.perf_counter()
+            result = crud_importer.import_csv(db, "customers", stream, chunk_size=args.chunk_size, use_copy=use_copy)
+            elapsed = time.perf_counter() - start
+        rows.append((f"{label} (rows/sec)", f"{result.rows_read / elapsed:,.0f}"))
+        rows.append((f"{label} errors", result.error_count))
+
+    report(f"{args.rows:,} customer rows ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
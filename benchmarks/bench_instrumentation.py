@@ -0,0 +1,67 @@
+"""Per-statement overhead of the SQL instrumentation hooks.
+
+    python benchmarks/bench_instrumentation.py --statements 20000
+"""
+import argparse
+import statistics
+import time
+
+from common import make_session_factory, report, seed_catalog
+
+
+def run(SessionLocal, play_ids, statements: int) -> float:
+    from models import Play
+
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        for i in range(statements):
+            db.query(Play.id, Play.title).filter(Play.id == play_ids[i % len(play_ids)]).first()
+        return (time.perf_counter() - start) / statements
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--statements", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import instrumentation
+
+    engine, SessionLocal = make_session_factory()
+    with SessionLocal() as db:
+        play_ids, _, _ = seed_catalog(db, plays=100, showtimes_per_play=0, customers=0)
+
+    def median_us(setup):
+        samples = []
+        for _ in range(args.repeat):
+            token = setup()
+            try:
+                samples.append(run(SessionLocal, play_ids, args.statements))
+            finally:
+                if token is not None:
+                    instrumentation._current.reset(token)
+        return statistics.median(samples) * 1e6
+
+    instrumentation.uninstall_sql_hooks()
+    baseline = median_us(lambda: None)
+    instrumentation.install_sql_hooks()
+    idle = median_us(lambda: None)
+    in_request = median_us(lambda: instrumentation._current.set(instrumentation.RequestStats()))
+    instrumentation.uninstall_sql_hooks()
+
+    shape = "SELECT plays.id, plays.title FROM plays WHERE plays.id = 42 AND plays.title IN ('a', 'b', 'c')"
+    start = time.perf_counter()
+    for _ in range(args.statements):
+        instrumentation.fingerprint(shape)
+    fingerprint_us = (time.perf_counter() - start) / args.statements * 1e6
+
+    report(f"Instrumentation overhead per statement ({engine.dialect.name})", [
+        ("no hooks (us/statement)", f"{baseline:.1f}"),
+        ("hooks, outside a request (us/statement)", f"{idle:.1f}  (+{idle - baseline:.1f})"),
+        ("hooks, inside a request (us/statement)", f"{in_request:.1f}  (+{in_request - baseline:.1f})"),
+        ("fingerprint, slow queries only (us)", f"{fingerprint_us:.1f}"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""CPU time of list pages: ORM objects + response-model validation vs column rows + FastJSONResponse.
+
+    python benchmarks/bench_list_serialization.py --tickets 200000 --limits 100 500
+"""
+import argparse
+import datetime
+import time
+from typing import List, Optional
+
+from common import make_session_factory, report, seed_catalog
+
+
+def cpu_ms(fn, repeat: int) -> float:
+    fn()
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickets", type=int, default=200_000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    from pydantic import BaseModel, ConfigDict
+    from sqlalchemy import insert
+    from models import Ticket
+    from crud import tickets as crud_tickets
+    from crud import customers as crud_customers
+    from responses import FastJSONResponse
+
+    # Stand-ins for the response models the routers declare.
+    class TicketOut(BaseModel):
+        model_config = ConfigDict(from_attributes=True)
+        id: int
+        customer_id: Optional[int] = None
+        showtime_id: Optional[int] = None
+        seat_number: Optional[str] = None
+
+    class CustomerOut(BaseModel):
+        model_config = ConfigDict(from_attributes=True)
+        id: int
+        name: str
+        email: Optional[str] = None
+
+    class TicketPage(BaseModel):
+        items: List[TicketOut]
+        next_cursor: Optional[str] = None
+
+    class CustomerPage(BaseModel):
+        items: List[CustomerOut]
+        next_cursor: Optional[str] = None
+
+    engine, SessionLocal = make_session_factory()
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(db, plays=100, showtimes_per_play=100, customers=10_000)
+        db.execute(insert(Ticket), [
+            {
+                "customer_id": customer_ids[i % len(customer_ids)],
+                "showtime_id": showtime_ids[i % len(showtime_ids)],
+                "seat_number": f"S{i // len(showtime_ids)}",
+            }
+            for i in range(args.tickets)
+        ])
+        db.commit()
+
+    rows = []
+    with SessionLocal() as db:
+        cases = (
+            ("tickets", crud_tickets.get_tickets, crud_tickets.get_ticket_rows, TicketPage),
+            ("customers", crud_customers.get_customers, crud_customers.get_customer_rows, CustomerPage),
+        )
+        for name, orm_page, row_page, page_model in cases:
+            for limit in args.limits:
+                def orm_path():
+                    items, next_cursor = orm_page(db, limit=limit)
+                    body = page_model(items=items, next_cursor=next_cursor).model_dump_json().encode()
+                    db.expunge_all()
+                    return body
+
+                def fast_path():
+                    items, next_cursor = row_page(db, limit=limit)
+                    return FastJSONResponse({"items": items, "next_cursor": next_cursor}).body
+
+                orm = cpu_ms(orm_path, args.repeat)
+                fast = cpu_ms(fast_path, args.repeat)
+                rows.append((f"{name} limit={limit} ORM + model (ms cpu)", f"{orm:.3f}"))
+                rows.append((f"{name} limit={limit} rows + fast JSON (ms cpu)", f"{fast:.3f}  ({orm / fast:.1f}x)"))
+
+    report(f"List serialization CPU time ({engine.dialect.name}, {datetime.date.today()})", rows)
+
+
+if __name__ == "__main__":
+    main()
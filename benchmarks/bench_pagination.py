@@ -0,0 +1,68 @@
+"""Page latency at page 1 vs deep pages: OFFSET/LIMIT against keyset cursors.
+
+    python benchmarks/bench_pagination.py --rows 1000000 --page-size 100
+"""
+import argparse
+import statistics
+import time
+
+from common import make_session_factory, report, seed_catalog
+
+
+def seed_tickets(db, showtime_ids, customer_id, rows: int, batch: int = 50000):
+    from sqlalchemy import insert
+    from models import Ticket
+
+    for start in range(0, rows, batch):
+        db.execute(insert(Ticket), [
+            {"customer_id": customer_id, "showtime_id": showtime_ids[i % len(showtime_ids)], "seat_number": f"T{i}"}
+            for i in range(start, min(start + batch, rows))
+        ])
+    db.commit()
+
+
+def median_ms(fn, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    from models import Ticket
+    from crud import tickets as crud_tickets
+    from crud.keyset import encode_cursor
+
+    engine, SessionLocal = make_session_factory()
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(db, customers=1)
+        seed_tickets(db, showtime_ids, customer_ids[0], args.rows)
+
+    deep_page = args.rows // args.page_size - 1
+    rows = []
+    with SessionLocal() as db:
+        # Cursor for the deep page is taken from the row just before it, as a
+        # client walking the pages would have received it.
+        boundary_id = db.query(Ticket.id).order_by(Ticket.id).offset(deep_page * args.page_size - 1).limit(1).scalar()
+        deep_cursor = encode_cursor([boundary_id])
+
+        for label, page, cursor in (("page 1", 0, None), (f"page {deep_page + 1:,}", deep_page, deep_cursor)):
+            offset_ms = median_ms(
+                lambda: db.query(Ticket).order_by(Ticket.id).offset(page * args.page_size).limit(args.page_size).all()
+            )
+            keyset_ms = median_ms(lambda: crud_tickets.get_tickets(db, cursor=cursor, limit=args.page_size))
+            rows.append((f"{label}: OFFSET (ms)", f"{offset_ms:.2f}"))
+            rows.append((f"{label}: keyset (ms)", f"{keyset_ms:.2f}"))
+
+    report(f"{args.rows:,} tickets, {args.page_size} per page ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Day-grid and week-grid latency across all venues from the schedule buckets.
+
+    python benchmarks/bench_schedule.py --showtimes 500000 --venues 50
+"""
+import argparse
+import datetime
+import random
+import statistics
+import time
+
+from common import make_session_factory, report, seed_catalog
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--showtimes", type=int, default=500_000)
+    parser.add_argument("--venues", type=int, default=50)
+    parser.add_argument("--days", type=int, default=3 * 365)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert
+    from models import Showtime
+    from crud import schedule as crud_schedule
+
+    engine, SessionLocal = make_session_factory()
+    first = datetime.datetime(2026, 1, 1)
+    with SessionLocal() as db:
+        play_ids, _, _ = seed_catalog(db, plays=500, showtimes_per_play=0, customers=0)
+        for start in range(0, args.showtimes, 50_000):
+            db.execute(insert(Showtime), [
+                {
+                    "play_id": random.choice(play_ids),
+                    "show_date": first + datetime.timedelta(minutes=30 * random.randrange(args.days * 48)),
+                    "location": f"Venue {random.randrange(args.venues)}",
+                }
+                for _ in range(start, min(start + 50_000, args.showtimes))
+            ])
+        db.commit()
+        crud_schedule.rebuild_schedule(db)
+
+    day = (first + datetime.timedelta(days=args.days // 2)).date()
+    with SessionLocal() as db:
+        rows = [
+            ("day grid, all venues (ms)", f"{median_ms(lambda: crud_schedule.get_grid(db, day, 1)):.2f}"),
+            ("week grid, all venues (ms)", f"{median_ms(lambda: crud_schedule.get_grid(db, day, 7)):.2f}"),
+            ("week grid, one venue (ms)", f"{median_ms(lambda: crud_schedule.get_grid(db, day, 7, 'Venue 0')):.2f}"),
+            ("venue between two times (ms)", f"{median_ms(lambda: crud_schedule.get_between(db, 'Venue 0', datetime.datetime.combine(day, datetime.time(18)), datetime.datetime.combine(day, datetime.time(23)))):.2f}"),
+        ]
+
+    report(f"{args.showtimes:,} showtimes over {args.venues} venues ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
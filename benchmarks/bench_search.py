@@ -0,0 +1,67 @@
+"""/search latency against the current ILIKE scan.
+
+Needs PostgreSQL for the indexed path (pg_trgm is created automatically):
+
+    BENCH_DATABASE_URL=postgresql://... python benchmarks/bench_search.py --rows 200000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from common import make_session_factory, report
+
+WORDS = (
+    "night dream midsummer king queen lear hamlet tempest storm winter tale merchant venice "
+    "comedy errors twelfth much ado nothing glass menagerie streetcar desire death salesman "
+    "crucible godot waiting importance earnest doll house seagull cherry orchard"
+).split()
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert, or_, text
+    from models import Actor, Director, Play
+    from crud import search as crud_search
+
+    engine, SessionLocal = make_session_factory()
+    rng = random.Random(7)
+    with SessionLocal() as db:
+        for model, key, body in ((Play, "title", "description"), (Actor, "name", "bio"), (Director, "name", "bio")):
+            for start in range(0, args.rows, 50_000):
+                db.execute(insert(model), [
+                    {key: f"{' '.join(rng.sample(WORDS, 3)).title()} {i}", body: " ".join(rng.choices(WORDS, k=30))}
+                    for i in range(start, min(start + 50_000, args.rows))
+                ])
+        db.commit()
+        if engine.dialect.name == "postgresql":
+            db.execute(text("ANALYZE"))
+
+    rows = []
+    with SessionLocal() as db:
+        for term in ("hamlet", "hamlat", "midsummer dream"):
+            ilike_ms = median_ms(lambda: db.query(Play).filter(or_(
+                Play.title.ilike(f"%{term}%"), Play.description.ilike(f"%{term}%")
+            )).limit(20).all())
+            search_ms = median_ms(lambda: crud_search.search(db, term, limit=20))
+            hits = len(crud_search.search(db, term, limit=20))
+            rows.append((f"'{term}': ILIKE scan, plays only (ms)", f"{ilike_ms:.2f}"))
+            rows.append((f"'{term}': /search, all types (ms)", f"{search_ms:.2f} ({hits} hits)"))
+
+    report(f"{args.rows:,} rows per table ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
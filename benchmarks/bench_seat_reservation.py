@@ -0,0 +1,69 @@
+"""Opening-night load: N concurrent buyers holding seats on one showtime.
+
+    python benchmarks/bench_seat_reservation.py --buyers 10000 --threads 64
+"""
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common import make_session_factory, percentile, report, seed_catalog
+
+from fastapi import HTTPException
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--buyers", type=int, default=10000)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--seats-per-row", type=int, default=100)
+    args = parser.parse_args()
+
+    from crud import holds as crud_holds
+    from crud import seats as crud_seats
+
+    engine, SessionLocal = make_session_factory(pool_size=args.threads, max_overflow=0)
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(db, plays=1, showtimes_per_play=1, customers=1)
+        showtime_id, customer_id = showtime_ids[0], customer_ids[0]
+        crud_seats.create_seat_inventory(db, showtime_id, args.rows, args.seats_per_row)
+
+    layout = crud_seats.SeatMap(args.rows, args.seats_per_row)
+    wanted = [layout.label(random.randrange(layout.capacity)) for _ in range(args.buyers)]
+    latencies = []
+    outcomes = {"granted": 0, "conflict": 0, "busy": 0}
+
+    def buy(seat):
+        start = time.perf_counter()
+        with SessionLocal() as db:
+            try:
+                crud_holds.create_hold(db, customer_id, showtime_id, [seat])
+                outcome = "granted"
+            except HTTPException as e:
+                outcome = "conflict" if e.status_code == 409 else "busy"
+        latencies.append(time.perf_counter() - start)
+        return outcome
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        for outcome in pool.map(buy, wanted):
+            outcomes[outcome] += 1
+    elapsed = time.perf_counter() - start
+
+    with SessionLocal() as db:
+        inventory = crud_seats.get_seat_inventory(db, showtime_id)
+        reserved = crud_seats.SeatMap(inventory.rows, inventory.seats_per_row, inventory.reserved).count()
+
+    assert reserved == outcomes["granted"], "double-granted seats detected"
+    report(f"{args.buyers} buyers / {args.threads} threads on one showtime ({engine.dialect.name})", [
+        ("requests/sec", f"{args.buyers / elapsed:,.0f}"),
+        ("granted / conflict / busy", f"{outcomes['granted']} / {outcomes['conflict']} / {outcomes['busy']}"),
+        ("p50 latency (ms)", f"{percentile(latencies, 50) * 1000:.2f}"),
+        ("p99 latency (ms)", f"{percentile(latencies, 99) * 1000:.2f}"),
+        ("seats reserved in bitmap", reserved),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Time to first response and to readiness of a multi-worker launch.
+
+Starts the API as a subprocess in each launch mode and polls it:
+  * first response: the first 200 from /healthz,
+  * all ready: /readyz answered 200 from every worker pid,
+  * first /plays/: latency of the first catalog request once ready.
+
+Modes: app/serve.py (migrate once, preloaded app, forked workers) against
+``uvicorn --workers`` (spawned workers, each importing the app and running
+create_all on boot). Several workers need shared cache and idempotency
+backends; unless set otherwise both run with "none" here.
+
+    python benchmarks/bench_startup.py --workers 4
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from common import ROOT, bench_url, make_session_factory, report, seed_catalog
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get(url: str):
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except OSError:
+        return None, b""
+
+
+def launch(name: str, command, env, port: int, workers: int, timeout: float) -> list:
+    base = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    first_response = all_ready = None
+    ready_pids = set()
+    try:
+        while time.perf_counter() - start < timeout:
+            if first_response is None and get(f"{base}/healthz")[0] == 200:
+                first_response = time.perf_counter() - start
+            status, body = get(f"{base}/readyz")
+            if status == 200:
+                ready_pids.add(json.loads(body)["pid"])
+                if len(ready_pids) >= workers:
+                    all_ready = time.perf_counter() - start
+                    break
+            else:
+                time.sleep(0.005)
+        request_start = time.perf_counter()
+        status, _ = get(f"{base}/plays/")
+        first_plays = time.perf_counter() - request_start if status == 200 else None
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def ms(value):
+        return "timed out" if value is None else f"{value * 1000:.0f} ms"
+
+    return [
+        (f"{name}: first response", ms(first_response)),
+        (f"{name}: all {workers} ready", ms(all_ready)),
+        (f"{name}: first /plays/", "failed" if first_plays is None else f"{first_plays * 1000:.1f} ms"),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    url = bench_url()
+    engine, SessionLocal = make_session_factory(url)
+    with SessionLocal() as db:
+        seed_catalog(db, plays=200, showtimes_per_play=10, customers=100)
+    engine.dispose()
+
+    env = dict(os.environ)
+    env["DATABASE_URL"] = url
+    env["PYTHONPATH"] = os.pathsep.join([ROOT, os.path.join(ROOT, "app"), os.path.join(ROOT, "routers")])
+    env.setdefault("HOLD_SWEEPER_ENABLED", "false")
+    env.setdefault("CACHE_BACKEND", "none")
+    env.setdefault("IDEMPOTENCY_BACKEND", "none")
+
+    rows = []
+    port = free_port()
+    rows += launch(
+        "serve.py (fork)",
+        [sys.executable, os.path.join("app", "serve.py"), "--workers", str(args.workers), "--port", str(port), "--log-level", "warning"],
+        env, port, args.workers, args.timeout
+    )
+    port = free_port()
+    rows += launch(
+        "uvicorn --workers (spawn)",
+        [sys.executable, "-m", "uvicorn", "main:app", "--workers", str(args.workers), "--port", str(port), "--log-level", "warning"],
+        dict(env, DB_CREATE_ON_STARTUP="true"), port, args.workers, args.timeout
+    )
+    report(f"Startup, {args.workers} workers ({engine.dialect.name})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Round-trips of single-statement writes against load-modify-refresh.
+
+Times partial updates and deletes through the crud layer, which issues one
+``UPDATE ... RETURNING`` / ``DELETE ... RETURNING`` per write, against the
+previous ORM pattern (SELECT, setattr, commit, refresh SELECT), and counts
+the statements each one sends.
+
+    python benchmarks/bench_writes.py --ops 500
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import event
+
+from common import make_session_factory, report, seed_catalog
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+def run(engine, SessionLocal, fn, ids) -> tuple:
+    samples = []
+    with StatementCounter(engine) as counter:
+        for i, pk in enumerate(ids):
+            with SessionLocal() as db:
+                start = time.perf_counter()
+                fn(db, pk, i)
+                samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, counter.count / len(ids)
+
+
+def legacy_update(model, values):
+    def update(db, pk, i):
+        obj = db.query(model).filter(model.id == pk).first()
+        for field, value in values(i).items():
+            setattr(obj, field, value)
+        db.commit()
+        db.refresh(obj)
+    return update
+
+
+def legacy_delete(model):
+    def remove(db, pk, i):
+        db.delete(db.query(model).filter(model.id == pk).first())
+        db.commit()
+    return remove
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=500)
+    args = parser.parse_args()
+
+    from sqlalchemy import insert
+    from models import Customer, Ticket
+    from schemas import CustomerUpdate, TicketUpdate
+    from crud import customers as crud_customers
+    from crud import tickets as crud_tickets
+
+    engine, SessionLocal = make_session_factory()
+    with SessionLocal() as db:
+        _, showtime_ids, customer_ids = seed_catalog(
+            db, plays=20, showtimes_per_play=10, customers=args.ops * 4
+        )
+        db.execute(insert(Ticket), [
+            {"customer_id": customer_ids[i], "showtime_id": showtime_ids[i % len(showtime_ids)], "seat_number": f"S{i}"}
+            for i in range(args.ops)
+        ])
+        db.commit()
+        ticket_ids = [row.id for row in db.query(Ticket.id)]
+
+    ops = args.ops
+    updated, deleted = customer_ids[:ops], customer_ids[ops:]
+    cases = [
+        (
+            "customer update",
+            legacy_update(Customer, lambda i: {"name": f"Legacy {i}"}),
+            lambda db, pk, i: crud_customers.update_customer(db, pk, CustomerUpdate(name=f"Renamed {i}")),
+            updated, updated,
+        ),
+        (
+            "ticket update",
+            legacy_update(Ticket, lambda i: {"customer_id": customer_ids[-1 - i]}),
+            lambda db, pk, i: crud_tickets.update_ticket(db, pk, TicketUpdate(customer_id=customer_ids[i])),
+            ticket_ids, ticket_ids,
+        ),
+        (
+            "customer delete",
+            legacy_delete(Customer),
+            lambda db, pk, i: crud_customers.delete_customer(db, pk),
+            deleted[:len(deleted) // 2], deleted[len(deleted) // 2:],
+        ),
+    ]
+
+    rows = []
+    for name, legacy, current, legacy_ids, current_ids in cases:
+        legacy_ms, legacy_statements = run(engine, SessionLocal, legacy, legacy_ids)
+        current_ms, current_statements = run(engine, SessionLocal, current, current_ids)
+        rows.append((f"{name}: load-modify-refresh", f"{legacy_ms:.3f} ms, {legacy_statements:.1f} statements"))
+        rows.append((f"{name}: single statement", f"{current_ms:.3f} ms, {current_statements:.1f} statements"))
+    report(f"Writes, {ops} ops each ({engine.dialect.name}; median per op)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against ``BENCH_DATABASE_URL`` (a local Postgres gives the
+numbers that matter); by default they fall back to a throwaway SQLite file so
+they can run anywhere.
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "app"), os.path.join(ROOT, "routers")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+
+def bench_url() -> str:
+    url = os.getenv("BENCH_DATABASE_URL")
+    if url:
+        return url
+    return "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="cinema-bench-"), "bench.db")
+
+
+def make_session_factory(url: str = None, **engine_kwargs):
+    """Create a fresh schema and return ``(engine, SessionLocal)``."""
+    from database import Base
+    import models  # noqa: F401  (registers the tables on Base.metadata)
+
+    url = url or bench_url()
+    if url.startswith("sqlite"):
+        engine_kwargs.setdefault("connect_args", {"check_same_thread": False, "timeout": 60})
+    engine = create_engine(url, **engine_kwargs)
+    if url.startswith("sqlite"):
+        @event.listens_for(engine, "connect")
+        def _sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def seed_catalog(db, plays: int = 10, showtimes_per_play: int = 10, customers: int = 100):
+    """Insert a small catalog and return ``(play_ids, showtime_ids, customer_ids)``."""
+    import datetime
+    from models import Customer, Play, Showtime
+
+    play_rows = [Play(title=f"Play {i}", description=f"Description {i}", duration_minutes=120) for i in range(plays)]
+    db.add_all(play_rows)
+    db.flush()
+    start = datetime.datetime(2026, 1, 1, 19, 30)
+    showtime_rows = [
+        Showtime(play_id=play.id, show_date=start + datetime.timedelta(days=n), location=f"Hall {n % 4}")
+        for play in play_rows
+        for n in range(showtimes_per_play)
+    ]
+    db.add_all(showtime_rows)
+    customer_rows = [Customer(name=f"Customer {i}", email=f"customer{i}@example.com") for i in range(customers)]
+    db.add_all(customer_rows)
+    db.commit()
+    return (
+        [p.id for p in play_rows],
+        [s.id for s in showtime_rows],
+        [c.id for c in customer_rows],
+    )
+
+
+def percentile(samples, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def report(title: str, rows):
+    print(f"\n{title}")
+    print("-" * len(title))
+    for label, value in rows:
+        print(f"  {label:<40} {value}")
@@ -0,0 +1,429 @@
+"""Load-test every router in-process and diff the results against a baseline.
+
+Seeds ``BENCH_DATABASE_URL`` (SQLite by default) with a catalog and
+``--tickets`` tickets, then drives each scenario below through an in-process
+ASGI client with ``--concurrency`` simultaneous clients, once per ``--mode``
+(sync scenarios keep their plain names, async ones are prefixed "async.").
+Every run writes a JSON result file; pass an earlier one as ``--baseline`` to
+flag regressions.
+
+    BENCH_DATABASE_URL=postgresql://... python benchmarks/suite.py \\
+        --tickets 2000000 --output bench-results.json
+    python benchmarks/suite.py --baseline bench-baseline.json --output bench-results.json
+    python benchmarks/suite.py --only tickets --requests 500
+"""
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+from typing import Callable, NamedTuple, Optional
+
+from common import bench_url, make_session_factory, percentile, report, seed_catalog
+
+
+# Layout of the showtimes that get a seat map, for the seat and hold
+# scenarios. Every seat is taken at most once per run.
+SEAT_ROWS = 20
+SEATS_PER_ROW = 250
+
+# Scenarios that use up seats (reserve, hold, and the holds prepared for
+# confirm and release), for sizing the seated showtimes.
+SEAT_SCENARIOS = 6
+
+
+class Dataset:
+    def __init__(self, play_ids, showtime_ids, customer_ids, actor_ids, director_ids, ticket_ids, seated_ids):
+        self.play_ids = play_ids
+        self.showtime_ids = showtime_ids
+        self.customer_ids = customer_ids
+        self.actor_ids = actor_ids
+        self.director_ids = director_ids
+        self.ticket_ids = ticket_ids
+        self.seated_ids = seated_ids
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    path: Callable[[], str]
+    body: Optional[Callable[[], dict]] = None
+    # Called untimed with the number of requests about to run (warm-up
+    # included), for scenarios that use rows up: deletes, confirms, releases.
+    prepare: Optional[Callable[[int], None]] = None
+
+
+def seed(SessionLocal, args) -> Dataset:
+    from sqlalchemy import insert
+    from models import Actor, Director, Showtime, Ticket
+    from crud import availability as crud_availability
+    from crud import schedule as crud_schedule
+    from crud import seats as crud_seats
+
+    start = datetime.datetime(2026, 1, 1, 19, 30)
+    with SessionLocal() as db:
+        play_ids, _, customer_ids = seed_catalog(
+            db, plays=args.plays, showtimes_per_play=0, customers=args.customers
+        )
+        db.execute(insert(Actor), [{"name": f"Actor {i}", "bio": f"Bio {i}"} for i in range(args.people)])
+        db.execute(insert(Director), [{"name": f"Director {i}", "bio": f"Bio {i}"} for i in range(args.people)])
+        db.execute(insert(Showtime), [
+            {
+                "play_id": play_ids[i % len(play_ids)],
+                "show_date": start + datetime.timedelta(hours=random.randrange(24 * 365)),
+                "location": f"Hall {i % 20}",
+            }
+            for i in range(args.showtimes)
+        ])
+        showtime_ids = [row.id for row in db.query(Showtime.id)]
+        seats_needed = SEAT_SCENARIOS * (args.requests + args.warmup) * len(args.mode)
+        seated_ids = list(db.execute(insert(Showtime).returning(Showtime.id), [
+            {"play_id": play_ids[i % len(play_ids)], "show_date": start, "location": "Seated hall"}
+            for i in range(-(-seats_needed // (SEAT_ROWS * SEATS_PER_ROW)))
+        ]).scalars())
+        for offset in range(0, args.tickets, 50_000):
+            db.execute(insert(Ticket), [
+                {
+                    "customer_id": random.choice(customer_ids),
+                    "showtime_id": showtime_ids[i % len(showtime_ids)],
+                    "seat_number": f"S{i // len(showtime_ids)}",
+                }
+                for i in range(offset, min(offset + 50_000, args.tickets))
+            ])
+        db.commit()
+        actor_ids = [row.id for row in db.query(Actor.id)]
+        director_ids = [row.id for row in db.query(Director.id)]
+        ticket_ids = [row.id for row in db.query(Ticket.id).limit(100_000)]
+        crud_availability.rebuild_availability(db)
+        crud_schedule.rebuild_schedule(db)
+        for showtime_id in seated_ids:
+            crud_seats.create_seat_inventory(db, showtime_id, SEAT_ROWS, SEATS_PER_ROW)
+    return Dataset(play_ids, showtime_ids, customer_ids, actor_ids, director_ids, ticket_ids, seated_ids)
+
+
+def scenarios(data: Dataset, SessionLocal):
+    """Every route worth timing; the path and body factories are called once per request."""
+    from sqlalchemy import insert
+    from models import Actor, Customer, Director, Showtime
+    from schemas import TicketCreate
+    from crud import holds as crud_holds
+    from crud import seats as crud_seats
+    from crud import tickets as crud_tickets
+
+    serial = itertools.count()
+    pick = random.choice
+    seat_numbers = (
+        (showtime_id, crud_seats.SeatMap(SEAT_ROWS, SEATS_PER_ROW).label(index))
+        for index in range(SEAT_ROWS * SEATS_PER_ROW)
+        for showtime_id in data.seated_ids
+    )
+    # Rows a scenario uses up, filled by its prepare step.
+    pools = {name: deque() for name in ("actors", "directors", "customers", "showtimes", "tickets")}
+    holds = {name: deque() for name in ("holds.confirm", "holds.release", "seats.confirm", "seats.release")}
+
+    def insert_rows(model, pool, rows):
+        with SessionLocal() as db:
+            pools[pool].extend(db.execute(insert(model).returning(model.id), rows).scalars())
+            db.commit()
+
+    def prepare_deletes(name, model, row):
+        return lambda count: insert_rows(model, name, [row(next(serial)) for _ in range(count)])
+
+    def prepare_tickets(count):
+        with SessionLocal() as db:
+            for offset in range(0, count, crud_tickets.MAX_BULK_TICKETS):
+                pools["tickets"].extend(crud_tickets.create_tickets_bulk(db, [
+                    TicketCreate(**ticket_body("D"))
+                    for _ in range(min(crud_tickets.MAX_BULK_TICKETS, count - offset))
+                ]))
+
+    def prepare_holds(name):
+        def prepare(count):
+            with SessionLocal() as db:
+                for _ in range(count):
+                    showtime_id, seat = next(seat_numbers)
+                    customer_id = pick(data.customer_ids)
+                    hold = crud_holds.create_hold(db, customer_id, showtime_id, [seat])
+                    holds[name].append((showtime_id, {
+                        "customer_id": customer_id,
+                        "hold_token": hold["hold_token"],
+                        "ticket_ids": hold["ticket_ids"],
+                    }))
+        return prepare
+
+    def ticket_body(prefix="B"):
+        # Seats outside the seeded "S<n>" range, so creates never collide.
+        return {
+            "customer_id": pick(data.customer_ids),
+            "showtime_id": pick(data.showtime_ids),
+            "seat_number": f"{prefix}{next(serial)}",
+        }
+
+    def hold_body():
+        showtime_id, seat = next(seat_numbers)
+        return {"customer_id": pick(data.customer_ids), "showtime_id": showtime_id, "seats": [seat]}
+
+    def seat_request():
+        # The path and the body of a seat map request have to agree on the showtime.
+        showtime_id, seat = next(seat_numbers)
+        pending.append({"customer_id": pick(data.customer_ids), "seats": [seat]})
+        return f"/showtimes/{showtime_id}/seats/reserve"
+
+    def held_request(name, path):
+        def request():
+            showtime_id, body = holds[name].popleft()
+            pending.append(body)
+            return path.format(showtime_id=showtime_id)
+        return request
+
+    # drive() calls the path factory first, so a body queued here is the one
+    # for the same request.
+    pending = deque()
+
+    def batch_body(ids):
+        return lambda: {"ids": random.sample(ids, min(20, len(ids)))}
+
+    def show_date():
+        return (datetime.datetime(2026, 1, 1, 19, 30) + datetime.timedelta(hours=random.randrange(24 * 365))).isoformat()
+
+    # Plays have no PUT or DELETE routes.
+    return [
+        Scenario("actors.list", "GET", lambda: "/actors/?limit=50"),
+        Scenario("actors.get", "GET", lambda: f"/actors/{pick(data.actor_ids)}"),
+        Scenario("actors.batch", "POST", lambda: "/actors/batch", batch_body(data.actor_ids)),
+        Scenario("actors.create", "POST", lambda: "/actors/", lambda: {"name": f"Bench actor {next(serial)}", "bio": "bench"}),
+        Scenario("actors.update", "PUT", lambda: f"/actors/{pick(data.actor_ids)}", lambda: {"bio": f"Bio {next(serial)}"}),
+        Scenario(
+            "actors.delete", "DELETE", lambda: f"/actors/{pools['actors'].popleft()}", None,
+            prepare_deletes("actors", Actor, lambda n: {"name": f"Doomed actor {n}"})
+        ),
+        Scenario("directors.list", "GET", lambda: "/directors/?limit=50"),
+        Scenario("directors.get", "GET", lambda: f"/directors/{pick(data.director_ids)}"),
+        Scenario("directors.batch", "POST", lambda: "/directors/batch", batch_body(data.director_ids)),
+        Scenario("directors.create", "POST", lambda: "/directors/", lambda: {"name": f"Bench director {next(serial)}", "bio": "bench"}),
+        Scenario("directors.update", "PUT", lambda: f"/directors/{pick(data.director_ids)}", lambda: {"bio": f"Bio {next(serial)}"}),
+        Scenario(
+            "directors.delete", "DELETE", lambda: f"/directors/{pools['directors'].popleft()}", None,
+            prepare_deletes("directors", Director, lambda n: {"name": f"Doomed director {n}"})
+        ),
+        Scenario("customers.list", "GET", lambda: "/customers/?limit=50"),
+        Scenario("customers.get", "GET", lambda: f"/customers/{pick(data.customer_ids)}"),
+        Scenario("customers.batch", "POST", lambda: "/customers/batch", batch_body(data.customer_ids)),
+        Scenario("customers.create", "POST", lambda: "/customers/", lambda: {
+            "name": "Bench customer",
+            "email": f"bench{next(serial)}@example.com",
+        }),
+        Scenario("customers.update", "PUT", lambda: f"/customers/{pick(data.customer_ids)}", lambda: {"name": f"Renamed {next(serial)}"}),
+        Scenario(
+            "customers.delete", "DELETE", lambda: f"/customers/{pools['customers'].popleft()}", None,
+            prepare_deletes("customers", Customer, lambda n: {"name": "Doomed customer", "email": f"doomed{n}@example.com"})
+        ),
+        Scenario("plays.list", "GET", lambda: "/plays/?limit=50"),
+        Scenario("plays.get", "GET", lambda: f"/plays/{pick(data.play_ids)}"),
+        Scenario("plays.batch", "POST", lambda: "/plays/batch", batch_body(data.play_ids)),
+        Scenario("plays.create", "POST", lambda: "/plays/", lambda: {"title": f"Bench play {next(serial)}", "duration_minutes": 120}),
+        Scenario("showtimes.list", "GET", lambda: "/showtimes/?limit=50"),
+        Scenario("showtimes.list_by_play", "GET", lambda: f"/showtimes/?play_id={pick(data.play_ids)}&limit=50&expand=play"),
+        Scenario("showtimes.get", "GET", lambda: f"/showtimes/{pick(data.showtime_ids)}"),
+        Scenario("showtimes.batch", "POST", lambda: "/showtimes/batch", batch_body(data.showtime_ids)),
+        Scenario("showtimes.availability", "GET", lambda: f"/showtimes/availability?play_id={pick(data.play_ids)}"),
+        Scenario("showtimes.create", "POST", lambda: "/showtimes/", lambda: {
+            "play_id": pick(data.play_ids),
+            "show_date": show_date(),
+            "location": "Bench hall",
+        }),
+        Scenario("showtimes.update", "PUT", lambda: f"/showtimes/{pick(data.showtime_ids)}", lambda: {"location": f"Hall {next(serial) % 20}"}),
+        Scenario(
+            "showtimes.delete", "DELETE", lambda: f"/showtimes/{pools['showtimes'].popleft()}", None,
+            prepare_deletes("showtimes", Showtime, lambda n: {
+                "play_id": data.play_ids[n % len(data.play_ids)],
+                "show_date": datetime.datetime(2027, 1, 1, 19, 30),
+                "location": "Doomed hall",
+            })
+        ),
+        Scenario("seats.map", "GET", lambda: f"/showtimes/{pick(data.seated_ids)}/seats"),
+        Scenario("seats.reserve", "POST", seat_request, pending.popleft),
+        Scenario(
+            "seats.confirm", "POST", held_request("seats.confirm", "/showtimes/{showtime_id}/seats/confirm"),
+            pending.popleft, prepare_holds("seats.confirm")
+        ),
+        Scenario(
+            "seats.release", "POST", held_request("seats.release", "/showtimes/{showtime_id}/seats/release"),
+            pending.popleft, prepare_holds("seats.release")
+        ),
+        Scenario("holds.create", "POST", lambda: "/holds/", hold_body),
+        Scenario(
+            "holds.confirm", "POST", held_request("holds.confirm", "/holds/confirm"),
+            pending.popleft, prepare_holds("holds.confirm")
+        ),
+        Scenario(
+            "holds.release", "POST", held_request("holds.release", "/holds/release"),
+            pending.popleft, prepare_holds("holds.release")
+        ),
+        Scenario("tickets.list_by_showtime", "GET", lambda: f"/tickets/?showtime_id={pick(data.showtime_ids)}&limit=100"),
+        Scenario("tickets.list_by_customer", "GET", lambda: f"/tickets/?customer_id={pick(data.customer_ids)}&limit=100"),
+        Scenario("tickets.get", "GET", lambda: f"/tickets/{pick(data.ticket_ids)}"),
+        Scenario("tickets.batch", "POST", lambda: "/tickets/batch", batch_body(data.ticket_ids)),
+        Scenario("tickets.create", "POST", lambda: "/tickets/", ticket_body),
+        Scenario("tickets.bulk", "POST", lambda: "/tickets/bulk", lambda: {"tickets": [ticket_body("K") for _ in range(10)]}),
+        Scenario("tickets.update", "PUT", lambda: f"/tickets/{pick(data.ticket_ids)}", lambda: {"customer_id": pick(data.customer_ids)}),
+        Scenario(
+            "tickets.delete", "DELETE", lambda: f"/tickets/{pools['tickets'].popleft()}", None, prepare_tickets
+        ),
+        Scenario("exports.tickets", "GET", lambda: f"/exports/tickets?showtime_id={pick(data.showtime_ids)}"),
+        Scenario("exports.customers", "GET", lambda: f"/exports/customers?play_id={pick(data.play_ids)}&format=csv"),
+    ]
+
+
+async def drive(client, method, path_factory, body_factory, concurrency: int, requests: int):
+    latencies, errors = [], 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            path = path_factory()
+            body = body_factory() if body_factory else None
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def run_suite(app, suite, args, prefix: str = ""):
+    import httpx
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for scenario in suite:
+            if args.only and not any(scenario.name.startswith(only) for only in args.only):
+                continue
+            if scenario.prepare:
+                scenario.prepare(args.warmup + args.requests)
+            # Warm the pool, caches and code paths before measuring.
+            await drive(client, scenario.method, scenario.path, scenario.body, min(args.concurrency, 10), args.warmup)
+            latencies, errors, elapsed = await drive(
+                client, scenario.method, scenario.path, scenario.body, args.concurrency, args.requests
+            )
+            name = prefix + scenario.name
+            results[name] = {
+                "requests": len(latencies),
+                "errors": errors,
+                "rps": round(len(latencies) / elapsed, 1),
+                "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            }
+            print(
+                f"  {name:<34} {results[name]['rps']:>9,.1f} req/s  p95 {results[name]['p95_ms']:.2f} ms"
+                + (f"  {errors} errors" if errors else "")
+            )
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results, baseline, threshold: float):
+    """Report per-scenario deltas; returns the scenarios that regressed beyond ``threshold``."""
+    rows, regressions = [], []
+    for name, current in results.items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            rows.append((name, "new scenario"))
+            continue
+        p95_delta = (current["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] if previous["p95_ms"] else 0.0
+        rps_delta = (current["rps"] - previous["rps"]) / previous["rps"] if previous["rps"] else 0.0
+        regressed = p95_delta > threshold or rps_delta < -threshold or current["errors"] > previous["errors"]
+        if regressed:
+            regressions.append(name)
+        rows.append((name, f"p95 {p95_delta:+.1%}  rps {rps_delta:+.1%}{'  REGRESSION' if regressed else ''}"))
+    report(f"Against baseline {baseline.get('meta', {}).get('revision', '?')} (threshold {threshold:.0%})", rows)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", nargs="+", choices=("sync", "async"), default=["sync", "async"])
+    parser.add_argument("--plays", type=int, default=1000)
+    parser.add_argument("--showtimes", type=int, default=20_000)
+    parser.add_argument("--customers", type=int, default=50_000)
+    parser.add_argument("--people", type=int, default=5000, help="actors and directors each")
+    parser.add_argument("--tickets", type=int, default=1_000_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--only", nargs="*", help="scenario name prefixes, e.g. tickets plays.get")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--baseline", help="earlier result file to diff against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed p95/rps change before failing")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    url = bench_url()
+    os.environ["DATABASE_URL"] = url
+    engine, SessionLocal = make_session_factory(url)
+    start = time.perf_counter()
+    data = seed(SessionLocal, args)
+    print(f"Seeded {args.tickets:,} tickets in {time.perf_counter() - start:.1f}s ({engine.dialect.name})")
+
+    from main import create_app
+
+    # One set for every mode: the serials, seats and prepared rows carry on
+    # from one pass to the next, so nothing is created or used up twice.
+    suite = scenarios(data, SessionLocal)
+    results = {}
+    for mode in args.mode:
+        print(f"{mode} mode")
+        prefix = "" if mode == "sync" else f"{mode}."
+        results.update(asyncio.run(run_suite(create_app(mode), suite, args, prefix)))
+    output = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "dialect": engine.dialect.name,
+            "mode": args.mode,
+            "python": platform.python_version(),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "volumes": {
+                "plays": args.plays,
+                "showtimes": args.showtimes,
+                "customers": args.customers,
+                "people": args.people,
+                "tickets": args.tickets,
+            },
+        },
+        "scenarios": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, sort_keys=True)
+    print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
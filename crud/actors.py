@@ -1,11 +1,19 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
+from typing import List, Optional, Tuple
 from models import Actor
 from schemas import ActorCreate, ActorUpdate
+from crud.keyset import paginate
+from crud import batch as crud_batch
+from crud import catalog_cache
+from crud import versions as crud_versions
 import logging
 
-logger = logging.getLogger(_name_)
+logger = logging.getLogger(__name__)
+
+# Keyset sort order for list pages; must match an index on the table.
+PAGE_KEYS = (Actor.id,)
 
 def create_actor(db: Session, actor: ActorCreate) -> Actor:
     try:
@@ -13,7 +21,8 @@ def create_actor(db: Session, actor: ActorCreate) -> Actor:
         db.add(db_actor)
         db.commit()
         db.refresh(db_actor)
-        logger.info(f"Created actor ID={db_actor.actor_id}")
+        catalog_cache.invalidate(Actor)
+        logger.info(f"Created actor ID={db_actor.id}")
         return db_actor
     except SQLAlchemyError as e:
         db.rollback()
@@ -22,21 +31,37 @@ def create_actor(db: Session, actor: ActorCreate) -> Actor:
 
 
 def get_actor(db: Session, actor_id: int) -> Actor:
-    actor = db.query(Actor).filter(Actor.actor_id == actor_id).first()
+    actor = catalog_cache.get_one(
+        db, Actor, actor_id,
+        lambda: db.query(Actor).filter(Actor.id == actor_id).first()
+    )
     if not actor:
         raise HTTPException(status_code=404, detail="Actor not found")
     return actor
 
 
-def get_actors(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Actor).offset(skip).limit(limit).all()
+def get_actors(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        name: Optional[str] = None
+) -> Tuple[List[Actor], Optional[str]]:
+    query = db.query(Actor)
+    if name:
+        query = query.filter(Actor.name.ilike(f"%{name}%"))
+    return catalog_cache.get_page(
+        db, Actor, (cursor, limit, name),
+        lambda: paginate(query, PAGE_KEYS, cursor, limit)
+    )
 
 
 def update_actor(db: Session, actor_id: int, update_data: ActorUpdate) -> Actor:
     actor = get_actor(db, actor_id)
     for field, value in update_data.model_dump(exclude_unset=True).items():
         setattr(actor, field, value)
+    crud_versions.bump(actor)
     db.commit()
+    catalog_cache.invalidate(Actor, actor_id)
     db.refresh(actor)
     return actor
 
@@ -45,4 +70,13 @@ def delete_actor(db: Session, actor_id: int) -> bool:
     actor = get_actor(db, actor_id)
     db.delete(actor)
     db.commit()
+    catalog_cache.invalidate(Actor, actor_id)
     return True
+
+
+def get_actors_by_ids(db: Session, ids: List[int]) -> Tuple[List[Optional[Actor]], List[int]]:
+    return crud_batch.get_many(db, Actor, ids)
+
+
+def get_actor_version(db: Session, actor_id: int) -> Optional[int]:
+    return crud_versions.get_version(db, Actor, actor_id)
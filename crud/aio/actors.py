@@ -0,0 +1,71 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from typing import List, Optional, Tuple
+from models import Actor
+from schemas import ActorCreate, ActorUpdate
+from crud.keyset import apply_keyset, page_of
+from crud import batch as crud_batch
+from crud.actors import PAGE_KEYS
+from crud import catalog_cache
+from crud import versions as crud_versions
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def create_actor(db: AsyncSession, actor: ActorCreate) -> Actor:
+    try:
+        db_actor = Actor(**actor.model_dump())
+        db.add(db_actor)
+        await db.commit()
+        catalog_cache.invalidate(Actor)
+        logger.info(f"Created actor ID={db_actor.id}")
+        return db_actor
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error creating actor: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def get_actor(db: AsyncSession, actor_id: int) -> Actor:
+    actor = await catalog_cache.get_one_async(db, Actor, actor_id, lambda: db.get(Actor, actor_id))
+    if not actor:
+        raise HTTPException(status_code=404, detail="Actor not found")
+    return actor
+
+
+async def get_actors(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[Actor], Optional[str]]:
+    async def load():
+        result = await db.execute(apply_keyset(select(Actor), PAGE_KEYS, cursor, limit))
+        return page_of(result.scalars().all(), PAGE_KEYS, limit)
+
+    return await catalog_cache.get_page_async(db, Actor, (cursor, limit), load)
+
+
+async def update_actor(db: AsyncSession, actor_id: int, update_data: ActorUpdate) -> Actor:
+    actor = await get_actor(db, actor_id)
+    for field, value in update_data.model_dump(exclude_unset=True).items():
+        setattr(actor, field, value)
+    crud_versions.bump(actor)
+    await db.commit()
+    catalog_cache.invalidate(Actor, actor_id)
+    await db.refresh(actor)
+    return actor
+
+
+async def delete_actor(db: AsyncSession, actor_id: int) -> bool:
+    actor = await get_actor(db, actor_id)
+    await db.delete(actor)
+    await db.commit()
+    catalog_cache.invalidate(Actor, actor_id)
+    return True
+
+
+async def get_actors_by_ids(db: AsyncSession, ids: List[int]) -> Tuple[List[Optional[Actor]], List[int]]:
+    return await db.run_sync(crud_batch.get_many, Actor, ids)
+
+
+async def get_actor_version(db: AsyncSession, actor_id: int) -> Optional[int]:
+    return await crud_versions.get_version_async(db, Actor, actor_id)
@@ -0,0 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from models import Play
+from crud import credits as crud_credits
+
+# The link writes are single set-based statements, so the async routers share
+# the sync implementation through run_sync.
+
+
+async def add_credits(db: AsyncSession, play_id: int, kind: str, ids: List[int]) -> int:
+    return await db.run_sync(crud_credits.add_credits, play_id, kind, ids)
+
+
+async def remove_credits(db: AsyncSession, play_id: int, kind: str, ids: List[int]) -> int:
+    return await db.run_sync(crud_credits.remove_credits, play_id, kind, ids)
+
+
+async def get_credits(db: AsyncSession, play_id: int, kind: str) -> List:
+    return await db.run_sync(crud_credits.get_credits, play_id, kind)
+
+
+async def get_plays_for(
+        db: AsyncSession,
+        kind: str,
+        person_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 100
+) -> Tuple[List[Play], Optional[str]]:
+    return await db.run_sync(crud_credits.get_plays_for, kind, person_id, cursor, limit)
@@ -0,0 +1,62 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from typing import List, Optional, Tuple
+from models import Customer
+from schemas import CustomerCreate, CustomerUpdate
+from crud.keyset import apply_keyset, page_of
+from crud import batch as crud_batch
+from crud.customers import PAGE_KEYS
+from crud import customers as crud_customers
+from crud import bookings as crud_bookings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def create_customer(db: AsyncSession, customer: CustomerCreate) -> Customer:
+    try:
+        db_customer = Customer(**customer.model_dump())
+        db.add(db_customer)
+        await db.commit()
+        logger.info(f"Created customer ID={db_customer.id}")
+        return db_customer
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error creating customer: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def get_customer(db: AsyncSession, customer_id: int) -> Customer:
+    customer = await db.get(Customer, customer_id)
+    if not customer:
+        raise HTTPException(status_code=404, detail="Customer not found")
+    return customer
+
+
+async def get_customers(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[Customer], Optional[str]]:
+    result = await db.execute(apply_keyset(select(Customer), PAGE_KEYS, cursor, limit))
+    return page_of(result.scalars().all(), PAGE_KEYS, limit)
+
+
+async def update_customer(
+        db: AsyncSession,
+        customer_id: int,
+        update_data: CustomerUpdate,
+        expected_version: Optional[int] = None
+) -> Customer:
+    return await db.run_sync(crud_customers.update_customer, customer_id, update_data, expected_version)
+
+
+async def delete_customer(db: AsyncSession, customer_id: int, expected_version: Optional[int] = None) -> bool:
+    return await db.run_sync(crud_customers.delete_customer, customer_id, expected_version)
+
+
+async def get_booking_history(db: AsyncSession, customer_id: int) -> dict:
+    # One indexed query on a miss; shares the per-customer cache with the sync path.
+    return await db.run_sync(crud_bookings.get_booking_history, customer_id)
+
+
+async def get_customers_by_ids(db: AsyncSession, ids: List[int]) -> Tuple[List[Optional[Customer]], List[int]]:
+    return await db.run_sync(crud_batch.get_many, Customer, ids)
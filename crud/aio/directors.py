@@ -0,0 +1,71 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from typing import List, Optional, Tuple
+from models import Director
+from schemas import DirectorCreate, DirectorUpdate
+from crud.keyset import apply_keyset, page_of
+from crud import batch as crud_batch
+from crud.directors import PAGE_KEYS
+from crud import catalog_cache
+from crud import versions as crud_versions
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def create_director(db: AsyncSession, director: DirectorCreate) -> Director:
+    try:
+        db_director = Director(**director.model_dump())
+        db.add(db_director)
+        await db.commit()
+        catalog_cache.invalidate(Director)
+        logger.info(f"Created director ID={db_director.id}")
+        return db_director
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error creating director: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def get_director(db: AsyncSession, director_id: int) -> Director:
+    director = await catalog_cache.get_one_async(db, Director, director_id, lambda: db.get(Director, director_id))
+    if not director:
+        raise HTTPException(status_code=404, detail="Director not found")
+    return director
+
+
+async def get_directors(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[Director], Optional[str]]:
+    async def load():
+        result = await db.execute(apply_keyset(select(Director), PAGE_KEYS, cursor, limit))
+        return page_of(result.scalars().all(), PAGE_KEYS, limit)
+
+    return await catalog_cache.get_page_async(db, Director, (cursor, limit), load)
+
+
+async def update_director(db: AsyncSession, director_id: int, update_data: DirectorUpdate) -> Director:
+    director = await get_director(db, director_id)
+    for field, value in update_data.model_dump(exclude_unset=True).items():
+        setattr(director, field, value)
+    crud_versions.bump(director)
+    await db.commit()
+    catalog_cache.invalidate(Director, director_id)
+    await db.refresh(director)
+    return director
+
+
+async def delete_director(db: AsyncSession, director_id: int) -> bool:
+    director = await get_director(db, director_id)
+    await db.delete(director)
+    await db.commit()
+    catalog_cache.invalidate(Director, director_id)
+    return True
+
+
+async def get_directors_by_ids(db: AsyncSession, ids: List[int]) -> Tuple[List[Optional[Director]], List[int]]:
+    return await db.run_sync(crud_batch.get_many, Director, ids)
+
+
+async def get_director_version(db: AsyncSession, director_id: int) -> Optional[int]:
+    return await crud_versions.get_version_async(db, Director, director_id)
@@ -0,0 +1,108 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+from typing import List, Optional, Tuple
+from models import Play
+from schemas import PlayCreate, PlayUpdate
+from crud.keyset import apply_keyset, page_of
+from crud import batch as crud_batch
+from crud.play import PAGE_KEYS
+from crud import play as crud_play
+from crud import catalog_cache
+from crud import versions as crud_versions
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def create_play(db: AsyncSession, play: PlayCreate) -> Play:
+    try:
+        db_play = Play(
+            title=play.title,
+            genre=play.genre,
+            duration_minutes=play.duration_minutes,
+            description=play.description
+        )
+
+        db.add(db_play)
+        await db.commit()
+        catalog_cache.invalidate(Play)
+
+        logger.info(f"Created new play: ID={db_play.id}, Title={db_play.title}")
+        return db_play
+
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error creating play '{play.title}': {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error occurred"
+        )
+
+
+async def get_play(db: AsyncSession, play_id: int) -> Optional[Play]:
+    try:
+        return await catalog_cache.get_one_async(db, Play, play_id, lambda: db.get(Play, play_id))
+    except SQLAlchemyError as e:
+        logger.error(f"Error fetching play ID {play_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error occurred"
+        )
+
+
+async def get_plays(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        genre: Optional[str] = None
+) -> Tuple[List[Play], Optional[str]]:
+    try:
+        query = select(Play)
+        if genre:
+            query = query.filter(Play.genre.ilike(f"%{genre}%"))
+
+        async def load():
+            result = await db.execute(apply_keyset(query, PAGE_KEYS, cursor, limit))
+            return page_of(result.scalars().all(), PAGE_KEYS, limit)
+
+        return await catalog_cache.get_page_async(db, Play, (cursor, limit, genre, None), load)
+
+    except SQLAlchemyError as e:
+        logger.error(f"Error fetching plays: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error occurred"
+        )
+
+
+async def get_play_versions(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        genre: Optional[str] = None
+) -> Tuple[List[dict], Optional[str]]:
+    return await db.run_sync(crud_play.get_play_versions, cursor, limit, genre)
+
+
+async def update_play(
+        db: AsyncSession,
+        play_id: int,
+        play: PlayUpdate,
+        expected_version: Optional[int] = None
+) -> Play:
+    # Single UPDATE ... RETURNING plus the schedule rename, shared with the sync path.
+    return await db.run_sync(crud_play.update_play, play_id, play, expected_version)
+
+
+async def delete_play(db: AsyncSession, play_id: int, expected_version: Optional[int] = None) -> bool:
+    return await db.run_sync(crud_play.delete_play, play_id, expected_version)
+
+
+async def get_plays_by_ids(db: AsyncSession, ids: List[int]) -> Tuple[List[Optional[Play]], List[int]]:
+    return await db.run_sync(crud_batch.get_many, Play, ids)
+
+
+async def get_play_version(db: AsyncSession, play_id: int) -> Optional[int]:
+    return await crud_versions.get_version_async(db, Play, play_id)
@@ -0,0 +1,51 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Tuple
+from crud import seats as crud_seats
+from crud.seats import MAX_CAS_RETRIES, SeatMap, normalize
+import asyncio
+
+
+async def _swap(
+        db: AsyncSession,
+        showtime_id: int,
+        seats: List[str],
+        mutate,
+        strict: bool = True
+) -> Tuple[SeatMap, SeatMap]:
+    """
+    crud.seats._swap for an AsyncSession: each attempt runs on the session's
+    connection and a lost race backs off with asyncio.sleep, so a contended
+    seat map never blocks the event loop.
+    """
+    for attempt in range(MAX_CAS_RETRIES):
+        result = await db.run_sync(crud_seats.try_swap, showtime_id, seats, mutate, strict)
+        if result is not None:
+            return result
+        await asyncio.sleep(crud_seats.backoff(attempt))
+    raise crud_seats.busy(showtime_id)
+
+
+async def _has_inventory(db: AsyncSession, showtime_id: int) -> bool:
+    return (await db.execute(crud_seats.inventory_probe(showtime_id))).scalar() is not None
+
+
+async def claim_seats(db: AsyncSession, showtime_id: int, seats: List[str]) -> List[str]:
+    """crud.seats.claim_seats for an AsyncSession."""
+    if not await _has_inventory(db, showtime_id):
+        return [normalize(seat) for seat in seats]
+    reserved, _ = await _swap(db, showtime_id, seats, crud_seats._do_sell)
+    return crud_seats.labels_of(reserved, seats)
+
+
+async def unclaim_seats(db: AsyncSession, showtime_id: int, seats: List[str]) -> None:
+    """crud.seats.unclaim_seats for an AsyncSession."""
+    if not await _has_inventory(db, showtime_id):
+        return
+    await _swap(db, showtime_id, seats, crud_seats._do_unsell, strict=False)
+
+
+async def release_held_seats(db: AsyncSession, showtime_id: int, seats: List[str]) -> None:
+    """crud.seats.release_held_seats for an AsyncSession."""
+    if not await _has_inventory(db, showtime_id):
+        return
+    await _swap(db, showtime_id, seats, crud_seats._do_release, strict=False)
@@ -0,0 +1,84 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from typing import List, Optional, Tuple
+from datetime import datetime
+from models import Showtime
+from schemas import ShowtimeCreate, ShowtimeUpdate
+from crud.keyset import apply_keyset, page_of
+from crud import batch as crud_batch
+from crud.showtime import PAGE_KEYS, filter_showtimes
+from crud import showtime as crud_showtime
+from crud.loading import apply_expand, load_expanded
+from crud.availability import availability_query
+from crud import schedule as crud_schedule
+from crud import versions as crud_versions
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def create_showtime(db: AsyncSession, showtime: ShowtimeCreate) -> Showtime:
+    try:
+        db_showtime = Showtime(**showtime.model_dump())
+        db.add(db_showtime)
+        await db.flush()
+        await db.run_sync(crud_schedule.refresh_entries, [db_showtime.id])
+        await db.commit()
+        logger.info(f"Created showtime ID={db_showtime.id}")
+        return db_showtime
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error creating showtime: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def get_showtime(db: AsyncSession, showtime_id: int) -> Showtime:
+    showtime = await db.get(Showtime, showtime_id)
+    if not showtime:
+        raise HTTPException(status_code=404, detail="Showtime not found")
+    return showtime
+
+
+async def get_showtimes(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        play_id: Optional[int] = None,
+        start_time_from: Optional[datetime] = None,
+        start_time_to: Optional[datetime] = None,
+        expand: Optional[str] = None
+) -> Tuple[List[Showtime], Optional[str]]:
+    query = filter_showtimes(select(Showtime), play_id, start_time_from, start_time_to)
+    query = apply_expand(query, Showtime, expand)
+    result = await db.execute(apply_keyset(query, PAGE_KEYS, cursor, limit))
+    showtimes, next_cursor = page_of(result.scalars().all(), PAGE_KEYS, limit)
+    await db.run_sync(load_expanded, Showtime, showtimes, expand)
+    return showtimes, next_cursor
+
+
+async def update_showtime(
+        db: AsyncSession,
+        showtime_id: int,
+        update_data: ShowtimeUpdate,
+        expected_version: Optional[int] = None
+) -> Showtime:
+    return await db.run_sync(crud_showtime.update_showtime, showtime_id, update_data, expected_version)
+
+
+async def delete_showtime(db: AsyncSession, showtime_id: int, expected_version: Optional[int] = None) -> bool:
+    return await db.run_sync(crud_showtime.delete_showtime, showtime_id, expected_version)
+
+
+async def get_availability(db: AsyncSession, play_id: int) -> List:
+    result = await db.execute(availability_query(play_id))
+    return result.all()
+
+
+async def get_showtimes_by_ids(db: AsyncSession, ids: List[int]) -> Tuple[List[Optional[Showtime]], List[int]]:
+    return await db.run_sync(crud_batch.get_many, Showtime, ids)
+
+
+async def get_showtime_version(db: AsyncSession, showtime_id: int) -> Optional[int]:
+    return await crud_versions.get_version_async(db, Showtime, showtime_id)
@@ -0,0 +1,161 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi import HTTPException
+from typing import List, Optional, Tuple
+from models import Ticket
+from schemas import TicketCreate, TicketUpdate
+from crud.keyset import apply_keyset, page_of
+from crud import batch as crud_batch
+from crud.tickets import PAGE_KEYS, filter_tickets
+from crud.aio import seats as crud_seats
+from crud import tickets as crud_tickets
+from crud import availability as crud_availability
+from crud import bookings as crud_bookings
+from crud import versions as crud_versions
+from models import CONFIRMED, HELD
+from crud.seats import normalize
+from crud.loading import apply_expand
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def create_ticket(db: AsyncSession, ticket: TicketCreate) -> Ticket:
+    try:
+        data = ticket.model_dump()
+        labels = await crud_seats.claim_seats(db, data["showtime_id"], [data["seat_number"]])
+        data["seat_number"] = labels[0]
+        db_ticket = Ticket(**data)
+        db.add(db_ticket)
+        await db.run_sync(crud_availability.adjust_sold, data["showtime_id"], 1)
+        crud_bookings.mark_dirty(db, [data["customer_id"]])
+        await db.commit()
+        logger.info(f"Issued ticket ID={db_ticket.id}")
+        return db_ticket
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Seat already ticketed")
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error creating ticket: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def create_tickets_bulk(db: AsyncSession, tickets: List[TicketCreate]) -> List[int]:
+    rows, by_showtime, customer_ids = await db.run_sync(crud_tickets.prepare_bulk, tickets)
+    try:
+        for showtime_id, group in by_showtime.items():
+            labels = await crud_seats.claim_seats(db, showtime_id, [row["seat_number"] for row in group])
+            for row, label in zip(group, labels):
+                row["seat_number"] = label
+        ticket_ids = await db.run_sync(crud_tickets.insert_bulk, rows, by_showtime, customer_ids)
+        await db.commit()
+        logger.info(f"Issued {len(ticket_ids)} tickets in bulk")
+        return ticket_ids
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Seat already ticketed")
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error creating tickets in bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def get_ticket(db: AsyncSession, ticket_id: int) -> Ticket:
+    ticket = await db.get(Ticket, ticket_id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    return ticket
+
+
+async def get_tickets(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        showtime_id: Optional[int] = None,
+        customer_id: Optional[int] = None,
+        expand: Optional[str] = None,
+        ticket_status: Optional[str] = CONFIRMED
+) -> Tuple[List[Ticket], Optional[str]]:
+    query = filter_tickets(select(Ticket), showtime_id, customer_id, ticket_status)
+    query = apply_expand(query, Ticket, expand)
+    result = await db.execute(apply_keyset(query, PAGE_KEYS, cursor, limit))
+    return page_of(result.scalars().all(), PAGE_KEYS, limit)
+
+
+async def update_ticket(
+        db: AsyncSession,
+        ticket_id: int,
+        update_data: TicketUpdate,
+        expected_version: Optional[int] = None
+) -> Ticket:
+    """crud.tickets.update_ticket with the seat map compare-and-swap off the event loop."""
+    try:
+        values = update_data.model_dump(exclude_unset=True)
+        if values.get("seat_number") is not None:
+            values["seat_number"] = normalize(values["seat_number"])
+        ticket = await db.run_sync(
+            crud_versions.update_row, Ticket, ticket_id, values, expected_version,
+            ("showtime_id", "customer_id", "seat_number")
+        )
+        result = crud_versions.as_instance(Ticket, ticket)
+        if ticket.showtime_id != ticket.old_showtime_id or ticket.seat_number != ticket.old_seat_number:
+            if ticket.status == HELD:
+                raise HTTPException(status_code=409, detail="A held ticket cannot be moved; release the hold instead")
+            await crud_seats.unclaim_seats(db, ticket.old_showtime_id, [ticket.old_seat_number])
+            label = (await crud_seats.claim_seats(db, ticket.showtime_id, [ticket.seat_number]))[0]
+            if label != ticket.seat_number:
+                await db.run_sync(crud_tickets.set_seat_number, ticket_id, label)
+                result.seat_number = label
+        crud_bookings.mark_dirty(db, {ticket.old_customer_id, ticket.customer_id})
+        if ticket.showtime_id != ticket.old_showtime_id:
+            sold_on = ticket.created_at.date() if ticket.created_at else None
+            await db.run_sync(crud_availability.adjust_sold, ticket.old_showtime_id, -1, sold_on)
+            await db.run_sync(crud_availability.adjust_sold, ticket.showtime_id, 1, sold_on)
+        await db.commit()
+        return result
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Seat already ticketed")
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error updating ticket ID={ticket_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def delete_ticket(db: AsyncSession, ticket_id: int, expected_version: Optional[int] = None) -> bool:
+    try:
+        ticket = await db.run_sync(crud_versions.delete_row, Ticket, ticket_id, expected_version)
+        if ticket.status == HELD:
+            await crud_seats.release_held_seats(db, ticket.showtime_id, [ticket.seat_number])
+            await db.run_sync(crud_availability.adjust_held, ticket.showtime_id, -1)
+        else:
+            await crud_seats.unclaim_seats(db, ticket.showtime_id, [ticket.seat_number])
+            await db.run_sync(
+                crud_availability.adjust_sold,
+                ticket.showtime_id, -1, ticket.created_at.date() if ticket.created_at else None
+            )
+        crud_bookings.mark_dirty(db, [ticket.customer_id])
+        await db.commit()
+        return True
+    except HTTPException:
+        await db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Error deleting ticket ID={ticket_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+async def get_tickets_by_ids(db: AsyncSession, ids: List[int]) -> Tuple[List[Optional[Ticket]], List[int]]:
+    return await db.run_sync(crud_batch.get_many, Ticket, ids)
@@ -0,0 +1,271 @@
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi import HTTPException
+from typing import Dict, List, Optional
+from models import CONFIRMED, DailySales, LocationOccupancy, Play, PlaySales, SalesDelta, SeatInventory, Showtime, Ticket
+import config
+import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Widest daily-sales window one request may ask for.
+MAX_SERIES_DAYS = 366
+
+# Longest top-plays list one request may ask for.
+MAX_TOP_PLAYS = 100
+
+# Sales rollups: tickets per play, per location (with seat capacity, for
+# occupancy) and per day. crud.availability calls record_sale() and
+# record_capacity() wherever the per-showtime counters move. Those only append
+# a sales_deltas row inside the caller's transaction: the rollup rows are
+# shared by every sale (one daily_sales row for the whole day), and updating
+# them inline would make all purchases queue on the same locks.
+# fold_deltas(), run in the background by app/sweeper.py, sums the pending
+# deltas into the rollups. Reads touch only the rollup rows, so they cost the
+# same whatever the size of the history, and trail the sales by up to one
+# fold interval.
+
+
+def _bump(db: Session, model, key: Dict, deltas: Dict) -> None:
+    """``UPDATE model SET col = col + delta WHERE key``; create the row on first use."""
+    filters = [getattr(model, name) == value for name, value in key.items()]
+    values = {getattr(model, name): getattr(model, name) + delta for name, delta in deltas.items()}
+    if db.query(model).filter(*filters).update(values, synchronize_session=False):
+        return
+    try:
+        with db.begin_nested():
+            db.execute(insert(model).values(**key, **{name: max(delta, 0) for name, delta in deltas.items()}))
+    except IntegrityError:
+        # Another transaction created the row first; add to it instead.
+        db.query(model).filter(*filters).update(values, synchronize_session=False)
+
+
+def _showtime(db: Session, showtime_id: int):
+    return db.query(Showtime.play_id, Showtime.location).filter(Showtime.id == showtime_id).first()
+
+
+def _record(db: Session, play_id=None, location=None, day=None, sold: int = 0, capacity: int = 0) -> None:
+    """Append one pending change; fold_deltas() applies it."""
+    if play_id is None and location is None and day is None:
+        return
+    db.execute(insert(SalesDelta).values(
+        play_id=play_id, location=location, day=day, sold=sold, capacity=capacity
+    ))
+
+
+def record_sale(db: Session, showtime_id: int, delta: int, sold_on: Optional[datetime.date] = None) -> None:
+    """
+    Record ``delta`` tickets of ``showtime_id`` for the rollups inside the
+    caller's transaction. ``sold_on`` is the day the tickets were issued;
+    cancellations pass the original ticket's day so the daily series stays net.
+    """
+    if not delta:
+        return
+    showtime = _showtime(db, showtime_id)
+    if showtime is None:
+        return
+    _record(
+        db, showtime.play_id, showtime.location, sold_on or datetime.datetime.utcnow().date(), sold=delta
+    )
+
+
+def record_capacity(db: Session, showtime_id: int, delta: int) -> None:
+    """Record ``delta`` seats of ``showtime_id`` for its location's capacity."""
+    if not delta:
+        return
+    showtime = _showtime(db, showtime_id)
+    if showtime is not None:
+        _record(db, location=showtime.location, capacity=delta)
+
+
+def move_showtime(db: Session, showtime_id: int, old_play_id: Optional[int], old_location: Optional[str]) -> None:
+    """
+    Carry a showtime's tickets and seats over when an update changed its play
+    or location; call after the update is flushed.
+    """
+    from models import ShowtimeAvailability
+
+    current = db.query(
+        Showtime.play_id,
+        Showtime.location,
+        func.coalesce(ShowtimeAvailability.sold, 0).label("sold"),
+        func.coalesce(ShowtimeAvailability.capacity, 0).label("capacity")
+    ).outerjoin(
+        ShowtimeAvailability, ShowtimeAvailability.showtime_id == Showtime.id
+    ).filter(Showtime.id == showtime_id).first()
+    if current is None:
+        return
+    new_play_id, new_location = current.play_id, current.location
+    sold, capacity = current.sold, current.capacity
+    if old_play_id != new_play_id and sold:
+        _record(db, play_id=old_play_id, sold=-sold)
+        _record(db, play_id=new_play_id, sold=sold)
+    if old_location != new_location and (sold or capacity):
+        _record(db, location=old_location, sold=-sold, capacity=-capacity)
+        _record(db, location=new_location, sold=sold, capacity=capacity)
+
+
+def drop_showtime(db: Session, play_id: Optional[int], location: Optional[str], sold: int, capacity: int) -> None:
+    """Take a deleted showtime's last counters out of its play and location rollups."""
+    if sold:
+        _record(db, play_id=play_id, sold=-sold)
+    if sold or capacity:
+        _record(db, location=location, sold=-sold, capacity=-capacity)
+
+
+def fold_deltas(db: Session, batch_size: Optional[int] = None) -> int:
+    """
+    Sum one batch of pending deltas into the rollups and delete them; returns
+    how many were folded.
+
+    The batch is locked with FOR UPDATE SKIP LOCKED, so folders in several
+    workers take disjoint batches, and each rollup row is updated once per
+    batch, in key order, however many sales it covers.
+    """
+    batch_size = batch_size or config.ANALYTICS_FOLD_BATCH_SIZE
+    try:
+        rows = db.query(
+            SalesDelta.id, SalesDelta.play_id, SalesDelta.location, SalesDelta.day, SalesDelta.sold, SalesDelta.capacity
+        ).order_by(SalesDelta.id).limit(batch_size).with_for_update(skip_locked=True).all()
+        if not rows:
+            db.rollback()
+            return 0
+        by_play, by_location, by_day = {}, {}, {}
+        for row in rows:
+            if row.play_id is not None:
+                by_play[row.play_id] = by_play.get(row.play_id, 0) + row.sold
+            if row.location is not None:
+                sold, capacity = by_location.get(row.location, (0, 0))
+                by_location[row.location] = (sold + row.sold, capacity + row.capacity)
+            if row.day is not None:
+                by_day[row.day] = by_day.get(row.day, 0) + row.sold
+        for play_id, sold in sorted(by_play.items()):
+            if sold:
+                _bump(db, PlaySales, {"play_id": play_id}, {"sold": sold})
+        for location, (sold, capacity) in sorted(by_location.items()):
+            if sold or capacity:
+                _bump(db, LocationOccupancy, {"location": location}, {"sold": sold, "capacity": capacity})
+        for day, sold in sorted(by_day.items()):
+            if sold:
+                _bump(db, DailySales, {"day": day}, {"sold": sold})
+        db.query(SalesDelta).filter(
+            SalesDelta.id.in_([row.id for row in rows])
+        ).delete(synchronize_session=False)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error folding sales deltas: {str(e)}")
+        return 0
+    return len(rows)
+
+
+def top_plays(db: Session, limit: int = 10) -> List:
+    limit = max(1, min(limit, MAX_TOP_PLAYS))
+    return db.execute(
+        select(PlaySales.play_id, Play.title, PlaySales.sold)
+        .join(Play, Play.id == PlaySales.play_id)
+        .order_by(PlaySales.sold.desc(), PlaySales.play_id)
+        .limit(limit)
+    ).all()
+
+
+def occupancy_by_location(db: Session) -> List[Dict]:
+    rows = db.execute(
+        select(LocationOccupancy.location, LocationOccupancy.sold, LocationOccupancy.capacity)
+        .order_by(LocationOccupancy.location)
+    ).all()
+    return [
+        {
+            "location": row.location,
+            "sold": row.sold,
+            "capacity": row.capacity,
+            "occupancy_rate": round(row.sold / row.capacity, 4) if row.capacity else None,
+        }
+        for row in rows
+    ]
+
+
+def daily_sales(db: Session, date_from: datetime.date, date_to: datetime.date) -> List[Dict]:
+    """Tickets issued per day in ``[date_from, date_to]``, with zero for days without sales."""
+    days = (date_to - date_from).days + 1
+    if days <= 0:
+        raise HTTPException(status_code=400, detail="date_to must not be before date_from")
+    if days > MAX_SERIES_DAYS:
+        raise HTTPException(status_code=400, detail=f"Window may span at most {MAX_SERIES_DAYS} days")
+    sold = dict(
+        db.query(DailySales.day, DailySales.sold)
+        .filter(DailySales.day >= date_from, DailySales.day <= date_to)
+        .all()
+    )
+    return [
+        {"day": day, "sold": sold.get(day, 0)}
+        for day in (date_from + datetime.timedelta(days=n) for n in range(days))
+    ]
+
+
+def rebuild_analytics(db: Session) -> int:
+    """
+    Recompute every rollup from the tickets, showtimes and seat_inventory
+    tables; returns the number of rollup rows written. Tickets without a
+    created_at (issued before the column existed) count everywhere except the
+    daily series; held tickets count nowhere.
+    """
+    try:
+        by_play = db.execute(
+            select(Showtime.play_id, func.count(Ticket.id))
+            .join(Ticket, Ticket.showtime_id == Showtime.id)
+            .where(Showtime.play_id.is_not(None), Ticket.status == CONFIRMED)
+            .group_by(Showtime.play_id)
+        ).all()
+        sold_by_location = dict(db.execute(
+            select(Showtime.location, func.count(Ticket.id))
+            .join(Ticket, Ticket.showtime_id == Showtime.id)
+            .where(Showtime.location.is_not(None), Ticket.status == CONFIRMED)
+            .group_by(Showtime.location)
+        ).all())
+        capacity_by_location = dict(db.execute(
+            select(Showtime.location, func.sum(SeatInventory.rows * SeatInventory.seats_per_row))
+            .join(SeatInventory, SeatInventory.showtime_id == Showtime.id)
+            .where(Showtime.location.is_not(None))
+            .group_by(Showtime.location)
+        ).all())
+        sale_day = func.date(Ticket.created_at)
+        by_day = db.execute(
+            select(sale_day, func.count(Ticket.id))
+            .where(Ticket.created_at.is_not(None), Ticket.status == CONFIRMED)
+            .group_by(sale_day)
+        ).all()
+
+        db.query(PlaySales).delete(synchronize_session=False)
+        db.query(LocationOccupancy).delete(synchronize_session=False)
+        db.query(DailySales).delete(synchronize_session=False)
+        # Everything pending is already counted from the tickets above.
+        db.query(SalesDelta).delete(synchronize_session=False)
+        locations = set(sold_by_location) | set(capacity_by_location)
+        if by_play:
+            db.execute(insert(PlaySales), [{"play_id": play_id, "sold": sold} for play_id, sold in by_play])
+        if locations:
+            db.execute(insert(LocationOccupancy), [
+                {
+                    "location": location,
+                    "sold": sold_by_location.get(location, 0),
+                    "capacity": int(capacity_by_location.get(location) or 0),
+                }
+                for location in sorted(locations)
+            ])
+        if by_day:
+            db.execute(insert(DailySales), [
+                # SQLite's date() returns text; PostgreSQL returns a date.
+                {"day": day if isinstance(day, datetime.date) else datetime.date.fromisoformat(day), "sold": sold}
+                for day, sold in by_day
+            ])
+        db.commit()
+        count = len(by_play) + len(locations) + len(by_day)
+        logger.info(f"Rebuilt {count} analytics rollup rows")
+        return count
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error rebuilding analytics rollups: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
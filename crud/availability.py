@@ -0,0 +1,139 @@
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi import HTTPException
+from typing import Dict, List, Optional
+from models import CONFIRMED, HELD, SeatInventory, Showtime, ShowtimeAvailability, Ticket
+from crud import analytics as crud_analytics
+import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _capacity(db: Session, showtime_id: int):
+    layout = db.query(SeatInventory.rows, SeatInventory.seats_per_row).filter(
+        SeatInventory.showtime_id == showtime_id
+    ).first()
+    return layout.rows * layout.seats_per_row if layout else None
+
+
+def _add(db: Session, showtime_id: int, field: str, delta: int) -> None:
+    """
+    A single ``UPDATE ... SET <field> = <field> + :delta`` that only locks this
+    showtime's counter row; the row is created on first use.
+    """
+    column = getattr(ShowtimeAvailability, field)
+    updated = db.query(ShowtimeAvailability).filter(
+        ShowtimeAvailability.showtime_id == showtime_id
+    ).update({column: column + delta}, synchronize_session=False)
+    if updated:
+        return
+    try:
+        with db.begin_nested():
+            db.execute(insert(ShowtimeAvailability).values(
+                showtime_id=showtime_id,
+                capacity=_capacity(db, showtime_id),
+                **{field: max(delta, 0)}
+            ))
+    except IntegrityError:
+        # Another transaction created the row first; add to it instead.
+        db.query(ShowtimeAvailability).filter(
+            ShowtimeAvailability.showtime_id == showtime_id
+        ).update({column: column + delta}, synchronize_session=False)
+
+
+def adjust_sold(db: Session, showtime_id: int, delta: int, sold_on: Optional[datetime.date] = None) -> None:
+    """
+    Add ``delta`` to the sold counter inside the caller's transaction.
+
+    The sales rollups in crud.analytics move with it; ``sold_on`` is the
+    issue day of the tickets (today when omitted). Only confirmed tickets
+    are sold; holds go through adjust_held().
+    """
+    if not delta:
+        return
+    crud_analytics.record_sale(db, showtime_id, delta, sold_on)
+    _add(db, showtime_id, "sold", delta)
+
+
+def adjust_held(db: Session, showtime_id: int, delta: int) -> None:
+    """Add ``delta`` to the held counter inside the caller's transaction."""
+    if delta:
+        _add(db, showtime_id, "held", delta)
+
+
+def adjust_sold_many(db: Session, counts: Dict[int, int], sold_on: Optional[datetime.date] = None) -> None:
+    """adjust_sold() for several showtimes, in id order so concurrent callers lock the rows alike."""
+    for showtime_id, delta in sorted(counts.items()):
+        adjust_sold(db, showtime_id, delta, sold_on)
+
+
+def set_capacity(db: Session, showtime_id: int, capacity: int) -> None:
+    """Record the capacity of a showtime inside the caller's transaction."""
+    previous = db.query(ShowtimeAvailability.capacity).filter(
+        ShowtimeAvailability.showtime_id == showtime_id
+    ).scalar()
+    updated = db.query(ShowtimeAvailability).filter(
+        ShowtimeAvailability.showtime_id == showtime_id
+    ).update({ShowtimeAvailability.capacity: capacity}, synchronize_session=False)
+    if not updated:
+        db.add(ShowtimeAvailability(showtime_id=showtime_id, capacity=capacity, sold=0))
+    crud_analytics.record_capacity(db, showtime_id, capacity - (previous or 0))
+
+
+def availability_query(play_id: int):
+    """Per-showtime counters for one play: an index range on showtimes plus PK lookups."""
+    return (
+        select(
+            Showtime.id.label("showtime_id"),
+            Showtime.show_date,
+            Showtime.location,
+            ShowtimeAvailability.capacity,
+            func.coalesce(ShowtimeAvailability.sold, 0).label("sold"),
+            func.coalesce(ShowtimeAvailability.held, 0).label("held"),
+        )
+        .outerjoin(ShowtimeAvailability, ShowtimeAvailability.showtime_id == Showtime.id)
+        .where(Showtime.play_id == play_id)
+        .order_by(Showtime.show_date, Showtime.id)
+    )
+
+
+def get_availability(db: Session, play_id: int) -> List:
+    return db.execute(availability_query(play_id)).all()
+
+
+def rebuild_availability(db: Session) -> int:
+    """
+    Recompute every counter from the tickets and seat_inventory tables.
+
+    Reconciliation job for drift (manual SQL, crashed migrations); the regular
+    write paths never need it. Returns the number of showtimes rebuilt.
+    """
+    try:
+        sold = dict(
+            db.query(Ticket.showtime_id, func.count(Ticket.id))
+            .filter(Ticket.status == CONFIRMED).group_by(Ticket.showtime_id).all()
+        )
+        held = dict(
+            db.query(Ticket.showtime_id, func.count(Ticket.id))
+            .filter(Ticket.status == HELD).group_by(Ticket.showtime_id).all()
+        )
+        capacity = {
+            row.showtime_id: row.rows * row.seats_per_row
+            for row in db.query(SeatInventory.showtime_id, SeatInventory.rows, SeatInventory.seats_per_row)
+        }
+        showtime_ids = set(sold) | set(held) | set(capacity)
+        db.query(ShowtimeAvailability).delete(synchronize_session=False)
+        if showtime_ids:
+            db.execute(insert(ShowtimeAvailability), [
+                {"showtime_id": sid, "capacity": capacity.get(sid), "sold": sold.get(sid, 0), "held": held.get(sid, 0)}
+                for sid in sorted(showtime_ids)
+            ])
+        db.commit()
+        logger.info(f"Rebuilt availability counters for {len(showtime_ids)} showtimes")
+        return len(showtime_ids)
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error rebuilding availability counters: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
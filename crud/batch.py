@@ -0,0 +1,36 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from typing import Any, List, Optional, Tuple
+from models import Actor, Director, Play
+from crud import catalog_cache
+
+# Upper bound on IDs per batch request; one IN list, one round-trip.
+MAX_BATCH_IDS = 500
+
+# Served through the catalog read-through cache, so only misses hit the database.
+CACHED_MODELS = (Play, Actor, Director)
+
+
+def get_many(db: Session, model, ids: List[int]) -> Tuple[List[Optional[Any]], List[int]]:
+    """
+    Fetch ``ids`` of ``model`` with one ``WHERE id IN (...)`` query.
+
+    Returns ``(items, missing)``: ``items`` follows the request order, with
+    ``None`` where a row does not exist (duplicates are repeated), and
+    ``missing`` lists those IDs once each.
+    """
+    if not ids:
+        raise HTTPException(status_code=400, detail="No ids in request")
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+
+    wanted = list(dict.fromkeys(ids))
+
+    def load(pks):
+        return db.query(model).filter(model.id.in_(pks)).all()
+
+    if model in CACHED_MODELS:
+        found = catalog_cache.get_many(db, model, wanted, load)
+    else:
+        found = {obj.id: obj for obj in load(wanted)}
+    return [found.get(i) for i in ids], [i for i in wanted if i not in found]
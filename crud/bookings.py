@@ -0,0 +1,97 @@
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from typing import Dict, Iterable, List
+from models import Customer, Play, Showtime, Ticket
+from caching import MISSING, build_cache, bump_generation, generation
+import datetime
+
+# Most recent bookings returned (and cached) per customer.
+HISTORY_LIMIT = 200
+
+# Per-customer booking history, keyed by customer id. Ticket write paths call
+# mark_dirty() inside their transaction and the customer's generation moves
+# on once that transaction commits, so a reader never sees a page older than
+# its own write. The generation is part of the key and read before the
+# history query, so a page loaded just before such a commit is stored under
+# the old generation and never served.
+# Show dates and play titles can still change under a cached entry; the cache
+# TTL bounds that.
+booking_cache = build_cache()
+
+_DIRTY = "bookings_dirty"
+
+
+def _namespace(customer_id: int) -> str:
+    return f"bookings:{customer_id}"
+
+
+def _key(customer_id: int) -> str:
+    namespace = _namespace(customer_id)
+    return f"{namespace}:{generation(booking_cache, namespace)}"
+
+
+def mark_dirty(db: Session, customer_ids: Iterable[int]) -> None:
+    """Invalidate these customers' histories when ``db`` next commits."""
+    db.info.setdefault(_DIRTY, set()).update(cid for cid in customer_ids if cid is not None)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session) -> None:
+    for customer_id in session.info.pop(_DIRTY, ()):
+        booking_cache.delete(_key(customer_id))
+        bump_generation(booking_cache, _namespace(customer_id))
+
+
+def history_query(customer_id: int):
+    """
+    One join for the whole page. ix_tickets_customer_showtime covers the
+    ticket side (customer_id, showtime_id plus the listed columns), and
+    showtimes and plays are primary-key lookups.
+    """
+    return (
+        select(
+            Ticket.id.label("ticket_id"),
+            Ticket.seat_number,
+            Ticket.status,
+            Showtime.id.label("showtime_id"),
+            Showtime.show_date,
+            Showtime.location,
+            Play.id.label("play_id"),
+            Play.title.label("play_title"),
+        )
+        .join(Showtime, Showtime.id == Ticket.showtime_id)
+        .outerjoin(Play, Play.id == Showtime.play_id)
+        .where(Ticket.customer_id == customer_id)
+        .order_by(Showtime.show_date.desc(), Ticket.id.desc())
+        .limit(HISTORY_LIMIT)
+    )
+
+
+def _load(db: Session, customer_id: int) -> List[Dict]:
+    key = _key(customer_id)
+    cached = booking_cache.get(key)
+    if cached is not MISSING:
+        return cached
+    if not db.query(Customer.id).filter(Customer.id == customer_id).first():
+        raise HTTPException(status_code=404, detail="Customer not found")
+    rows = [row._asdict() for row in db.execute(history_query(customer_id))]
+    booking_cache.set(key, rows)
+    return rows
+
+
+def get_booking_history(db: Session, customer_id: int) -> Dict[str, List[Dict]]:
+    """
+    The customer's bookings split into upcoming (soonest first) and past
+    (most recent first). The split is made per request, so cached entries do
+    not go stale as shows start.
+    """
+    now = datetime.datetime.utcnow()
+    rows = _load(db, customer_id)
+    upcoming = [row for row in rows if row["show_date"] >= now]
+    upcoming.reverse()
+    return {
+        "customer_id": customer_id,
+        "upcoming": upcoming,
+        "past": [row for row in rows if row["show_date"] < now],
+    }
@@ -0,0 +1,152 @@
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from caching import MISSING, bump_generation, catalog_cache, generation
+
+# Read-through cache for the catalog tables (plays, actors, directors).
+#
+# Entries hold plain column dicts, never ORM objects, so they survive any
+# backend. On a hit the row is turned back into a detached instance and merged
+# into the caller's session with load=False: no SQL is emitted, and the result
+# is a normal persistent object that update/delete paths can modify. Writes
+# bump the table's generation, which orphans every cached page and item of
+# that table at once.
+#
+# Item keys carry the generation too, read before the row is loaded. A reader
+# that loaded a row just before a write committed therefore stores it under
+# the old generation, where nobody looks any more, instead of putting the
+# stale row back after the invalidation for a whole TTL.
+
+
+def _namespace(model) -> str:
+    return model.__tablename__
+
+
+def _row(obj) -> dict:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+def detached(model, row: dict):
+    obj = model(**row)
+    make_transient_to_detached(obj)
+    return obj
+
+
+def _item_key(model, pk, gen: Optional[int] = None) -> str:
+    namespace = _namespace(model)
+    if gen is None:
+        gen = generation(catalog_cache, namespace)
+    return f"{namespace}:item:{gen}:{pk}"
+
+
+def _page_key(model, args: Hashable) -> str:
+    namespace = _namespace(model)
+    return f"{namespace}:list:{generation(catalog_cache, namespace)}:{args!r}"
+
+
+def get_one(db: Session, model, pk, loader: Callable[[], Any]):
+    key = _item_key(model, pk)
+    row = catalog_cache.get(key)
+    if row is not MISSING:
+        return db.merge(detached(model, row), load=False)
+    obj = loader()
+    if obj is not None:
+        catalog_cache.set(key, _row(obj))
+    return obj
+
+
+def peek(model, pk) -> Optional[dict]:
+    """The cached column dict for ``pk``, or None on a miss; never loads."""
+    row = catalog_cache.get(_item_key(model, pk))
+    return None if row is MISSING else row
+
+
+def get_many(db: Session, model, pks: Sequence, loader: Callable[[List], List[Any]]) -> Dict[Any, Any]:
+    """
+    Look ``pks`` up in one cache round-trip and load only the misses, with a
+    single ``loader(missing_pks)`` call. Returns ``{pk: instance}`` for the
+    rows that exist.
+    """
+    pk_name = inspect(model).primary_key[0].key
+    gen = generation(catalog_cache, _namespace(model))
+    found, missing = {}, []
+    for pk, row in zip(pks, catalog_cache.get_many([_item_key(model, pk, gen) for pk in pks])):
+        if row is MISSING:
+            missing.append(pk)
+        else:
+            found[pk] = db.merge(detached(model, row), load=False)
+    if missing:
+        for obj in loader(missing):
+            catalog_cache.set(_item_key(model, getattr(obj, pk_name), gen), _row(obj))
+            found[getattr(obj, pk_name)] = obj
+    return found
+
+
+def get_page(
+        db: Session,
+        model,
+        args: Hashable,
+        loader: Callable[[], Tuple[List[Any], Optional[str]]]
+) -> Tuple[List[Any], Optional[str]]:
+    key = _page_key(model, args)
+    cached = catalog_cache.get(key)
+    if cached is not MISSING:
+        rows, next_cursor = cached
+        return [db.merge(detached(model, row), load=False) for row in rows], next_cursor
+    items, next_cursor = loader()
+    catalog_cache.set(key, ([_row(obj) for obj in items], next_cursor))
+    return items, next_cursor
+
+
+def get_rows(
+        model,
+        args: Hashable,
+        loader: Callable[[], Tuple[List[dict], Optional[str]]]
+) -> Tuple[List[dict], Optional[str]]:
+    """Cached page of plain column dicts (the fast list path); no session work on a hit."""
+    key = _page_key(model, ("rows", args))
+    cached = catalog_cache.get(key)
+    if cached is not MISSING:
+        return cached
+    page = loader()
+    catalog_cache.set(key, page)
+    return page
+
+
+async def get_one_async(db, model, pk, loader: Callable[[], Awaitable[Any]]):
+    key = _item_key(model, pk)
+    row = catalog_cache.get(key)
+    if row is not MISSING:
+        return await db.merge(detached(model, row), load=False)
+    obj = await loader()
+    if obj is not None:
+        catalog_cache.set(key, _row(obj))
+    return obj
+
+
+async def get_page_async(
+        db,
+        model,
+        args: Hashable,
+        loader: Callable[[], Awaitable[Tuple[List[Any], Optional[str]]]]
+) -> Tuple[List[Any], Optional[str]]:
+    key = _page_key(model, args)
+    cached = catalog_cache.get(key)
+    if cached is not MISSING:
+        rows, next_cursor = cached
+        return [await db.merge(detached(model, row), load=False) for row in rows], next_cursor
+    items, next_cursor = await loader()
+    catalog_cache.set(key, ([_row(obj) for obj in items], next_cursor))
+    return items, next_cursor
+
+
+def invalidate(model, pk=None) -> None:
+    """Call after a successful commit that created, changed or removed rows of ``model``."""
+    if pk is not None:
+        # Only frees the entry early; the new generation already hides it.
+        catalog_cache.delete(_item_key(model, pk))
+    bump_generation(catalog_cache, _namespace(model))
+
+
+def cache_stats() -> dict:
+    return catalog_cache.stats.snapshot()
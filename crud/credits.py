@@ -0,0 +1,126 @@
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from typing import List, Optional, Tuple
+from models import Actor, Director, Play, PlayActor, PlayDirector
+from crud.keyset import paginate
+from crud import catalog_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on IDs per bulk add/remove request.
+MAX_CREDIT_IDS = 1000
+
+# Play cast and crew. Links live in the play_directors and play_actors
+# association tables and are written with one set-based statement per request
+# (INSERT ... ON CONFLICT DO NOTHING, DELETE ... WHERE ... IN), never by
+# loading a collection. Each table's primary key serves play -> people and a
+# (person, play) index serves the reverse lookups.
+CREDITS = {
+    "directors": (PlayDirector, PlayDirector.director_id, Director),
+    "actors": (PlayActor, PlayActor.actor_id, Actor),
+}
+
+PAGE_KEYS = (Play.id,)
+
+
+def _dialect_insert(db: Session, model):
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise HTTPException(status_code=500, detail=f"Credit links not supported on {dialect}")
+    return dialect_insert(model)
+
+
+def _check_ids(ids: List[int]) -> List[int]:
+    if not ids:
+        raise HTTPException(status_code=400, detail="No ids in request")
+    if len(ids) > MAX_CREDIT_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_CREDIT_IDS} ids per request")
+    return list(dict.fromkeys(ids))
+
+
+def _check_play(db: Session, play_id: int) -> None:
+    if not db.query(Play.id).filter(Play.id == play_id).first():
+        raise HTTPException(status_code=404, detail="Play not found")
+
+
+def add_credits(db: Session, play_id: int, kind: str, ids: List[int]) -> int:
+    """Link people to a play with one INSERT ... ON CONFLICT DO NOTHING; returns how many links are new."""
+    link, person_column, person = CREDITS[kind]
+    ids = _check_ids(ids)
+    _check_play(db, play_id)
+    found = {row.id for row in db.query(person.id).filter(person.id.in_(ids))}
+    if len(found) != len(ids):
+        missing = [i for i in ids if i not in found]
+        raise HTTPException(status_code=404, detail=f"{person.__name__}s not found: {missing}")
+    try:
+        stmt = _dialect_insert(db, link).values(
+            [{"play_id": play_id, person_column.key: person_id} for person_id in ids]
+        ).on_conflict_do_nothing(index_elements=["play_id", person_column.key])
+        added = db.execute(stmt).rowcount
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error adding {kind} to play {play_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+    # Director-filtered play pages are cached under the play list generation.
+    catalog_cache.invalidate(Play)
+    logger.info(f"Added {added} {kind} to play {play_id}")
+    return added
+
+
+def remove_credits(db: Session, play_id: int, kind: str, ids: List[int]) -> int:
+    """Unlink people from a play with one DELETE; returns how many links were removed."""
+    link, person_column, _ = CREDITS[kind]
+    ids = _check_ids(ids)
+    _check_play(db, play_id)
+    try:
+        removed = db.execute(
+            delete(link).where(link.play_id == play_id, person_column.in_(ids))
+        ).rowcount
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error removing {kind} from play {play_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+    if removed:
+        catalog_cache.invalidate(Play)
+    logger.info(f"Removed {removed} {kind} from play {play_id}")
+    return removed
+
+
+def get_credits(db: Session, play_id: int, kind: str) -> List:
+    """Everyone linked to a play: a primary-key range on the link table plus PK lookups."""
+    link, person_column, person = CREDITS[kind]
+    _check_play(db, play_id)
+    return db.scalars(
+        select(person)
+        .join(link, person_column == person.id)
+        .where(link.play_id == play_id)
+        .order_by(person.id)
+    ).all()
+
+
+def plays_with(query, kind: str, person_id: int):
+    """Restrict a play Query or Select to plays linked to ``person_id`` (indexed reverse lookup)."""
+    link, person_column, _ = CREDITS[kind]
+    return query.filter(Play.id.in_(select(link.play_id).where(person_column == person_id)))
+
+
+def get_plays_for(
+        db: Session,
+        kind: str,
+        person_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 100
+) -> Tuple[List[Play], Optional[str]]:
+    _, _, person = CREDITS[kind]
+    if not db.query(person.id).filter(person.id == person_id).first():
+        raise HTTPException(status_code=404, detail=f"{person.__name__} not found")
+    return paginate(plays_with(db.query(Play), kind, person_id), PAGE_KEYS, cursor, limit)
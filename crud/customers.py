@@ -1,11 +1,23 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from fastapi import HTTPException, status
+from typing import List, Optional, Tuple
 from models import Customer
-from schemas import CustomerCreate, CustomerUpdate
+from schemas import CustomerCreate, CustomerResponse, CustomerUpdate
+from crud.keyset import paginate, paginate_rows, response_columns
+from crud import batch as crud_batch
+from crud import bookings as crud_bookings
+from crud import versions as crud_versions
 import logging
 
-logger = logging.getLogger(_name_)
+logger = logging.getLogger(__name__)
+
+# Keyset sort order for list pages; must match an index on the table.
+PAGE_KEYS = (Customer.id,)
+
+# Columns of CustomerResponse, for the column-only list path.
+LIST_COLUMNS = response_columns(Customer, CustomerResponse)
 
 
 def create_customer(db: Session, customer: CustomerCreate) -> Customer:
@@ -14,7 +26,7 @@ def create_customer(db: Session, customer: CustomerCreate) -> Customer:
         db.add(db_customer)
         db.commit()
         db.refresh(db_customer)
-        logger.info(f"Created customer ID={db_customer.customer_id}")
+        logger.info(f"Created customer ID={db_customer.id}")
         return db_customer
     except SQLAlchemyError as e:
         db.rollback()
@@ -23,27 +35,82 @@ def create_customer(db: Session, customer: CustomerCreate) -> Customer:
 
 
 def get_customer(db: Session, customer_id: int) -> Customer:
-    customer = db.query(Customer).filter(Customer.customer_id == customer_id).first()
+    customer = db.query(Customer).filter(Customer.id == customer_id).first()
     if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
     return customer
 
 
-def get_customers(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Customer).offset(skip).limit(limit).all()
+def filter_customers(query, name: Optional[str] = None, email: Optional[str] = None):
+    if name:
+        query = query.filter(Customer.name.ilike(f"%{name}%"))
+    if email:
+        query = query.filter(Customer.email == email)
+    return query
 
 
-def update_customer(db: Session, customer_id: int, update_data: CustomerUpdate) -> Customer:
-    customer = get_customer(db, customer_id)
-    for field, value in update_data.model_dump(exclude_unset=True).items():
-        setattr(customer, field, value)
-    db.commit()
-    db.refresh(customer)
-    return customer
+def get_customers(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        name: Optional[str] = None,
+        email: Optional[str] = None
+) -> Tuple[List[Customer], Optional[str]]:
+    return paginate(filter_customers(db.query(Customer), name, email), PAGE_KEYS, cursor, limit)
+
+
+def get_customer_rows(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        name: Optional[str] = None,
+        email: Optional[str] = None
+) -> Tuple[List[dict], Optional[str]]:
+    stmt = filter_customers(select(*LIST_COLUMNS), name, email)
+    return paginate_rows(db, stmt, PAGE_KEYS, cursor, limit)
+
+
+def update_customer(
+        db: Session,
+        customer_id: int,
+        update_data: CustomerUpdate,
+        expected_version: Optional[int] = None
+) -> Customer:
+    try:
+        customer = crud_versions.update_row(
+            db, Customer, customer_id, update_data.model_dump(exclude_unset=True), expected_version
+        )
+        db.commit()
+        return crud_versions.as_instance(Customer, customer)
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Email already registered")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error updating customer ID={customer_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+def delete_customer(db: Session, customer_id: int, expected_version: Optional[int] = None) -> bool:
+    try:
+        crud_versions.delete_row(db, Customer, customer_id, expected_version)
+        crud_bookings.mark_dirty(db, [customer_id])
+        db.commit()
+        return True
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Customer still has tickets")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error deleting customer ID={customer_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
 
 
-def delete_customer(db: Session, customer_id: int) -> bool:
-    customer = get_customer(db, customer_id)
-    db.delete(customer)
-    db.commit()
-    return True
+def get_customers_by_ids(db: Session, ids: List[int]) -> Tuple[List[Optional[Customer]], List[int]]:
+    return crud_batch.get_many(db, Customer, ids)
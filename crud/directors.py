@@ -1,11 +1,19 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
+from typing import List, Optional, Tuple
 from models import Director
 from schemas import DirectorCreate, DirectorUpdate
+from crud.keyset import paginate
+from crud import batch as crud_batch
+from crud import catalog_cache
+from crud import versions as crud_versions
 import logging
 
-logger = logging.getLogger(_name_)
+logger = logging.getLogger(__name__)
+
+# Keyset sort order for list pages; must match an index on the table.
+PAGE_KEYS = (Director.id,)
 
 def create_director(db: Session, director: DirectorCreate) -> Director:
     try:
@@ -13,7 +21,8 @@ def create_director(db: Session, director: DirectorCreate) -> Director:
         db.add(db_director)
         db.commit()
         db.refresh(db_director)
-        logger.info(f"Created director ID={db_director.director_id}")
+        catalog_cache.invalidate(Director)
+        logger.info(f"Created director ID={db_director.id}")
         return db_director
     except SQLAlchemyError as e:
         db.rollback()
@@ -22,21 +31,37 @@ def create_director(db: Session, director: DirectorCreate) -> Director:
 
 
 def get_director(db: Session, director_id: int) -> Director:
-    director = db.query(Director).filter(Director.director_id == director_id).first()
+    director = catalog_cache.get_one(
+        db, Director, director_id,
+        lambda: db.query(Director).filter(Director.id == director_id).first()
+    )
     if not director:
         raise HTTPException(status_code=404, detail="Director not found")
     return director
 
 
-def get_directors(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Director).offset(skip).limit(limit).all()
+def get_directors(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        name: Optional[str] = None
+) -> Tuple[List[Director], Optional[str]]:
+    query = db.query(Director)
+    if name:
+        query = query.filter(Director.name.ilike(f"%{name}%"))
+    return catalog_cache.get_page(
+        db, Director, (cursor, limit, name),
+        lambda: paginate(query, PAGE_KEYS, cursor, limit)
+    )
 
 
 def update_director(db: Session, director_id: int, update_data: DirectorUpdate) -> Director:
     director = get_director(db, director_id)
     for field, value in update_data.model_dump(exclude_unset=True).items():
         setattr(director, field, value)
+    crud_versions.bump(director)
     db.commit()
+    catalog_cache.invalidate(Director, director_id)
     db.refresh(director)
     return director
 
@@ -45,4 +70,13 @@ def delete_director(db: Session, director_id: int) -> bool:
     director = get_director(db, director_id)
     db.delete(director)
     db.commit()
+    catalog_cache.invalidate(Director, director_id)
     return True
+
+
+def get_directors_by_ids(db: Session, ids: List[int]) -> Tuple[List[Optional[Director]], List[int]]:
+    return crud_batch.get_many(db, Director, ids)
+
+
+def get_director_version(db: Session, director_id: int) -> Optional[int]:
+    return crud_versions.get_version(db, Director, director_id)
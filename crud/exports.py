@@ -0,0 +1,120 @@
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+from typing import Iterable, Iterator, Optional, Sequence
+from datetime import datetime
+from models import CONFIRMED, Customer, Showtime, Ticket
+import csv
+import io
+import json
+
+try:
+    import orjson
+except ImportError:  # optional, only makes NDJSON encoding faster
+    orjson = None
+
+# Rows fetched per round-trip from the server-side cursor.
+EXPORT_BATCH_SIZE = 2000
+
+TICKET_COLUMNS = ("ticket_id", "customer_id", "showtime_id", "seat_number", "play_id", "show_date", "location")
+CUSTOMER_COLUMNS = ("customer_id", "name", "email")
+
+
+def _showtime_filters(stmt, showtime_id, play_id, date_from, date_to):
+    if showtime_id is not None:
+        stmt = stmt.where(Showtime.id == showtime_id)
+    if play_id is not None:
+        stmt = stmt.where(Showtime.play_id == play_id)
+    if date_from is not None:
+        stmt = stmt.where(Showtime.show_date >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(Showtime.show_date < date_to)
+    return stmt
+
+
+def ticket_export_query(
+        showtime_id: Optional[int] = None,
+        play_id: Optional[int] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+):
+    stmt = (
+        select(
+            Ticket.id.label("ticket_id"),
+            Ticket.customer_id,
+            Ticket.showtime_id,
+            Ticket.seat_number,
+            Showtime.play_id,
+            Showtime.show_date,
+            Showtime.location,
+        )
+        .join(Showtime, Showtime.id == Ticket.showtime_id)
+        .where(Ticket.status == CONFIRMED)
+        .order_by(Ticket.id)
+    )
+    return _showtime_filters(stmt, showtime_id, play_id, date_from, date_to)
+
+
+def customer_export_query(
+        showtime_id: Optional[int] = None,
+        play_id: Optional[int] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+):
+    stmt = select(Customer.id.label("customer_id"), Customer.name, Customer.email).order_by(Customer.id)
+    if any(value is not None for value in (showtime_id, play_id, date_from, date_to)):
+        bought = (
+            select(Ticket.id)
+            .join(Showtime, Showtime.id == Ticket.showtime_id)
+            .where(Ticket.customer_id == Customer.id, Ticket.status == CONFIRMED)
+        )
+        stmt = stmt.where(exists(_showtime_filters(bought, showtime_id, play_id, date_from, date_to)))
+    return stmt
+
+
+def stream_rows(db: Session, stmt, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator:
+    """
+    Iterate ``stmt`` through a server-side cursor.
+
+    ``yield_per`` turns on ``stream_results``, so at most one batch of rows is
+    held in memory at a time regardless of the size of the export.
+    """
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield from partition
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def ndjson_lines(rows: Iterable, columns: Sequence[str], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    chunk = []
+    for row in rows:
+        record = dict(zip(columns, row))
+        if orjson is not None:
+            chunk.append(orjson.dumps(record) + b"\n")
+        else:
+            chunk.append(json.dumps(record, default=_json_default).encode() + b"\n")
+        if len(chunk) >= batch_size:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
+
+
+def csv_lines(rows: Iterable, columns: Sequence[str], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow(value.isoformat() if isinstance(value, datetime) else value for value in row)
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
@@ -0,0 +1,275 @@
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi import HTTPException
+from typing import Dict, List, Optional, Set
+import datetime
+import secrets
+import threading
+from models import CONFIRMED, HELD, Customer, Showtime, Ticket
+from crud import availability as crud_availability
+from crud import seats as crud_seats
+from crud import bookings as crud_bookings
+import config
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HoldMetrics:
+    def __init__(self):
+        self.created = 0
+        self.expired = 0
+        self.converted = 0
+        self.released = 0
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "created": self.created,
+                "expired": self.expired,
+                "converted": self.converted,
+                "released": self.released,
+            }
+
+
+hold_metrics = HoldMetrics()
+
+
+def create_hold(
+        db: Session,
+        customer_id: int,
+        showtime_id: int,
+        seats: List[str],
+        ttl_seconds: Optional[int] = None
+) -> Dict:
+    """
+    Hold ``seats`` for one customer: the seats are reserved on the seat map
+    and held tickets are written, all in one transaction. Confirming or
+    releasing the hold takes the returned ``hold_token``; unconfirmed holds
+    are removed by expire_holds() once they pass ``hold_expires_at``. Holds
+    do not count as sold until they are confirmed.
+    """
+    if not seats:
+        raise HTTPException(status_code=400, detail="No seats in request")
+    if not db.query(Showtime.id).filter(Showtime.id == showtime_id).first():
+        raise HTTPException(status_code=404, detail="Showtime not found")
+    if not db.query(Customer.id).filter(Customer.id == customer_id).first():
+        raise HTTPException(status_code=404, detail="Customer not found")
+
+    expires_at = datetime.datetime.utcnow() + datetime.timedelta(
+        seconds=ttl_seconds if ttl_seconds is not None else config.HOLD_TTL_SECONDS
+    )
+    token = secrets.token_urlsafe(16)
+    try:
+        labels = crud_seats.hold_seats(db, showtime_id, seats)
+        result = db.execute(
+            insert(Ticket).returning(Ticket.id, sort_by_parameter_order=True),
+            [
+                {
+                    "customer_id": customer_id,
+                    "showtime_id": showtime_id,
+                    "seat_number": label,
+                    "status": HELD,
+                    "hold_expires_at": expires_at,
+                    "hold_token": token,
+                }
+                for label in labels
+            ]
+        )
+        ticket_ids = list(result.scalars())
+        crud_availability.adjust_held(db, showtime_id, len(ticket_ids))
+        crud_bookings.mark_dirty(db, [customer_id])
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Seat already ticketed")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error creating hold: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+    hold_metrics.incr("created", len(ticket_ids))
+    logger.info(f"Held {len(ticket_ids)} seat(s) for showtime ID={showtime_id} until {expires_at}")
+    return {"ticket_ids": ticket_ids, "seats": labels, "expires_at": expires_at, "hold_token": token}
+
+
+def _owned_holds(db: Session, customer_id: int, hold_token: str, ticket_ids: List[int], showtime_id: Optional[int]):
+    """The caller's held tickets among ``ticket_ids``, locked until commit."""
+    query = db.query(
+        Ticket.id, Ticket.showtime_id, Ticket.seat_number, Ticket.customer_id, Ticket.created_at
+    ).filter(
+        Ticket.id.in_(ticket_ids),
+        Ticket.customer_id == customer_id,
+        Ticket.hold_token == hold_token,
+        Ticket.status == HELD
+    )
+    if showtime_id is not None:
+        query = query.filter(Ticket.showtime_id == showtime_id)
+    return query
+
+
+def _by_showtime(rows) -> Dict[int, List[str]]:
+    """Seats per showtime, in showtime id order: every path locks showtimes in that order."""
+    grouped: Dict[int, List[str]] = {}
+    for row in sorted(rows, key=lambda row: row.showtime_id):
+        grouped.setdefault(row.showtime_id, []).append(row.seat_number)
+    return grouped
+
+
+def _by_day(rows) -> Dict[tuple, int]:
+    counts: Dict[tuple, int] = {}
+    for row in sorted(rows, key=lambda row: row.showtime_id):
+        key = (row.showtime_id, row.created_at.date() if row.created_at else None)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def confirm_hold(
+        db: Session,
+        customer_id: int,
+        hold_token: str,
+        ticket_ids: List[int],
+        showtime_id: Optional[int] = None
+) -> List[int]:
+    """
+    Turn unexpired holds into confirmed tickets; all or nothing. Only the
+    customer holding ``hold_token`` can confirm, and only now do the seats
+    move from reserved to sold and count as sold.
+    """
+    try:
+        rows = _owned_holds(db, customer_id, hold_token, ticket_ids, showtime_id).filter(
+            Ticket.hold_expires_at > datetime.datetime.utcnow()
+        ).with_for_update().all()
+        if len(rows) != len(set(ticket_ids)):
+            raise HTTPException(status_code=409, detail="Hold expired or not found")
+        for held_showtime_id, seat_numbers in _by_showtime(rows).items():
+            crud_seats.confirm_held_seats(db, held_showtime_id, seat_numbers)
+        db.query(Ticket).filter(Ticket.id.in_([row.id for row in rows])).update(
+            {
+                Ticket.status: CONFIRMED,
+                Ticket.hold_expires_at: None,
+                Ticket.hold_token: None,
+                Ticket.version: Ticket.version + 1
+            },
+            synchronize_session=False
+        )
+        for held_showtime_id, seat_numbers in _by_showtime(rows).items():
+            crud_availability.adjust_held(db, held_showtime_id, -len(seat_numbers))
+        for (held_showtime_id, sold_on), count in _by_day(rows).items():
+            crud_availability.adjust_sold(db, held_showtime_id, count, sold_on)
+        crud_bookings.mark_dirty(db, [customer_id])
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error confirming hold: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+    hold_metrics.incr("converted", len(rows))
+    return ticket_ids
+
+
+def _drop_holds(db: Session, rows) -> int:
+    """Delete held tickets and give their seats back; caller commits."""
+    for showtime_id, seat_numbers in _by_showtime(rows).items():
+        crud_seats.release_held_seats(db, showtime_id, seat_numbers)
+        crud_availability.adjust_held(db, showtime_id, -len(seat_numbers))
+    crud_bookings.mark_dirty(db, {row.customer_id for row in rows})
+    db.query(Ticket).filter(
+        Ticket.id.in_([row.id for row in rows]),
+        Ticket.status == HELD
+    ).delete(synchronize_session=False)
+    return len(rows)
+
+
+def release_hold(
+        db: Session,
+        customer_id: int,
+        hold_token: str,
+        ticket_ids: List[int],
+        showtime_id: Optional[int] = None
+) -> int:
+    """Cancel a customer's holds before they expire; needs the hold's token."""
+    try:
+        rows = _owned_holds(db, customer_id, hold_token, ticket_ids, showtime_id).with_for_update().all()
+        released = _drop_holds(db, rows) if rows else 0
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error releasing hold: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+    hold_metrics.incr("released", released)
+    return released
+
+
+def _drop_expired(db: Session, rows, skip: Set[int]) -> int:
+    """
+    Drop a batch of expired holds. Should the batch fail as a whole, every
+    row is retried in its own savepoint and rows that still fail are logged
+    and added to ``skip``, so one bad row neither blocks the others nor
+    comes back within the same sweep.
+    """
+    try:
+        with db.begin_nested():
+            return _drop_holds(db, rows)
+    except (HTTPException, SQLAlchemyError) as e:
+        logger.warning(f"Expiring {len(rows)} hold(s) as one batch failed, retrying one by one: {e}")
+    expired = 0
+    for row in rows:
+        try:
+            with db.begin_nested():
+                expired += _drop_holds(db, [row])
+        except (HTTPException, SQLAlchemyError) as e:
+            logger.error(f"Could not expire held ticket ID={row.id}: {e}")
+            skip.add(row.id)
+    return expired
+
+
+def expire_holds(db: Session, batch_size: Optional[int] = None, skip: Optional[Set[int]] = None) -> int:
+    """
+    Remove one batch of expired holds; returns how many were removed.
+
+    Candidates come off the partial ix_tickets_hold_expires_at index in expiry
+    order and are locked with FOR UPDATE SKIP LOCKED, so rows a buyer is
+    confirming right now are skipped instead of waited on, and several
+    sweepers can run side by side. Held tickets in ``skip`` are left alone;
+    the ones that fail to expire are added to it.
+    """
+    batch_size = batch_size or config.HOLD_SWEEP_BATCH_SIZE
+    skip = set() if skip is None else skip
+    try:
+        query = db.query(
+            Ticket.id, Ticket.showtime_id, Ticket.seat_number, Ticket.customer_id, Ticket.created_at
+        ).filter(
+            Ticket.status == HELD,
+            Ticket.hold_expires_at <= datetime.datetime.utcnow()
+        )
+        if skip:
+            query = query.filter(Ticket.id.not_in(skip))
+        rows = query.order_by(Ticket.hold_expires_at).limit(batch_size).with_for_update(skip_locked=True).all()
+        if not rows:
+            db.rollback()
+            return 0
+        expired = _drop_expired(db, rows, skip)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error expiring holds: {str(e)}")
+        return 0
+    hold_metrics.incr("expired", expired)
+    logger.info(f"Expired {expired} hold(s)")
+    return expired
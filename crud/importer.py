@@ -0,0 +1,240 @@
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from pydantic import ValidationError
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+from models import Customer, Play, Showtime
+from schemas import CustomerCreate, PlayCreate, ShowtimeCreate
+from crud import catalog_cache
+from crud import schedule as crud_schedule
+from crud import versions as crud_versions
+import csv
+import io
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+# Cap on per-row errors kept in a report; the total is always counted.
+MAX_REPORTED_ERRORS = 1000
+
+# kind -> (create schema, model, upsert key columns or None for plain inserts)
+IMPORTERS = {
+    "plays": (PlayCreate, Play, ("title",)),
+    "customers": (CustomerCreate, Customer, ("email",)),
+    "showtimes": (ShowtimeCreate, Showtime, None),
+}
+
+
+class ImportReport:
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.rows_read = 0
+        self.rows_loaded = 0
+        self.error_count = 0
+        self.errors: List[Dict] = []
+
+    def add_error(self, line: int, error: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+    def as_dict(self) -> Dict:
+        return {
+            "kind": self.kind,
+            "rows_read": self.rows_read,
+            "rows_loaded": self.rows_loaded,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
+
+
+def read_chunks(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Tuple[int, Dict]]]:
+    """Yield ``(line_number, record)`` lists of at most ``chunk_size`` rows from a CSV with a header."""
+    reader = csv.DictReader(stream)
+    chunk = []
+    for record in reader:
+        # Blank cells mean "not provided" so schema defaults apply.
+        chunk.append((reader.line_num, {k: v for k, v in record.items() if v not in ("", None)}))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate(schema, model, chunk, key_columns, report: ImportReport) -> List[Tuple[int, Dict]]:
+    """The valid rows of ``chunk`` as ``(line_number, row)``; invalid ones go to the report."""
+    columns = set(model.__table__.c.keys())
+    rows: Dict = {}
+    for line, record in chunk:
+        try:
+            data = schema(**record).model_dump()
+        except ValidationError as e:
+            report.add_error(line, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+            continue
+        row = {k: v for k, v in data.items() if k in columns}
+        # A key repeated inside one chunk would hit the same row twice in a
+        # single upsert statement; the last occurrence wins, as it would row by row.
+        # A NULL in the key never conflicts, so such rows are all kept.
+        key = tuple(row.get(c) for c in key_columns or ())
+        if not key or None in key:
+            key = line
+        rows[key] = (line, row)
+    return list(rows.values())
+
+
+def _upsert(db: Session, model, rows: List[Dict], key_columns: Optional[Sequence[str]]) -> int:
+    """Load ``rows``; returns how many were inserted or updated (ON CONFLICT DO NOTHING skips the rest)."""
+    if not key_columns:
+        ids = list(db.execute(insert(model).returning(model.id), rows).scalars())
+        if model is Showtime:
+            crud_schedule.refresh_entries(db, ids)
+        return len(ids)
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise HTTPException(status_code=500, detail=f"Upsert import not supported on {dialect}")
+    stmt = dialect_insert(model)
+    updates = {c: stmt.excluded[c] for c in rows[0] if c not in key_columns}
+    if updates:
+        updates.update(crud_versions.upsert_bump(model))
+        stmt = stmt.on_conflict_do_update(index_elements=list(key_columns), set_=updates)
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(key_columns))
+    # RETURNING only yields the rows that were actually written.
+    return len(db.execute(stmt.returning(model.id), rows).all())
+
+
+def _copy_from(conn, sql: str, buffer: io.StringIO) -> None:
+    """Run ``COPY ... FROM STDIN`` on the raw DBAPI connection, psycopg 3 or psycopg2."""
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if hasattr(cursor, "copy"):
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+        else:
+            cursor.copy_expert(sql, buffer)
+    finally:
+        cursor.close()
+
+
+def _copy_upsert(db: Session, model, rows: List[Dict], key_columns: Optional[Sequence[str]]) -> int:
+    """
+    PostgreSQL fast path: COPY the chunk into a temp staging table, then move
+    it with one INSERT ... SELECT ... ON CONFLICT. Returns the rows written,
+    like _upsert().
+    """
+    table = model.__table__.name
+    staging = f"_import_{table}"
+    columns = list(rows[0].keys())
+    column_list = ", ".join(columns)
+    conn = db.connection()
+    conn.exec_driver_sql(
+        f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+        f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([r"\N" if row.get(c) is None else row.get(c) for c in columns])
+    buffer.seek(0)
+    _copy_from(conn, f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+
+    sql = f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging}"
+    if key_columns:
+        updates = [c for c in columns if c not in key_columns]
+        conflict = ", ".join(key_columns)
+        if updates:
+            sql += f" ON CONFLICT ({conflict}) DO UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in updates)
+            if "version" in model.__table__.c:
+                sql += f", version = {table}.version + 1"
+            if "updated_at" in model.__table__.c:
+                sql += ", updated_at = now() at time zone 'utc'"
+        else:
+            sql += f" ON CONFLICT ({conflict}) DO NOTHING"
+    written = conn.exec_driver_sql(sql).rowcount
+    conn.exec_driver_sql(f"TRUNCATE {staging}")
+    return written
+
+
+def _reason(e: SQLAlchemyError) -> str:
+    """First line of the driver's message, without SQL or parameters."""
+    message = str(getattr(e, "orig", None) or e.__class__.__name__).strip()
+    return message.splitlines()[0] if message else e.__class__.__name__
+
+
+def _load_rows_one_by_one(db: Session, kind: str, model, rows, key_columns, report: ImportReport) -> int:
+    """
+    Fallback for a chunk the database rejected: load each row in its own
+    savepoint so only the offending rows are reported and the rest still go in.
+    """
+    loaded = 0
+    for line, row in rows:
+        try:
+            with db.begin_nested():
+                loaded += _upsert(db, model, [row], key_columns)
+        except SQLAlchemyError as e:
+            logger.warning(f"Error importing {kind} line {line}: {str(e)}")
+            report.add_error(line, f"Rejected by the database: {_reason(e)}")
+    db.commit()
+    return loaded
+
+
+def import_csv(
+        db: Session,
+        kind: str,
+        stream: TextIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_copy: bool = False
+) -> ImportReport:
+    """
+    Stream a CSV file into ``kind`` in chunks, one transaction per chunk.
+
+    Every row is validated with the resource's create schema; invalid rows are
+    reported by line number and skipped, the rest of the chunk is loaded.
+    Should the database reject a chunk, it is loaded again row by row and
+    only the rows it still rejects are reported. Duplicate ``title``/``email``
+    values update the existing row; ``rows_loaded`` counts rows written.
+    """
+    if kind not in IMPORTERS:
+        raise HTTPException(status_code=400, detail=f"Unknown import kind '{kind}'")
+    schema, model, key_columns = IMPORTERS[kind]
+    if use_copy and not key_columns:
+        # Plain inserts gain little from COPY and must feed the schedule buckets.
+        use_copy = False
+    if use_copy and db.bind.dialect.name != "postgresql":
+        raise HTTPException(status_code=400, detail="COPY import requires PostgreSQL")
+
+    report = ImportReport(kind)
+    for chunk in read_chunks(stream, chunk_size):
+        report.rows_read += len(chunk)
+        rows = _validate(schema, model, chunk, key_columns, report)
+        if not rows:
+            continue
+        try:
+            load = _copy_upsert if use_copy else _upsert
+            loaded = load(db, model, [row for _, row in rows], key_columns)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning(f"Error importing {kind} lines {chunk[0][0]}-{chunk[-1][0]}, retrying row by row: {str(e)}")
+            try:
+                loaded = _load_rows_one_by_one(db, kind, model, rows, key_columns, report)
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.error(f"Error importing {kind} lines {chunk[0][0]}-{chunk[-1][0]}: {str(e)}")
+                report.add_error(chunk[0][0], f"Chunk ending at line {chunk[-1][0]} rejected by the database: {_reason(e)}")
+                continue
+        report.rows_loaded += loaded
+
+    if kind == "plays" and report.rows_loaded:
+        catalog_cache.invalidate(Play)
+    logger.info(
+        f"Imported {kind}: {report.rows_loaded}/{report.rows_read} rows, {report.error_count} errors"
+    )
+    return report
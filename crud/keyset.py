@@ -0,0 +1,86 @@
+from fastapi import HTTPException
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import tuple_
+import base64
+import datetime
+import json
+
+# Hard cap on page size for every list endpoint.
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [v.isoformat() if isinstance(v, (datetime.date, datetime.datetime)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        decoded = []
+        for key, value in zip(keys, values):
+            python_type = key.type.python_type
+            if python_type is datetime.datetime:
+                value = datetime.datetime.fromisoformat(value)
+            elif python_type is datetime.date:
+                value = datetime.date.fromisoformat(value)
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError, NotImplementedError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def apply_keyset(query, keys: Sequence, cursor: Optional[str], limit: int):
+    """
+    Order ``query`` (a Query or Select) by ``keys`` and seek past ``cursor``.
+
+    One extra row is fetched so page_of() can tell whether a next page exists.
+    ``keys`` must end in a unique column and be backed by an index so each page
+    is a bounded index range scan, independent of how deep it is.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        if len(keys) == 1:
+            query = query.filter(keys[0] > values[0])
+        else:
+            query = query.filter(tuple_(*keys) > tuple_(*values))
+    return query.order_by(*keys).limit(limit + 1)
+
+
+def page_of(rows: List[Any], keys: Sequence, limit: int) -> Tuple[List[Any], Optional[str]]:
+    """Split the over-fetched result into ``(items, next_cursor)``."""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if len(rows) <= limit:
+        return rows, None
+    items = rows[:limit]
+    last = items[-1]
+    return items, encode_cursor([getattr(last, key.key) for key in keys])
+
+
+def paginate(query, keys: Sequence, cursor: Optional[str], limit: int) -> Tuple[List[Any], Optional[str]]:
+    return page_of(apply_keyset(query, keys, cursor, limit).all(), keys, limit)
+
+
+def response_columns(model, response_model) -> tuple:
+    """
+    The columns of ``model`` behind every field of ``response_model``, for the
+    select() passed to paginate_rows(). Derived from the response model so a
+    field added there cannot go missing from the column-only list path.
+    """
+    return tuple(getattr(model, name) for name in response_model.model_fields)
+
+
+def paginate_rows(db, stmt, keys: Sequence, cursor: Optional[str], limit: int) -> Tuple[List[dict], Optional[str]]:
+    """
+    Like paginate() for a column-only select(): returns plain dicts, so list
+    endpoints can encode them directly without building ORM objects or
+    re-validating each row through a response model. ``stmt`` must select
+    every column in ``keys``.
+    """
+    rows, next_cursor = page_of(db.execute(apply_keyset(stmt, keys, cursor, limit)).all(), keys, limit)
+    return [row._asdict() for row in rows], next_cursor
@@ -0,0 +1,99 @@
+from collections import defaultdict
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased, joinedload, noload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import List, Optional
+from models import CONFIRMED, Showtime, Ticket
+import config
+
+# Named loading profiles that list endpoints accept via ?expand=a,b.
+#
+# Many-to-one relations are joined into the page query; collections are
+# fetched after it with one extra SELECT per relation (see POST_LOADERS).
+# Relations that were not requested are switched to noload so serializing a
+# page can never fall back to one lazy load per row.
+EXPANSIONS = {
+    Ticket: {
+        "showtime": lambda: joinedload(Ticket.showtime).noload(Showtime.play),
+        "showtime.play": lambda: joinedload(Ticket.showtime).joinedload(Showtime.play),
+        "customer": lambda: joinedload(Ticket.customer),
+    },
+    Showtime: {
+        "play": lambda: joinedload(Showtime.play),
+        # Filled by load_tickets() once the page is known.
+        "tickets": lambda: noload(Showtime.tickets),
+    },
+}
+
+_RELATIONS = {
+    Ticket: (Ticket.showtime, Ticket.customer),
+    Showtime: (Showtime.play, Showtime.tickets),
+}
+
+
+def parse_expand(model, expand: Optional[str]) -> List[str]:
+    if not expand:
+        return []
+    names = [name.strip() for name in expand.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXPANSIONS[model]]
+    if unknown:
+        allowed = ", ".join(sorted(EXPANSIONS[model]))
+        raise HTTPException(status_code=400, detail=f"Unknown expand {unknown}; allowed: {allowed}")
+    return names
+
+
+def apply_expand(query, model, expand: Optional[str]):
+    """Add the loader options for ``expand`` to a Query or Select."""
+    names = parse_expand(model, expand)
+    # A nested profile already loads its parent; keep one strategy per path.
+    names = [name for name in names if not any(other.startswith(name + ".") for other in names)]
+    requested = {name.split(".")[0] for name in names}
+    options = [EXPANSIONS[model][name]() for name in names]
+    options += [noload(rel) for rel in _RELATIONS[model] if rel.key not in requested]
+    return query.options(*options)
+
+
+def load_tickets(db: Session, showtimes: List[Showtime]) -> None:
+    """
+    Fill ``tickets`` of a page of showtimes with one windowed SELECT.
+
+    A plain SELECT ... IN would bring every ticket of a sold-out house into
+    the page; instead each showtime gets its first EXPAND_TICKETS_LIMIT
+    confirmed tickets in id order, and ``tickets_truncated`` marks the ones
+    that have more.
+    """
+    if not showtimes:
+        return
+    limit = config.EXPAND_TICKETS_LIMIT
+    ranked = select(
+        Ticket,
+        func.row_number().over(partition_by=Ticket.showtime_id, order_by=Ticket.id).label("rank")
+    ).where(
+        Ticket.showtime_id.in_([showtime.id for showtime in showtimes]),
+        Ticket.status == CONFIRMED
+    ).subquery()
+    ticket = aliased(Ticket, ranked)
+    by_showtime = defaultdict(list)
+    # One past the limit tells a full list from a truncated one.
+    for row in db.execute(
+        select(ticket).where(ranked.c.rank <= limit + 1).order_by(ranked.c.showtime_id, ranked.c.id)
+    ).scalars():
+        by_showtime[row.showtime_id].append(row)
+    for showtime in showtimes:
+        tickets = by_showtime.get(showtime.id, [])
+        set_committed_value(showtime, "tickets", tickets[:limit])
+        showtime.tickets_truncated = len(tickets) > limit
+
+
+POST_LOADERS = {
+    Showtime: {"tickets": load_tickets},
+}
+
+
+def load_expanded(db: Session, model, rows: List, expand: Optional[str]) -> None:
+    """Run the loaders of ``expand`` that need the page itself; call after the page query."""
+    for name in parse_expand(model, expand):
+        loader = POST_LOADERS.get(model, {}).get(name)
+        if loader is not None:
+            loader(db, rows)
@@ -1,12 +1,26 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from fastapi import HTTPException, status
-from typing import List, Optional
-from models import Play
+from typing import List, Optional, Tuple
+from models import Play, PlaySales
 from schemas import PlayCreate, PlayUpdate
+from crud.keyset import paginate, paginate_rows, response_columns
+from crud import batch as crud_batch
+from crud import catalog_cache
+from crud import credits as crud_credits
+from crud import schedule as crud_schedule
+from crud import versions as crud_versions
 import logging
+import schemas
 
-logger = logging.getLogger(_name_)
+logger = logging.getLogger(__name__)
+
+# Keyset sort order for list pages; must match an index on the table.
+PAGE_KEYS = (Play.id,)
+
+# Columns of the Play response, for the column-only list path.
+LIST_COLUMNS = response_columns(Play, schemas.Play)
 
 
 def create_play(db: Session, play: PlayCreate) -> Play:
@@ -15,15 +29,15 @@ def create_play(db: Session, play: PlayCreate) -> Play:
             title=play.title,
             genre=play.genre,
             duration_minutes=play.duration_minutes,
-            description=play.description,
-            release_date=play.release_date
+            description=play.description
         )
 
         db.add(db_play)
         db.commit()
         db.refresh(db_play)
+        catalog_cache.invalidate(Play)
 
-        logger.info(f"Created new play: ID={db_play.play_id}, Title={db_play.title}")
+        logger.info(f"Created new play: ID={db_play.id}, Title={db_play.title}")
         return db_play
 
     except SQLAlchemyError as e:
@@ -43,7 +57,10 @@ def create_play(db: Session, play: PlayCreate) -> Play:
 
 def get_play(db: Session, play_id: int) -> Optional[Play]:
     try:
-        return db.query(Play).filter(Play.play_id == play_id).first()
+        return catalog_cache.get_one(
+            db, Play, play_id,
+            lambda: db.query(Play).filter(Play.id == play_id).first()
+        )
     except SQLAlchemyError as e:
         logger.error(f"Error fetching play ID {play_id}: {str(e)}")
         raise HTTPException(
@@ -52,21 +69,29 @@ def get_play(db: Session, play_id: int) -> Optional[Play]:
         )
 
 
+def filter_plays(query, genre: Optional[str] = None, director_id: Optional[int] = None):
+    """Apply the list filters to a Query or Select."""
+    if genre:
+        query = query.filter(Play.genre.ilike(f"%{genre}%"))
+
+    if director_id:
+        query = crud_credits.plays_with(query, "directors", director_id)
+    return query
+
+
 def get_plays(
         db: Session,
-        skip: int = 0,
+        cursor: Optional[str] = None,
         limit: int = 100,
         genre: Optional[str] = None,
         director_id: Optional[int] = None
-) -> List[Play]:
+) -> Tuple[List[Play], Optional[str]]:
     try:
-        query = db.query(Play)
-        if genre:
-            query = query.filter(Play.genre.ilike(f"%{genre}%"))
-
-        if director_id:
-            query = query.filter(Play.directors.any(director_id=director_id))
-        return query.offset(skip).limit(limit).all()
+        query = filter_plays(db.query(Play), genre, director_id)
+        return catalog_cache.get_page(
+            db, Play, (cursor, limit, genre, director_id),
+            lambda: paginate(query, PAGE_KEYS, cursor, limit)
+        )
 
     except SQLAlchemyError as e:
         logger.error(f"Error fetching plays: {str(e)}")
@@ -76,104 +101,136 @@ def get_plays(
         )
 
 
-def update_play(db: Session, play_id: int, play: PlayUpdate) -> Optional[Play]:
+def get_play_rows(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        genre: Optional[str] = None,
+        director_id: Optional[int] = None
+) -> Tuple[List[dict], Optional[str]]:
     try:
-        db_play = get_play(db, play_id)
-        if not db_play:
-            logger.warning(f"Update failed: Play ID {play_id} not found")
-            return None
-
-        update_data = play.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_play, field, value)
+        stmt = filter_plays(select(*LIST_COLUMNS), genre, director_id)
+        return catalog_cache.get_rows(
+            Play, (cursor, limit, genre, director_id),
+            lambda: paginate_rows(db, stmt, PAGE_KEYS, cursor, limit)
+        )
 
+    except SQLAlchemyError as e:
+        logger.error(f"Error fetching plays: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error occurred"
+        )
 
-        db.commit()
-        db.refresh(db_play)
 
-        logger.info(f"Updated play ID {play_id}")
-        return db_play
+def get_play_versions(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        genre: Optional[str] = None,
+        director_id: Optional[int] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """The (id, version) rows of one list page; enough to tell whether the page changed."""
+    try:
+        stmt = filter_plays(select(Play.id, Play.version), genre, director_id)
+        return catalog_cache.get_rows(
+            Play, ("versions", cursor, limit, genre, director_id),
+            lambda: paginate_rows(db, stmt, PAGE_KEYS, cursor, limit)
+        )
 
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error updating play ID {play_id}: {str(e)}")
+        logger.error(f"Error fetching play versions: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error occurred"
         )
 
 
-def delete_play(db: Session, play_id: int) -> bool:
+def update_play(
+        db: Session,
+        play_id: int,
+        play: PlayUpdate,
+        expected_version: Optional[int] = None
+) -> Play:
+    """Apply a partial update with a single ``UPDATE ... RETURNING``; no load, no refresh."""
     try:
-        db_play = get_play(db, play_id)
-        if not db_play:
-            logger.warning(f"Delete failed: Play ID {play_id} not found")
-            return False
+        update_data = play.model_dump(exclude_unset=True)
+        db_play = crud_versions.update_row(db, Play, play_id, update_data, expected_version)
+        if "title" in update_data:
+            crud_schedule.rename_play(db, play_id, db_play.title)
 
-        db.delete(db_play)
         db.commit()
-        logger.info(f"Deleted play ID {play_id}")
-        return True
+        catalog_cache.invalidate(Play, play_id)
 
+        logger.info(f"Updated play ID {play_id}")
+        return crud_versions.as_instance(Play, db_play)
+
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A play with this title already exists"
+        )
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Error deleting play ID {play_id}: {str(e)}")
+        logger.error(f"Error updating play ID {play_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error occurred"
         )
 
 
-def add_director_to_play(db: Session, play_id: int, director_id: int) -> bool:
+def delete_play(db: Session, play_id: int, expected_version: Optional[int] = None) -> bool:
     """
-    Associate a director with a play (many-to-many relationship)
+    Remove a play with one ``DELETE ... RETURNING``. Credits cascade; an empty
+    sales rollup row goes with it, while remaining showtimes refuse with 409.
     """
     try:
-        play = get_play(db, play_id)
-        if not play:
-            logger.warning(f"Add director failed: Play ID {play_id} not found")
-            return False
-
-        if any(d.director_id == director_id for d in play.directors):
-            logger.info(f"Director {director_id} already associated with play {play_id}")
-            return True
-
-        play.directors.append(director_id)
+        db.query(PlaySales).filter(
+            PlaySales.play_id == play_id, PlaySales.sold == 0
+        ).delete(synchronize_session=False)
+        crud_versions.delete_row(db, Play, play_id, expected_version)
         db.commit()
-        logger.info(f"Added director {director_id} to play {play_id}")
+        catalog_cache.invalidate(Play, play_id)
+        logger.info(f"Deleted play ID {play_id}")
         return True
 
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Play still has showtimes"
+        )
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Error adding director to play: {str(e)}")
+        logger.error(f"Error deleting play ID {play_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error occurred"
         )
 
 
+def add_director_to_play(db: Session, play_id: int, director_id: int) -> bool:
+    """
+    Associate a director with a play (many-to-many relationship)
+    """
+    crud_credits.add_credits(db, play_id, "directors", [director_id])
+    return True
+
+
 def remove_director_from_play(db: Session, play_id: int, director_id: int) -> bool:
-    try:
-        play = get_play(db, play_id)
-        if not play:
-            logger.warning(f"Remove director failed: Play ID {play_id} not found")
-            return False
+    return crud_credits.remove_credits(db, play_id, "directors", [director_id]) > 0
 
-        initial_count = len(play.directors)
-        play.directors = [d for d in play.directors if d.director_id != director_id]
 
-        if len(play.directors) == initial_count:
-            logger.info(f"Director {director_id} not associated with play {play_id}")
-            return False
+def get_plays_by_ids(db: Session, ids: List[int]) -> Tuple[List[Optional[Play]], List[int]]:
+    return crud_batch.get_many(db, Play, ids)
 
-        db.commit()
-        logger.info(f"Removed director {director_id} from play {play_id}")
-        return True
 
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error removing director from play: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error occurred"
-        )
+def get_play_version(db: Session, play_id: int) -> Optional[int]:
+    return crud_versions.get_version(db, Play, play_id)
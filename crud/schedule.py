@@ -0,0 +1,102 @@
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from typing import Dict, Iterable, List, Optional
+from datetime import date, datetime, timedelta
+from models import Play, ScheduleEntry, Showtime
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_WINDOW_DAYS = 31
+
+
+def refresh_entries(db: Session, showtime_ids: Iterable[int]) -> None:
+    """Re-derive the schedule rows of ``showtime_ids`` inside the caller's transaction."""
+    showtime_ids = list(showtime_ids)
+    if not showtime_ids:
+        return
+    db.query(ScheduleEntry).filter(
+        ScheduleEntry.showtime_id.in_(showtime_ids)
+    ).delete(synchronize_session=False)
+    rows = db.query(
+        Showtime.id, Showtime.show_date, Showtime.location, Showtime.play_id, Play.title
+    ).outerjoin(Play, Play.id == Showtime.play_id).filter(Showtime.id.in_(showtime_ids)).all()
+    if rows:
+        db.execute(insert(ScheduleEntry), [
+            {
+                "showtime_id": row.id,
+                "show_day": row.show_date.date(),
+                "location": row.location,
+                "show_date": row.show_date,
+                "play_id": row.play_id,
+                "play_title": row.title,
+            }
+            for row in rows
+        ])
+
+
+def remove_entries(db: Session, showtime_ids: Iterable[int]) -> None:
+    db.query(ScheduleEntry).filter(
+        ScheduleEntry.showtime_id.in_(list(showtime_ids))
+    ).delete(synchronize_session=False)
+
+
+def rename_play(db: Session, play_id: int, title: str) -> None:
+    db.query(ScheduleEntry).filter(ScheduleEntry.play_id == play_id).update(
+        {ScheduleEntry.play_title: title}, synchronize_session=False
+    )
+
+
+def rebuild_schedule(db: Session) -> int:
+    """Recreate every schedule row from showtimes and plays; returns the row count."""
+    try:
+        db.query(ScheduleEntry).delete(synchronize_session=False)
+        ids = [row.id for row in db.query(Showtime.id)]
+        for start in range(0, len(ids), 5000):
+            refresh_entries(db, ids[start:start + 5000])
+        db.commit()
+        logger.info(f"Rebuilt {len(ids)} schedule entries")
+        return len(ids)
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error rebuilding schedule: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+def get_window(db: Session, first_day: date, days: int, location: Optional[str] = None) -> List[ScheduleEntry]:
+    if not 1 <= days <= MAX_WINDOW_DAYS:
+        raise HTTPException(status_code=400, detail=f"Window must be 1-{MAX_WINDOW_DAYS} days")
+    query = db.query(ScheduleEntry).filter(
+        ScheduleEntry.show_day >= first_day,
+        ScheduleEntry.show_day < first_day + timedelta(days=days)
+    )
+    if location is not None:
+        query = query.filter(ScheduleEntry.location == location)
+    return query.order_by(ScheduleEntry.show_day, ScheduleEntry.location, ScheduleEntry.show_date).all()
+
+
+def get_grid(db: Session, first_day: date, days: int, location: Optional[str] = None) -> Dict[str, Dict[str, List[ScheduleEntry]]]:
+    """``{day: {location: [entries by start time]}}`` for ``days`` days from ``first_day``."""
+    grid: Dict[str, Dict[str, List[ScheduleEntry]]] = {
+        (first_day + timedelta(days=n)).isoformat(): {} for n in range(days)
+    }
+    for entry in get_window(db, first_day, days, location):
+        grid[entry.show_day.isoformat()].setdefault(entry.location or "", []).append(entry)
+    return grid
+
+
+def get_between(db: Session, location: str, start: datetime, end: datetime) -> List[ScheduleEntry]:
+    """Showtimes at ``location`` starting in ``[start, end)``."""
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if (end.date() - start.date()).days >= MAX_WINDOW_DAYS:
+        raise HTTPException(status_code=400, detail=f"Window must be 1-{MAX_WINDOW_DAYS} days")
+    return db.query(ScheduleEntry).filter(
+        ScheduleEntry.show_day >= start.date(),
+        ScheduleEntry.show_day <= end.date(),
+        ScheduleEntry.location == location,
+        ScheduleEntry.show_date >= start,
+        ScheduleEntry.show_date < end
+    ).order_by(ScheduleEntry.show_date).all()
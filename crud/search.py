@@ -0,0 +1,63 @@
+from sqlalchemy import case, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+from typing import List, Optional, Sequence
+from models import Actor, Director, Play, SEARCH_FIELDS
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TYPES = {"plays": Play, "actors": Actor, "directors": Director}
+MAX_RESULTS = 100
+
+
+def _postgres_branch(kind: str, model, term: str):
+    name, body, vector = SEARCH_FIELDS[model]
+    query = func.websearch_to_tsquery(literal("english"), term)
+    # Full-text rank covers words in name and body; trigram similarity on the
+    # name adds typo tolerance ("hamlat" -> "Hamlet"). Both predicates are
+    # answered by GIN indexes.
+    score = func.ts_rank_cd(vector, query) + func.similarity(name, term)
+    return select(
+        literal(kind).label("type"),
+        model.id.label("id"),
+        name.label("name"),
+        score.label("score"),
+    ).where(or_(vector.op("@@")(query), name.op("%")(term)))
+
+
+def _fallback_branch(kind: str, model, term: str):
+    name, body, _ = SEARCH_FIELDS[model]
+    pattern = f"%{term}%"
+    # Unindexed scan for SQLite/dev databases; name matches rank first.
+    score = case((name.ilike(pattern), 1.0), else_=0.0)
+    return select(
+        literal(kind).label("type"),
+        model.id.label("id"),
+        name.label("name"),
+        score.label("score"),
+    ).where(or_(name.ilike(pattern), body.ilike(pattern)))
+
+
+def search(db: Session, term: str, types: Optional[Sequence[str]] = None, limit: int = 20) -> List:
+    term = term.strip()
+    if not term:
+        raise HTTPException(status_code=400, detail="Empty search term")
+    types = list(types) if types else list(SEARCH_TYPES)
+    unknown = [t for t in types if t not in SEARCH_TYPES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown search types {unknown}")
+    limit = max(1, min(limit, MAX_RESULTS))
+
+    branch = _postgres_branch if db.bind.dialect.name == "postgresql" else _fallback_branch
+    combined = union_all(*(branch(kind, SEARCH_TYPES[kind], term) for kind in types)).subquery()
+    stmt = select(combined).order_by(combined.c.score.desc(), combined.c.name).limit(limit)
+    try:
+        return db.execute(stmt).all()
+    except SQLAlchemyError as e:
+        logger.error(f"Error searching for '{term}': {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error occurred"
+        )
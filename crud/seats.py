@@ -0,0 +1,346 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi import HTTPException
+from typing import Callable, List, Optional, Tuple
+from models import HELD, SeatInventory, Showtime, Ticket
+from crud import availability as crud_availability
+import logging
+import random
+import string
+import time
+
+logger = logging.getLogger(__name__)
+
+# Number of compare-and-swap attempts before giving up on a busy seat map.
+MAX_CAS_RETRIES = 50
+
+
+def normalize(seat: str) -> str:
+    """Canonical spelling of a free-form seat number, so "b5" and "B5" are one seat."""
+    return seat.strip().upper()
+
+
+class SeatMap:
+    """Bitmap over an auditorium layout, one bit per seat."""
+
+    def __init__(self, rows: int, seats_per_row: int, bits: bytes = None):
+        self.rows = rows
+        self.seats_per_row = seats_per_row
+        self.capacity = rows * seats_per_row
+        size = (self.capacity + 7) // 8
+        self.bits = bytearray(bits) if bits is not None else bytearray(size)
+        if len(self.bits) != size:
+            raise ValueError("Bitmap size does not match layout")
+
+    @staticmethod
+    def row_label(row: int) -> str:
+        label = ""
+        row += 1
+        while row:
+            row, rem = divmod(row - 1, 26)
+            label = string.ascii_uppercase[rem] + label
+        return label
+
+    @staticmethod
+    def row_index(label: str) -> int:
+        row = 0
+        for char in label:
+            row = row * 26 + (ord(char) - ord("A") + 1)
+        return row - 1
+
+    def index(self, seat: str) -> int:
+        seat = seat.strip().upper()
+        letters = seat.rstrip(string.digits)
+        number = seat[len(letters):]
+        if not letters or not number or not letters.isalpha():
+            raise ValueError(f"Invalid seat label '{seat}'")
+        row = self.row_index(letters)
+        col = int(number) - 1
+        if not (0 <= row < self.rows and 0 <= col < self.seats_per_row):
+            raise ValueError(f"Seat '{seat}' is outside the auditorium layout")
+        return row * self.seats_per_row + col
+
+    def label(self, index: int) -> str:
+        row, col = divmod(index, self.seats_per_row)
+        return f"{self.row_label(row)}{col + 1}"
+
+    def is_set(self, index: int) -> bool:
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def set(self, index: int) -> None:
+        self.bits[index >> 3] |= 1 << (index & 7)
+
+    def clear(self, index: int) -> None:
+        self.bits[index >> 3] &= ~(1 << (index & 7))
+
+    def count(self) -> int:
+        return sum(bin(byte).count("1") for byte in self.bits)
+
+    def labels(self) -> List[str]:
+        return [self.label(i) for i in range(self.capacity) if self.is_set(i)]
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.bits)
+
+
+def _backfill(db: Session, showtime_id: int, reserved: SeatMap, sold: SeatMap) -> None:
+    """Mark the seats of tickets issued before the inventory existed: held ones reserved, the rest sold."""
+    misfits = []
+    for seat_number, status in db.query(Ticket.seat_number, Ticket.status).filter(Ticket.showtime_id == showtime_id):
+        try:
+            index = reserved.index(seat_number or "")
+        except ValueError:
+            misfits.append(str(seat_number))
+            continue
+        if reserved.is_set(index) or sold.is_set(index):
+            misfits.append(str(seat_number))
+            continue
+        (reserved if status == HELD else sold).set(index)
+    if misfits:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Existing tickets do not fit the layout: {', '.join(sorted(misfits))}"
+        )
+
+
+def create_seat_inventory(db: Session, showtime_id: int, rows: int, seats_per_row: int) -> SeatInventory:
+    """
+    Create the seat map of a showtime, with the seats of its existing tickets
+    already taken. The showtime row stays locked until commit, so a ticket
+    write that is checking for an inventory (see _has_inventory) either
+    commits before the backfill reads the tickets or waits and uses the map.
+    """
+    if rows <= 0 or seats_per_row <= 0:
+        raise HTTPException(status_code=400, detail="Layout must have at least one seat")
+    try:
+        if not db.query(Showtime.id).filter(Showtime.id == showtime_id).with_for_update().first():
+            raise HTTPException(status_code=404, detail="Showtime not found")
+        reserved = SeatMap(rows, seats_per_row)
+        sold = SeatMap(rows, seats_per_row)
+        _backfill(db, showtime_id, reserved, sold)
+        inventory = SeatInventory(
+            showtime_id=showtime_id,
+            rows=rows,
+            seats_per_row=seats_per_row,
+            reserved=reserved.to_bytes(),
+            sold=sold.to_bytes(),
+            version=0
+        )
+        db.add(inventory)
+        db.flush()
+        crud_availability.set_capacity(db, showtime_id, rows * seats_per_row)
+        db.commit()
+        db.refresh(inventory)
+        logger.info(f"Created seat inventory for showtime ID={showtime_id} ({rows}x{seats_per_row})")
+        return inventory
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Seat inventory already exists")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error creating seat inventory: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+def get_seat_inventory(db: Session, showtime_id: int) -> SeatInventory:
+    inventory = db.query(SeatInventory).filter(SeatInventory.showtime_id == showtime_id).first()
+    if not inventory:
+        raise HTTPException(status_code=404, detail="Seat inventory not found")
+    return inventory
+
+
+def backoff(attempt: int) -> float:
+    """Seconds to wait before compare-and-swap attempt ``attempt + 1``."""
+    return random.uniform(0, 0.001 * (attempt + 1))
+
+
+def try_swap(
+        db: Session,
+        showtime_id: int,
+        seats: List[str],
+        mutate: Callable[[SeatMap, SeatMap, List[int]], None],
+        strict: bool = True
+) -> Optional[Tuple[SeatMap, SeatMap]]:
+    """
+    One compare-and-swap attempt; None when another writer moved the version
+    first. Without ``strict``, seats that do not map onto the layout (labels
+    from before the inventory existed) are skipped instead of rejected, so
+    giving seats back never fails on them.
+    """
+    current = db.query(
+        SeatInventory.rows,
+        SeatInventory.seats_per_row,
+        SeatInventory.reserved,
+        SeatInventory.sold,
+        SeatInventory.version
+    ).filter(SeatInventory.showtime_id == showtime_id).first()
+    if not current:
+        raise HTTPException(status_code=404, detail="Seat inventory not found")
+
+    reserved = SeatMap(current.rows, current.seats_per_row, current.reserved)
+    sold = SeatMap(current.rows, current.seats_per_row, current.sold)
+    indexes = []
+    for seat in seats:
+        try:
+            indexes.append(reserved.index(seat or ""))
+        except ValueError as e:
+            if strict:
+                raise HTTPException(status_code=400, detail=str(e))
+            logger.warning(f"Skipping seat {seat!r} of showtime ID={showtime_id}: {e}")
+    if len(set(indexes)) != len(indexes):
+        if strict:
+            raise HTTPException(status_code=400, detail="Duplicate seats in request")
+        indexes = list(dict.fromkeys(indexes))
+
+    mutate(reserved, sold, indexes)
+
+    updated = db.query(SeatInventory).filter(
+        SeatInventory.showtime_id == showtime_id,
+        SeatInventory.version == current.version
+    ).update(
+        {
+            SeatInventory.reserved: reserved.to_bytes(),
+            SeatInventory.sold: sold.to_bytes(),
+            SeatInventory.version: current.version + 1
+        },
+        synchronize_session=False
+    )
+    return (reserved, sold) if updated else None
+
+
+def busy(showtime_id: int) -> HTTPException:
+    logger.warning(f"Seat map for showtime ID={showtime_id} busy after {MAX_CAS_RETRIES} attempts")
+    return HTTPException(status_code=503, detail="Seat map busy, please retry")
+
+
+def _swap(
+        db: Session,
+        showtime_id: int,
+        seats: List[str],
+        mutate: Callable[[SeatMap, SeatMap, List[int]], None],
+        strict: bool = True
+) -> Tuple[SeatMap, SeatMap]:
+    """
+    Apply ``mutate`` to the seat bitmaps with an optimistic compare-and-swap.
+
+    Only the inventory row of this showtime is written, guarded by its version
+    column, so concurrent buyers never take more than a single row lock. The
+    caller owns the transaction and must commit or roll back.
+    """
+    for attempt in range(MAX_CAS_RETRIES):
+        result = try_swap(db, showtime_id, seats, mutate, strict)
+        if result is not None:
+            return result
+        # Lost the race to another process; back off briefly and re-read.
+        time.sleep(backoff(attempt))
+    raise busy(showtime_id)
+
+
+def _unavailable(reserved: SeatMap, sold: SeatMap, indexes: List[int]) -> List[str]:
+    return [reserved.label(i) for i in indexes if reserved.is_set(i) or sold.is_set(i)]
+
+
+def _do_reserve(reserved: SeatMap, sold: SeatMap, indexes: List[int]) -> None:
+    taken = _unavailable(reserved, sold, indexes)
+    if taken:
+        raise HTTPException(status_code=409, detail=f"Seats not available: {', '.join(taken)}")
+    for i in indexes:
+        reserved.set(i)
+
+
+def _do_release(reserved: SeatMap, sold: SeatMap, indexes: List[int]) -> None:
+    for i in indexes:
+        reserved.clear(i)
+
+
+def _do_confirm(reserved: SeatMap, sold: SeatMap, indexes: List[int]) -> None:
+    missing = [reserved.label(i) for i in indexes if not reserved.is_set(i)]
+    if missing:
+        raise HTTPException(status_code=409, detail=f"Seats not reserved: {', '.join(missing)}")
+    for i in indexes:
+        reserved.clear(i)
+        sold.set(i)
+
+
+def _do_sell(reserved: SeatMap, sold: SeatMap, indexes: List[int]) -> None:
+    taken = _unavailable(reserved, sold, indexes)
+    if taken:
+        raise HTTPException(status_code=409, detail=f"Seats not available: {', '.join(taken)}")
+    for i in indexes:
+        sold.set(i)
+
+
+def _do_unsell(reserved: SeatMap, sold: SeatMap, indexes: List[int]) -> None:
+    for i in indexes:
+        sold.clear(i)
+
+
+def inventory_probe(showtime_id: int):
+    """
+    Whether ``showtime_id`` has a seat map, read under FOR KEY SHARE on the
+    showtime row: create_seat_inventory() holds that row FOR UPDATE while it
+    backfills, so a ticket write never slips in between backfill and map.
+    """
+    return (
+        select(SeatInventory.showtime_id)
+        .select_from(Showtime)
+        .outerjoin(SeatInventory, SeatInventory.showtime_id == Showtime.id)
+        .where(Showtime.id == showtime_id)
+        .with_for_update(of=Showtime, read=True, key_share=True)
+    )
+
+
+def _has_inventory(db: Session, showtime_id: int) -> bool:
+    return db.execute(inventory_probe(showtime_id)).scalar() is not None
+
+
+def labels_of(reserved: SeatMap, seats: List[str]) -> List[str]:
+    return [reserved.label(reserved.index(seat)) for seat in seats]
+
+
+def claim_seats(db: Session, showtime_id: int, seats: List[str]) -> List[str]:
+    """
+    Mark unreserved seats as sold inside the caller's transaction.
+
+    Used by the ticket write paths. Showtimes without a seat inventory keep
+    accepting free-form seat numbers, normalized so the unique
+    (showtime_id, seat_number) constraint on tickets stays the backstop
+    there. Returns the normalized seat labels.
+    """
+    if not _has_inventory(db, showtime_id):
+        return [normalize(seat) for seat in seats]
+    reserved, _ = _swap(db, showtime_id, seats, _do_sell)
+    return labels_of(reserved, seats)
+
+
+def unclaim_seats(db: Session, showtime_id: int, seats: List[str]) -> None:
+    """Return sold seats to the pool inside the caller's transaction; unknown labels are skipped."""
+    if not _has_inventory(db, showtime_id):
+        return
+    _swap(db, showtime_id, seats, _do_unsell, strict=False)
+
+
+def hold_seats(db: Session, showtime_id: int, seats: List[str]) -> List[str]:
+    """Reserve free seats for a hold inside the caller's transaction; all or none."""
+    if not _has_inventory(db, showtime_id):
+        return [normalize(seat) for seat in seats]
+    reserved, _ = _swap(db, showtime_id, seats, _do_reserve)
+    return labels_of(reserved, seats)
+
+
+def confirm_held_seats(db: Session, showtime_id: int, seats: List[str]) -> None:
+    """Turn reserved seats into sold ones inside the caller's transaction."""
+    if not _has_inventory(db, showtime_id):
+        return
+    _swap(db, showtime_id, seats, _do_confirm)
+
+
+def release_held_seats(db: Session, showtime_id: int, seats: List[str]) -> None:
+    """Give reserved seats back inside the caller's transaction; unknown labels are skipped."""
+    if not _has_inventory(db, showtime_id):
+        return
+    _swap(db, showtime_id, seats, _do_release, strict=False)
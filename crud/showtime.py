@@ -1,19 +1,36 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from fastapi import HTTPException, status
-from models import Showtime
+from typing import List, Optional, Tuple
+from datetime import datetime
+from models import SeatInventory, Showtime, ShowtimeAvailability
 from schemas import ShowtimeCreate, ShowtimeUpdate
+from crud.keyset import paginate
+from crud import batch as crud_batch
+from crud.loading import apply_expand, load_expanded
+from crud import schedule as crud_schedule
+from crud import analytics as crud_analytics
+from crud import versions as crud_versions
 import logging
 
-logger = logging.getLogger(_name_)
+logger = logging.getLogger(__name__)
+
+# Keyset sort order for list pages; must match an index on the table.
+PAGE_KEYS = (Showtime.show_date, Showtime.id)
+
+# Showtime columns copied into schedule_entries; changing any of them re-buckets the row.
+SCHEDULE_FIELDS = {"show_date", "location", "play_id"}
 
 def create_showtime(db: Session, showtime: ShowtimeCreate) -> Showtime:
     try:
         db_showtime = Showtime(**showtime.model_dump())
         db.add(db_showtime)
+        db.flush()
+        crud_schedule.refresh_entries(db, [db_showtime.id])
         db.commit()
         db.refresh(db_showtime)
-        logger.info(f"Created showtime ID={db_showtime.showtime_id}")
+        logger.info(f"Created showtime ID={db_showtime.id}")
         return db_showtime
     except SQLAlchemyError as e:
         db.rollback()
@@ -22,27 +39,116 @@ def create_showtime(db: Session, showtime: ShowtimeCreate) -> Showtime:
 
 
 def get_showtime(db: Session, showtime_id: int) -> Showtime:
-    showtime = db.query(Showtime).filter(Showtime.showtime_id == showtime_id).first()
+    showtime = db.query(Showtime).filter(Showtime.id == showtime_id).first()
     if not showtime:
         raise HTTPException(status_code=404, detail="Showtime not found")
     return showtime
 
 
-def get_showtimes(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Showtime).offset(skip).limit(limit).all()
+def filter_showtimes(
+        query,
+        play_id: Optional[int] = None,
+        start_time_from: Optional[datetime] = None,
+        start_time_to: Optional[datetime] = None
+):
+    """Apply the list filters to a Query or Select; served by ix_showtimes_play_id_show_date."""
+    if play_id is not None:
+        query = query.filter(Showtime.play_id == play_id)
+    if start_time_from is not None:
+        query = query.filter(Showtime.show_date >= start_time_from)
+    if start_time_to is not None:
+        query = query.filter(Showtime.show_date < start_time_to)
+    return query
 
 
-def update_showtime(db: Session, showtime_id: int, update_data: ShowtimeUpdate) -> Showtime:
-    showtime = get_showtime(db, showtime_id)
-    for field, value in update_data.model_dump(exclude_unset=True).items():
-        setattr(showtime, field, value)
-    db.commit()
-    db.refresh(showtime)
-    return showtime
+def get_showtimes(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        play_id: Optional[int] = None,
+        start_time_from: Optional[datetime] = None,
+        start_time_to: Optional[datetime] = None,
+        expand: Optional[str] = None
+) -> Tuple[List[Showtime], Optional[str]]:
+    query = filter_showtimes(db.query(Showtime), play_id, start_time_from, start_time_to)
+    query = apply_expand(query, Showtime, expand)
+    showtimes, next_cursor = paginate(query, PAGE_KEYS, cursor, limit)
+    load_expanded(db, Showtime, showtimes, expand)
+    return showtimes, next_cursor
+
+
+def update_showtime(
+        db: Session,
+        showtime_id: int,
+        update_data: ShowtimeUpdate,
+        expected_version: Optional[int] = None
+) -> Showtime:
+    """
+    Apply a partial update with a single ``UPDATE ... RETURNING``.
+
+    The previous play and location come back with the new row; the schedule
+    buckets and sales rollups are only touched when they actually moved.
+    """
+    data = update_data.model_dump(exclude_unset=True)
+    try:
+        showtime = crud_versions.update_row(
+            db, Showtime, showtime_id, data, expected_version, previous=("play_id", "location")
+        )
+        if SCHEDULE_FIELDS & data.keys():
+            crud_schedule.refresh_entries(db, [showtime.id])
+        if (showtime.play_id, showtime.location) != (showtime.old_play_id, showtime.old_location):
+            crud_analytics.move_showtime(db, showtime.id, showtime.old_play_id, showtime.old_location)
+        db.commit()
+        return crud_versions.as_instance(Showtime, showtime)
+    except HTTPException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error updating showtime ID={showtime_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+def delete_showtime(db: Session, showtime_id: int, expected_version: Optional[int] = None) -> bool:
+    """
+    Remove a showtime together with its per-showtime rows.
+
+    The counters, seat map and schedule rows go first, since they reference
+    the showtime, then one ``DELETE ... RETURNING`` removes the showtime itself
+    and its play and location take the counters out of the rollups. A
+    showtime that still has tickets is refused with 409.
+    """
+    try:
+        counters = db.execute(
+            delete(ShowtimeAvailability)
+            .where(ShowtimeAvailability.showtime_id == showtime_id)
+            .returning(ShowtimeAvailability.sold, ShowtimeAvailability.capacity)
+            .execution_options(synchronize_session=False)
+        ).first()
+        db.query(SeatInventory).filter(SeatInventory.showtime_id == showtime_id).delete(synchronize_session=False)
+        crud_schedule.remove_entries(db, [showtime_id])
+        showtime = crud_versions.delete_row(db, Showtime, showtime_id, expected_version)
+        if counters:
+            crud_analytics.drop_showtime(
+                db, showtime.play_id, showtime.location, counters.sold, counters.capacity or 0
+            )
+        db.commit()
+        return True
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Showtime still has tickets")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error deleting showtime ID={showtime_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+def get_showtimes_by_ids(db: Session, ids: List[int]) -> Tuple[List[Optional[Showtime]], List[int]]:
+    return crud_batch.get_many(db, Showtime, ids)
 
 
-def delete_showtime(db: Session, showtime_id: int) -> bool:
-    showtime = get_showtime(db, showtime_id)
-    db.delete(showtime)
-    db.commit()
-    return True
+def get_showtime_version(db: Session, showtime_id: int) -> Optional[int]:
+    return crud_versions.get_version(db, Showtime, showtime_id)
@@ -1,48 +1,274 @@
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from fastapi import HTTPException, status
-from models import Ticket
-from schemas import TicketCreate, TicketUpdate
+from typing import Dict, List, Optional, Set, Tuple
+from models import Customer, Showtime, Ticket
+from schemas import TicketCreate, TicketResponse, TicketUpdate
+from crud.keyset import paginate, paginate_rows, response_columns
+from crud import batch as crud_batch
+from crud.loading import apply_expand
+from crud import seats as crud_seats
+from crud import availability as crud_availability
+from crud import bookings as crud_bookings
+from crud import versions as crud_versions
+from models import CONFIRMED, HELD
 import logging
 
-logger = logging.getLogger(_name_)
+logger = logging.getLogger(__name__)
+
+# Keyset sort order for list pages; must match an index on the table.
+PAGE_KEYS = (Ticket.id,)
+
+# Columns of TicketResponse, for the column-only list path.
+LIST_COLUMNS = response_columns(Ticket, TicketResponse)
+
+# Upper bound for a single bulk issuance request.
+MAX_BULK_TICKETS = 1000
 
 def create_ticket(db: Session, ticket: TicketCreate) -> Ticket:
     try:
-        db_ticket = Ticket(**ticket.model_dump())
+        data = ticket.model_dump()
+        data["seat_number"] = crud_seats.claim_seats(db, data["showtime_id"], [data["seat_number"]])[0]
+        db_ticket = Ticket(**data)
         db.add(db_ticket)
+        crud_availability.adjust_sold(db, data["showtime_id"], 1)
+        crud_bookings.mark_dirty(db, [data["customer_id"]])
         db.commit()
         db.refresh(db_ticket)
-        logger.info(f"Issued ticket ID={db_ticket.ticket_id}")
+        logger.info(f"Issued ticket ID={db_ticket.id}")
         return db_ticket
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Seat already ticketed")
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"Error creating ticket: {str(e)}")
         raise HTTPException(status_code=500, detail="Database error")
 
 
+def prepare_bulk(db: Session, tickets: List[TicketCreate]) -> Tuple[List[dict], Dict[int, List[dict]], Set[int]]:
+    """
+    Validate a bulk order up front: size, duplicate seats, and that every
+    showtime and customer exists. Returns the rows, the rows grouped by
+    showtime and the customer IDs.
+    """
+    if not tickets:
+        raise HTTPException(status_code=400, detail="No tickets in request")
+    if len(tickets) > MAX_BULK_TICKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BULK_TICKETS} tickets per request"
+        )
+
+    rows = [ticket.model_dump() for ticket in tickets]
+    seen = set()
+    for row in rows:
+        key = (row["showtime_id"], row["seat_number"])
+        if key in seen:
+            raise HTTPException(status_code=400, detail=f"Duplicate seat {row['seat_number']} in request")
+        seen.add(key)
+
+    showtime_ids = {row["showtime_id"] for row in rows}
+    customer_ids = {row["customer_id"] for row in rows}
+    found_showtimes = {r.id for r in db.query(Showtime.id).filter(Showtime.id.in_(showtime_ids))}
+    found_customers = {r.id for r in db.query(Customer.id).filter(Customer.id.in_(customer_ids))}
+    if found_showtimes != showtime_ids:
+        missing = sorted(showtime_ids - found_showtimes)
+        raise HTTPException(status_code=404, detail=f"Showtimes not found: {missing}")
+    if found_customers != customer_ids:
+        missing = sorted(customer_ids - found_customers)
+        raise HTTPException(status_code=404, detail=f"Customers not found: {missing}")
+
+    # Showtimes are claimed and counted in id order, whatever the order of the
+    # request, so two bulk orders over the same showtimes lock their rows in
+    # the same order and cannot deadlock each other.
+    by_showtime: Dict[int, List[dict]] = {showtime_id: [] for showtime_id in sorted(showtime_ids)}
+    for row in rows:
+        by_showtime[row["showtime_id"]].append(row)
+    return rows, by_showtime, customer_ids
+
+
+def insert_bulk(db: Session, rows: List[dict], by_showtime: Dict[int, List[dict]], customer_ids: Set[int]) -> List[int]:
+    """The multi-row INSERT and its counter updates, once the seats are claimed; the caller commits."""
+    result = db.execute(
+        insert(Ticket).returning(Ticket.id, sort_by_parameter_order=True),
+        rows
+    )
+    ticket_ids = list(result.scalars())
+    crud_availability.adjust_sold_many(
+        db, {showtime_id: len(group) for showtime_id, group in by_showtime.items()}
+    )
+    crud_bookings.mark_dirty(db, customer_ids)
+    return ticket_ids
+
+
+def create_tickets_bulk(db: Session, tickets: List[TicketCreate]) -> List[int]:
+    """
+    Issue many tickets with one multi-row INSERT in one transaction.
+
+    Seats are validated up front, claimed once per showtime, and the new IDs
+    come back from ``INSERT ... RETURNING`` in request order, so no row is
+    re-selected afterwards.
+    """
+    rows, by_showtime, customer_ids = prepare_bulk(db, tickets)
+    try:
+        for showtime_id, group in by_showtime.items():
+            labels = crud_seats.claim_seats(db, showtime_id, [row["seat_number"] for row in group])
+            for row, label in zip(group, labels):
+                row["seat_number"] = label
+        ticket_ids = insert_bulk(db, rows, by_showtime, customer_ids)
+        db.commit()
+        logger.info(f"Issued {len(ticket_ids)} tickets in bulk")
+        return ticket_ids
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Seat already ticketed")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error creating tickets in bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
 def get_ticket(db: Session, ticket_id: int) -> Ticket:
-    ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
+    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
     return ticket
 
 
-def get_tickets(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Ticket).offset(skip).limit(limit).all()
+def filter_tickets(
+        query,
+        showtime_id: Optional[int] = None,
+        customer_id: Optional[int] = None,
+        ticket_status: Optional[str] = CONFIRMED
+):
+    """
+    Apply the list filters to a Query or Select; both id columns lead an
+    index. Lists show confirmed tickets unless another status is asked for,
+    so seats that are only held never pass for sold ones.
+    """
+    if ticket_status is not None:
+        query = query.filter(Ticket.status == ticket_status)
+    if showtime_id is not None:
+        query = query.filter(Ticket.showtime_id == showtime_id)
+    if customer_id is not None:
+        query = query.filter(Ticket.customer_id == customer_id)
+    return query
 
 
-def update_ticket(db: Session, ticket_id: int, update_data: TicketUpdate) -> Ticket:
-    ticket = get_ticket(db, ticket_id)
-    for field, value in update_data.model_dump(exclude_unset=True).items():
-        setattr(ticket, field, value)
-    db.commit()
-    db.refresh(ticket)
-    return ticket
+def get_tickets(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        showtime_id: Optional[int] = None,
+        customer_id: Optional[int] = None,
+        expand: Optional[str] = None,
+        ticket_status: Optional[str] = CONFIRMED
+) -> Tuple[List[Ticket], Optional[str]]:
+    query = filter_tickets(db.query(Ticket), showtime_id, customer_id, ticket_status)
+    query = apply_expand(query, Ticket, expand)
+    return paginate(query, PAGE_KEYS, cursor, limit)
+
+
+def get_ticket_rows(
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        showtime_id: Optional[int] = None,
+        customer_id: Optional[int] = None,
+        ticket_status: Optional[str] = CONFIRMED
+) -> Tuple[List[dict], Optional[str]]:
+    stmt = filter_tickets(select(*LIST_COLUMNS), showtime_id, customer_id, ticket_status)
+    return paginate_rows(db, stmt, PAGE_KEYS, cursor, limit)
+
+
+def update_ticket(
+        db: Session,
+        ticket_id: int,
+        update_data: TicketUpdate,
+        expected_version: Optional[int] = None
+) -> Ticket:
+    """
+    Apply a partial update with a single ``UPDATE ... RETURNING``.
+
+    The previous showtime, customer and seat come back with the new row, so a
+    moved ticket gives its old seat back and claims the new one on the seat
+    map, and the counters and booking caches move, without loading the
+    ticket first.
+    """
+    try:
+        values = update_data.model_dump(exclude_unset=True)
+        if values.get("seat_number") is not None:
+            values["seat_number"] = crud_seats.normalize(values["seat_number"])
+        ticket = crud_versions.update_row(
+            db, Ticket, ticket_id, values, expected_version,
+            previous=("showtime_id", "customer_id", "seat_number")
+        )
+        result = crud_versions.as_instance(Ticket, ticket)
+        if ticket.showtime_id != ticket.old_showtime_id or ticket.seat_number != ticket.old_seat_number:
+            if ticket.status == HELD:
+                raise HTTPException(status_code=409, detail="A held ticket cannot be moved; release the hold instead")
+            crud_seats.unclaim_seats(db, ticket.old_showtime_id, [ticket.old_seat_number])
+            label = crud_seats.claim_seats(db, ticket.showtime_id, [ticket.seat_number])[0]
+            if label != ticket.seat_number:
+                set_seat_number(db, ticket_id, label)
+                result.seat_number = label
+        crud_bookings.mark_dirty(db, {ticket.old_customer_id, ticket.customer_id})
+        if ticket.showtime_id != ticket.old_showtime_id:
+            sold_on = ticket.created_at.date() if ticket.created_at else None
+            crud_availability.adjust_sold(db, ticket.old_showtime_id, -1, sold_on)
+            crud_availability.adjust_sold(db, ticket.showtime_id, 1, sold_on)
+        db.commit()
+        return result
+    except HTTPException:
+        db.rollback()
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Seat already ticketed")
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error updating ticket ID={ticket_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+
+def set_seat_number(db: Session, ticket_id: int, label: str) -> None:
+    """Store the seat map's spelling of a moved ticket's seat (e.g. "A01" -> "A1")."""
+    db.query(Ticket).filter(Ticket.id == ticket_id).update(
+        {Ticket.seat_number: label}, synchronize_session=False
+    )
+
+
+def delete_ticket(db: Session, ticket_id: int, expected_version: Optional[int] = None) -> bool:
+    """Remove a ticket with one ``DELETE ... RETURNING``; the returned row drives the seat and counter updates."""
+    try:
+        ticket = crud_versions.delete_row(db, Ticket, ticket_id, expected_version)
+        if ticket.status == HELD:
+            crud_seats.release_held_seats(db, ticket.showtime_id, [ticket.seat_number])
+            crud_availability.adjust_held(db, ticket.showtime_id, -1)
+        else:
+            crud_seats.unclaim_seats(db, ticket.showtime_id, [ticket.seat_number])
+            crud_availability.adjust_sold(
+                db, ticket.showtime_id, -1, ticket.created_at.date() if ticket.created_at else None
+            )
+        crud_bookings.mark_dirty(db, [ticket.customer_id])
+        db.commit()
+        return True
+    except HTTPException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error deleting ticket ID={ticket_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
 
 
-def delete_ticket(db: Session, ticket_id: int) -> bool:
-    ticket = get_ticket(db, ticket_id)
-    db.delete(ticket)
-    db.commit()
-    return True
+def get_tickets_by_ids(db: Session, ids: List[int]) -> Tuple[List[Optional[Ticket]], List[int]]:
+    return crud_batch.get_many(db, Ticket, ids)
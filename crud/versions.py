@@ -0,0 +1,138 @@
+from sqlalchemy import delete, literal, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Optional, Sequence
+from crud import catalog_cache
+from crud.batch import CACHED_MODELS
+import datetime
+
+# Row versions. Every write bumps ``version`` and the routers turn it into a
+# strong ETag, so a conditional GET only needs this one integer: from the
+# catalog cache when the row is cached there, otherwise from a single-column
+# select on the primary key. The same number guards writes: update_row() and
+# delete_row() only match the version named by the client's If-Match.
+
+
+def bump(obj) -> None:
+    """
+    Stage a version bump on ``obj`` for the caller's next flush.
+
+    The increment is evaluated by the database, so it stays correct even when
+    ``obj`` was merged from a stale cache entry or another worker wrote the
+    row meanwhile. The attribute is expired by the flush; refresh ``obj``
+    before reading it back.
+    """
+    model = type(obj)
+    obj.version = model.version + 1
+    obj.updated_at = datetime.datetime.utcnow()
+
+
+def upsert_bump(model) -> dict:
+    """``ON CONFLICT DO UPDATE`` assignments that bump the version of a re-imported row."""
+    columns = model.__table__.c
+    if "version" not in columns:
+        return {}
+    bump = {"version": model.version + 1}
+    if "updated_at" in columns:
+        bump["updated_at"] = datetime.datetime.utcnow()
+    return bump
+
+
+def _cached(model, pk) -> Optional[int]:
+    if model not in CACHED_MODELS:
+        return None
+    row = catalog_cache.peek(model, pk)
+    return None if row is None else row.get("version")
+
+
+def get_version(db: Session, model, pk) -> Optional[int]:
+    """Current version of ``model`` row ``pk``, or None if the row does not exist."""
+    version = _cached(model, pk)
+    if version is not None:
+        return version
+    return db.execute(select(model.version).where(model.id == pk)).scalar()
+
+
+async def get_version_async(db, model, pk) -> Optional[int]:
+    version = _cached(model, pk)
+    if version is not None:
+        return version
+    return (await db.execute(select(model.version).where(model.id == pk))).scalar()
+
+
+def _no_match(db: Session, model, pk) -> HTTPException:
+    """The error for a write that matched no row: the row is gone, or it moved past If-Match."""
+    current = db.execute(select(model.version).where(model.id == pk)).scalar()
+    if current is None:
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{model.__name__} not found")
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail=f"{model.__name__} has been modified; current version is {current}"
+    )
+
+
+def update_row(
+        db: Session,
+        model,
+        pk,
+        values: dict,
+        expected_version: Optional[int] = None,
+        previous: Sequence[str] = ()
+) -> Row:
+    """
+    Apply ``values`` to row ``pk`` with one ``UPDATE ... RETURNING`` in the
+    caller's transaction and return the updated row.
+
+    The version is bumped by the same statement and, with ``expected_version``,
+    is part of its WHERE clause, so a lost update cannot slip in between a read
+    and the write. Columns named in ``previous`` come back as ``old_<name>``
+    with their values from before the update, read by a ``SELECT ... FOR
+    UPDATE`` of the row first (RETURNING only ever sees the new values), for
+    callers whose side effects depend on what changed. Keys that are not
+    columns of ``model`` are ignored. Raises 404 for a missing row and 412 for
+    a version mismatch.
+    """
+    table = model.__table__
+    values = {k: v for k, v in values.items() if k in table.c}
+    values["version"] = table.c.version + 1
+    if "updated_at" in table.c:
+        values["updated_at"] = datetime.datetime.utcnow()
+    returning = list(table.c)
+    if previous:
+        old = db.execute(
+            select(*(table.c[name] for name in previous)).where(table.c.id == pk).with_for_update()
+        ).first()
+        if old is None:
+            raise _no_match(db, model, pk)
+        returning += [
+            literal(old._mapping[name], table.c[name].type).label(f"old_{name}") for name in previous
+        ]
+    stmt = update(table).where(table.c.id == pk)
+    if expected_version is not None:
+        stmt = stmt.where(table.c.version == expected_version)
+    row = db.execute(stmt.values(values).returning(*returning)).first()
+    if row is None:
+        raise _no_match(db, model, pk)
+    return row
+
+
+def as_instance(model, row: Row):
+    """A transient ``model`` instance holding the columns of a returned row, for response models."""
+    return model(**{column.key: row._mapping[column] for column in model.__table__.c})
+
+
+def delete_row(db: Session, model, pk, expected_version: Optional[int] = None) -> Row:
+    """
+    Delete row ``pk`` with one ``DELETE ... RETURNING`` in the caller's
+    transaction and return its last state, for the caller's side effects.
+    Raises like update_row().
+    """
+    table = model.__table__
+    stmt = delete(table).where(table.c.id == pk)
+    if expected_version is not None:
+        stmt = stmt.where(table.c.version == expected_version)
+    row = db.execute(stmt.returning(*table.c)).first()
+    if row is None:
+        raise _no_match(db, model, pk)
+    return row
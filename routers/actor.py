@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from ..crud import actor as crud_actor
-from ..schemas import ActorCreate, ActorUpdate, ActorResponse
-from ..database import get_db
+from crud import actors as crud_actor
+from crud import credits as crud_credits
+from schemas import ActorCreate, ActorUpdate, ActorResponse
+from database import get_db
+import schemas
+from .pagination import Batch, BatchRequest, Page, page_limit
+from . import conditional
 
 router = APIRouter()
 
@@ -11,23 +15,38 @@ def create_actor(actor: ActorCreate, db: Session = Depends(get_db)):
     return crud_actor.create_actor(db=db, actor=actor)
 
 @router.get("/{actor_id}", response_model=ActorResponse)
-def read_actor(actor_id: int, db: Session = Depends(get_db)):
+def read_actor(actor_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    not_modified = conditional.check(request, "actors", actor_id, lambda: crud_actor.get_actor_version(db, actor_id))
+    if not_modified is not None:
+        return not_modified
     db_actor = crud_actor.get_actor(db, actor_id=actor_id)
     if not db_actor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Actor not found"
         )
+    conditional.set_headers(response, "actors", conditional.etag_for("actors", db_actor.id, db_actor.version))
     return db_actor
 
-@router.get("/", response_model=list[ActorResponse])
+@router.post("/batch", response_model=Batch[ActorResponse])
+def read_actors_batch(request: BatchRequest, db: Session = Depends(get_db)):
+    items, missing = crud_actor.get_actors_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/{actor_id}/plays", response_model=Page[schemas.Play])
+def list_actor_plays(actor_id: int, cursor: str = None, limit: int = page_limit(), db: Session = Depends(get_db)):
+    plays, next_cursor = crud_credits.get_plays_for(db, "actors", actor_id, cursor=cursor, limit=limit)
+    return Page(items=plays, next_cursor=next_cursor)
+
+@router.get("/", response_model=Page[ActorResponse])
 def list_actors(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str = None,
+    limit: int = page_limit(),
     name: str = None,
     db: Session = Depends(get_db)
 ):
-    return crud_actor.get_actors(db, skip=skip, limit=limit, name=name)
+    actors, next_cursor = crud_actor.get_actors(db, cursor=cursor, limit=limit, name=name)
+    return Page(items=actors, next_cursor=next_cursor)
 
 @router.put("/{actor_id}", response_model=ActorResponse)
 def update_actor(
@@ -35,7 +54,7 @@ def update_actor(
     actor: ActorUpdate,
     db: Session = Depends(get_db)
 ):
-    updated_actor = crud_actor.update_actor(db, actor_id=actor_id, actor=actor)
+    updated_actor = crud_actor.update_actor(db, actor_id=actor_id, update_data=actor)
     if not updated_actor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
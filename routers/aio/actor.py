@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from crud.aio import actors as crud_actor
+from crud.aio import credits as crud_credits
+from schemas import ActorCreate, ActorUpdate, ActorResponse
+from database import get_async_db
+import schemas
+from ..pagination import Batch, BatchRequest, Page, page_limit
+from .. import conditional
+
+router = APIRouter()
+
+@router.post("/", response_model=ActorResponse, status_code=status.HTTP_201_CREATED)
+async def create_actor(actor: ActorCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_actor.create_actor(db=db, actor=actor)
+
+@router.get("/{actor_id}", response_model=ActorResponse)
+async def read_actor(actor_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    not_modified = await conditional.check_async(request, "actors", actor_id, lambda: crud_actor.get_actor_version(db, actor_id))
+    if not_modified is not None:
+        return not_modified
+    db_actor = await crud_actor.get_actor(db, actor_id=actor_id)
+    conditional.set_headers(response, "actors", conditional.etag_for("actors", db_actor.id, db_actor.version))
+    return db_actor
+
+@router.post("/batch", response_model=Batch[ActorResponse])
+async def read_actors_batch(request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    items, missing = await crud_actor.get_actors_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/{actor_id}/plays", response_model=Page[schemas.Play])
+async def list_actor_plays(actor_id: int, cursor: str = None, limit: int = page_limit(), db: AsyncSession = Depends(get_async_db)):
+    plays, next_cursor = await crud_credits.get_plays_for(db, "actors", actor_id, cursor=cursor, limit=limit)
+    return Page(items=plays, next_cursor=next_cursor)
+
+@router.get("/", response_model=Page[ActorResponse])
+async def list_actors(
+    cursor: str = None,
+    limit: int = page_limit(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    actors, next_cursor = await crud_actor.get_actors(db, cursor=cursor, limit=limit)
+    return Page(items=actors, next_cursor=next_cursor)
+
+@router.put("/{actor_id}", response_model=ActorResponse)
+async def update_actor(
+    actor_id: int,
+    actor: ActorUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await crud_actor.update_actor(db, actor_id=actor_id, update_data=actor)
+
+@router.delete("/{actor_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_actor(actor_id: int, db: AsyncSession = Depends(get_async_db)):
+    await crud_actor.delete_actor(db, actor_id=actor_id)
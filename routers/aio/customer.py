@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from crud.aio import customers as crud_customer
+from schemas import CustomerCreate, CustomerUpdate, CustomerResponse
+from database import get_async_db
+from ..pagination import Batch, BatchRequest, Page, page_limit
+from .. import conditional
+from ..customer import BookingHistoryResponse
+
+router = APIRouter()
+
+@router.post("/", response_model=CustomerResponse, status_code=status.HTTP_201_CREATED)
+async def create_customer(customer: CustomerCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_customer.create_customer(db=db, customer=customer)
+
+@router.get("/{customer_id}", response_model=CustomerResponse)
+async def read_customer(customer_id: int, response: Response, db: AsyncSession = Depends(get_async_db)):
+    db_customer = await crud_customer.get_customer(db, customer_id=customer_id)
+    conditional.set_etag(response, conditional.etag_for("customers", db_customer.id, db_customer.version))
+    return db_customer
+
+@router.get("/{customer_id}/tickets", response_model=BookingHistoryResponse)
+async def read_booking_history(customer_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await crud_customer.get_booking_history(db, customer_id)
+
+@router.post("/batch", response_model=Batch[CustomerResponse])
+async def read_customers_batch(request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    items, missing = await crud_customer.get_customers_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/", response_model=Page[CustomerResponse])
+async def list_customers(
+    cursor: str = None,
+    limit: int = page_limit(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    customers, next_cursor = await crud_customer.get_customers(db, cursor=cursor, limit=limit)
+    return Page(items=customers, next_cursor=next_cursor)
+
+@router.put("/{customer_id}", response_model=CustomerResponse)
+async def update_customer(
+    customer_id: int,
+    customer: CustomerUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    updated_customer = await crud_customer.update_customer(
+        db,
+        customer_id=customer_id,
+        update_data=customer,
+        expected_version=conditional.if_match_version(request, "customers", customer_id)
+    )
+    conditional.set_etag(response, conditional.etag_for("customers", updated_customer.id, updated_customer.version))
+    return updated_customer
+
+@router.delete("/{customer_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_customer(customer_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    expected_version = conditional.if_match_version(request, "customers", customer_id)
+    await crud_customer.delete_customer(db, customer_id=customer_id, expected_version=expected_version)
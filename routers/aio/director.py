@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from crud.aio import directors as crud_director
+from crud.aio import credits as crud_credits
+from schemas import DirectorCreate, DirectorUpdate, DirectorResponse
+from database import get_async_db
+import schemas
+from ..pagination import Batch, BatchRequest, Page, page_limit
+from .. import conditional
+
+router = APIRouter()
+
+@router.post("/", response_model=DirectorResponse, status_code=status.HTTP_201_CREATED)
+async def create_director(director: DirectorCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_director.create_director(db=db, director=director)
+
+@router.get("/{director_id}", response_model=DirectorResponse)
+async def read_director(director_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    not_modified = await conditional.check_async(request, "directors", director_id, lambda: crud_director.get_director_version(db, director_id))
+    if not_modified is not None:
+        return not_modified
+    db_director = await crud_director.get_director(db, director_id=director_id)
+    conditional.set_headers(response, "directors", conditional.etag_for("directors", db_director.id, db_director.version))
+    return db_director
+
+@router.post("/batch", response_model=Batch[DirectorResponse])
+async def read_directors_batch(request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    items, missing = await crud_director.get_directors_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/{director_id}/plays", response_model=Page[schemas.Play])
+async def list_director_plays(director_id: int, cursor: str = None, limit: int = page_limit(), db: AsyncSession = Depends(get_async_db)):
+    plays, next_cursor = await crud_credits.get_plays_for(db, "directors", director_id, cursor=cursor, limit=limit)
+    return Page(items=plays, next_cursor=next_cursor)
+
+@router.get("/", response_model=Page[DirectorResponse])
+async def list_directors(
+    cursor: str = None,
+    limit: int = page_limit(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    directors, next_cursor = await crud_director.get_directors(db, cursor=cursor, limit=limit)
+    return Page(items=directors, next_cursor=next_cursor)
+
+@router.put("/{director_id}", response_model=DirectorResponse)
+async def update_director(
+    director_id: int,
+    director: DirectorUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await crud_director.update_director(db, director_id=director_id, update_data=director)
+
+@router.delete("/{director_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_director(director_id: int, db: AsyncSession = Depends(get_async_db)):
+    await crud_director.delete_director(db, director_id=director_id)
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+import schemas
+from crud.aio import play as crud_play
+from crud.aio import credits as crud_credits
+from database import get_async_db
+from ..pagination import Batch, BatchRequest, Page, page_limit
+from .. import conditional
+from ..play import CreditChange
+
+router = APIRouter()
+
+@router.post('/', response_model=schemas.Play)
+async def create_play_endpoint(
+    play: schemas.PlayCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await crud_play.create_play(db=db, play=play)
+
+@router.get('/{play_id}', response_model=schemas.Play)
+async def read_play(play_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    not_modified = await conditional.check_async(request, 'plays', play_id, lambda: crud_play.get_play_version(db, play_id))
+    if not_modified is not None:
+        return not_modified
+    play = await crud_play.get_play(db, play_id=play_id)
+    if not play:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Play not found'
+        )
+    conditional.set_headers(response, 'plays', conditional.etag_for('plays', play.id, play.version))
+    return play
+
+@router.post('/batch', response_model=Batch[schemas.Play])
+async def read_plays_batch(request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    items, missing = await crud_play.get_plays_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get('/', response_model=Page[schemas.Play])
+async def read_plays(
+    request: Request,
+    response: Response,
+    cursor: str = None,
+    limit: int = page_limit(),
+    genre: str = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    versions, next_cursor = await crud_play.get_play_versions(db, cursor=cursor, limit=limit, genre=genre)
+    etag = conditional.list_etag('plays', versions, next_cursor)
+    not_modified = conditional.not_modified(request, 'plays', etag)
+    if not_modified is not None:
+        return not_modified
+    plays, next_cursor = await crud_play.get_plays(
+        db,
+        cursor=cursor,
+        limit=limit,
+        genre=genre
+    )
+    conditional.set_headers(response, 'plays', etag)
+    return Page(items=plays, next_cursor=next_cursor)
+
+@router.post('/{play_id}/directors', response_model=CreditChange)
+async def add_play_directors(play_id: int, request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    changed = await crud_credits.add_credits(db, play_id, 'directors', request.ids)
+    return CreditChange(play_id=play_id, changed=changed)
+
+@router.post('/{play_id}/directors/remove', response_model=CreditChange)
+async def remove_play_directors(play_id: int, request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    changed = await crud_credits.remove_credits(db, play_id, 'directors', request.ids)
+    return CreditChange(play_id=play_id, changed=changed)
+
+@router.get('/{play_id}/directors', response_model=List[schemas.DirectorResponse])
+async def read_play_directors(play_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await crud_credits.get_credits(db, play_id, 'directors')
+
+@router.post('/{play_id}/actors', response_model=CreditChange)
+async def add_play_actors(play_id: int, request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    changed = await crud_credits.add_credits(db, play_id, 'actors', request.ids)
+    return CreditChange(play_id=play_id, changed=changed)
+
+@router.post('/{play_id}/actors/remove', response_model=CreditChange)
+async def remove_play_actors(play_id: int, request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    changed = await crud_credits.remove_credits(db, play_id, 'actors', request.ids)
+    return CreditChange(play_id=play_id, changed=changed)
+
+@router.get('/{play_id}/actors', response_model=List[schemas.ActorResponse])
+async def read_play_actors(play_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await crud_credits.get_credits(db, play_id, 'actors')
@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from datetime import datetime
+from crud.aio import showtime as crud_showtime
+from schemas import ShowtimeCreate, ShowtimeUpdate, ShowtimeResponse
+from database import get_async_db
+from ..pagination import Batch, BatchRequest, Page, page_limit
+from .. import conditional
+from ..showtime import AvailabilityResponse, availability_response
+from ..expand import ShowtimeExpandedResponse
+
+router = APIRouter()
+
+@router.post("/", response_model=ShowtimeResponse, status_code=status.HTTP_201_CREATED)
+async def create_showtime(showtime: ShowtimeCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_showtime.create_showtime(db=db, showtime=showtime)
+
+@router.get("/availability", response_model=List[AvailabilityResponse])
+async def read_availability(play_id: int, db: AsyncSession = Depends(get_async_db)):
+    return availability_response(await crud_showtime.get_availability(db, play_id))
+
+@router.get("/{showtime_id}", response_model=ShowtimeResponse)
+async def read_showtime(showtime_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    not_modified = await conditional.check_async(request, "showtimes", showtime_id, lambda: crud_showtime.get_showtime_version(db, showtime_id))
+    if not_modified is not None:
+        return not_modified
+    db_showtime = await crud_showtime.get_showtime(db, showtime_id=showtime_id)
+    conditional.set_headers(response, "showtimes", conditional.etag_for("showtimes", db_showtime.id, db_showtime.version))
+    return db_showtime
+
+@router.post("/batch", response_model=Batch[ShowtimeResponse])
+async def read_showtimes_batch(request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    items, missing = await crud_showtime.get_showtimes_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/", response_model=Page[ShowtimeExpandedResponse])
+async def list_showtimes(
+    cursor: str = None,
+    limit: int = page_limit(),
+    play_id: int = None,
+    start_time_from: datetime = None,
+    start_time_to: datetime = None,
+    expand: str = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    showtimes, next_cursor = await crud_showtime.get_showtimes(
+        db,
+        cursor=cursor,
+        limit=limit,
+        play_id=play_id,
+        start_time_from=start_time_from,
+        start_time_to=start_time_to,
+        expand=expand
+    )
+    return Page(items=showtimes, next_cursor=next_cursor)
+
+@router.put("/{showtime_id}", response_model=ShowtimeResponse)
+async def update_showtime(
+    showtime_id: int,
+    showtime: ShowtimeUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    updated_showtime = await crud_showtime.update_showtime(
+        db,
+        showtime_id=showtime_id,
+        update_data=showtime,
+        expected_version=conditional.if_match_version(request, "showtimes", showtime_id)
+    )
+    conditional.set_etag(response, conditional.etag_for("showtimes", updated_showtime.id, updated_showtime.version))
+    return updated_showtime
+
+@router.delete("/{showtime_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_showtime(showtime_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    expected_version = conditional.if_match_version(request, "showtimes", showtime_id)
+    await crud_showtime.delete_showtime(db, showtime_id=showtime_id, expected_version=expected_version)
@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from crud.aio import tickets as crud_ticket
+from schemas import TicketCreate, TicketUpdate, TicketResponse
+from models import CONFIRMED
+from database import get_async_db
+from ..pagination import Batch, BatchRequest, Page, page_limit
+from .. import conditional
+from ..expand import TicketExpandedResponse
+from ..ticket import TicketBulkCreate, TicketBulkResponse
+
+router = APIRouter()
+
+@router.post("/", response_model=TicketResponse, status_code=status.HTTP_201_CREATED)
+async def create_ticket(ticket: TicketCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_ticket.create_ticket(db=db, ticket=ticket)
+
+@router.post("/bulk", response_model=TicketBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_tickets_bulk(order: TicketBulkCreate, db: AsyncSession = Depends(get_async_db)):
+    return TicketBulkResponse(ticket_ids=await crud_ticket.create_tickets_bulk(db, order.tickets))
+
+@router.get("/{ticket_id}", response_model=TicketResponse)
+async def read_ticket(ticket_id: int, response: Response, db: AsyncSession = Depends(get_async_db)):
+    db_ticket = await crud_ticket.get_ticket(db, ticket_id=ticket_id)
+    conditional.set_etag(response, conditional.etag_for("tickets", db_ticket.id, db_ticket.version))
+    return db_ticket
+
+@router.post("/batch", response_model=Batch[TicketResponse])
+async def read_tickets_batch(request: BatchRequest, db: AsyncSession = Depends(get_async_db)):
+    items, missing = await crud_ticket.get_tickets_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/", response_model=Page[TicketExpandedResponse])
+async def list_tickets(
+    cursor: str = None,
+    limit: int = page_limit(),
+    showtime_id: int = None,
+    customer_id: int = None,
+    ticket_status: str = Query(CONFIRMED, alias="status"),
+    expand: str = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    tickets, next_cursor = await crud_ticket.get_tickets(
+        db,
+        cursor=cursor,
+        limit=limit,
+        showtime_id=showtime_id,
+        customer_id=customer_id,
+        ticket_status=ticket_status,
+        expand=expand
+    )
+    return Page(items=tickets, next_cursor=next_cursor)
+
+@router.put("/{ticket_id}", response_model=TicketResponse)
+async def update_ticket(
+    ticket_id: int,
+    ticket: TicketUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    updated_ticket = await crud_ticket.update_ticket(
+        db,
+        ticket_id=ticket_id,
+        update_data=ticket,
+        expected_version=conditional.if_match_version(request, "tickets", ticket_id)
+    )
+    conditional.set_etag(response, conditional.etag_for("tickets", updated_ticket.id, updated_ticket.version))
+    return updated_ticket
+
+@router.delete("/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_ticket(ticket_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    expected_version = conditional.if_match_version(request, "tickets", ticket_id)
+    await crud_ticket.delete_ticket(db, ticket_id=ticket_id, expected_version=expected_version)
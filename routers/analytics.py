@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import List, Optional
+from crud import analytics as crud_analytics
+from database import get_db
+
+router = APIRouter()
+
+
+class PlaySalesResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    play_id: int
+    title: str
+    sold: int
+
+
+class LocationOccupancyResponse(BaseModel):
+    location: str
+    sold: int
+    capacity: int
+    occupancy_rate: Optional[float] = None
+
+
+class DailySalesResponse(BaseModel):
+    day: date
+    sold: int
+
+@router.get("/top-plays", response_model=List[PlaySalesResponse])
+def read_top_plays(limit: int = Query(10, ge=1, le=crud_analytics.MAX_TOP_PLAYS), db: Session = Depends(get_db)):
+    return crud_analytics.top_plays(db, limit)
+
+@router.get("/occupancy", response_model=List[LocationOccupancyResponse])
+def read_occupancy(db: Session = Depends(get_db)):
+    return crud_analytics.occupancy_by_location(db)
+
+@router.get("/daily-sales", response_model=List[DailySalesResponse])
+def read_daily_sales(date_from: date, date_to: date, db: Session = Depends(get_db)):
+    return crud_analytics.daily_sales(db, date_from, date_to)
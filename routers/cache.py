@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from crud import catalog_cache
+from crud import bookings as crud_bookings
+from idempotency import idempotency_store
+
+router = APIRouter()
+
+@router.get("/")
+def read_cache_stats():
+    """Hit/miss/eviction/invalidation counters of the catalog cache."""
+    return catalog_cache.cache_stats()
+
+@router.get("/bookings")
+def read_booking_cache_stats():
+    """Counters of the per-customer booking history cache."""
+    return crud_bookings.booking_cache.stats.snapshot()
+
+@router.get("/idempotency")
+def read_idempotency_stats():
+    """Stored/replayed/in-progress/mismatched counts of the Idempotency-Key store."""
+    if idempotency_store is None:
+        return {}
+    return idempotency_store.stats.snapshot()
@@ -0,0 +1,111 @@
+from fastapi import HTTPException, Request, Response, status
+from typing import Awaitable, Callable, Dict, List, Optional
+from config import CACHE_CONTROL_ACTORS, CACHE_CONTROL_DIRECTORS, CACHE_CONTROL_PLAYS, CACHE_CONTROL_SHOWTIMES
+import hashlib
+
+# Conditional requests. ETags are strong and derived from the row version
+# alone, so a revalidation only has to look that integer up (see
+# crud.versions) and can answer 304 without loading or serializing the row.
+# On writes, If-Match carries the version the client last saw and the crud
+# layer makes it part of the UPDATE/DELETE, answering 412 when it moved on.
+
+CACHE_CONTROL = {
+    "plays": CACHE_CONTROL_PLAYS,
+    "showtimes": CACHE_CONTROL_SHOWTIMES,
+    "actors": CACHE_CONTROL_ACTORS,
+    "directors": CACHE_CONTROL_DIRECTORS,
+}
+
+
+def etag_for(kind: str, pk, version: Optional[int]) -> Optional[str]:
+    if version is None:
+        return None
+    return f'"{kind}-{pk}-{version}"'
+
+
+def list_etag(kind: str, rows: List[dict], next_cursor: Optional[str]) -> str:
+    """ETag of a list page from its ``(id, version)`` rows; any change, addition or removal alters it."""
+    digest = hashlib.blake2b(digest_size=12)
+    for row in rows:
+        digest.update(f"{row['id']}:{row['version']};".encode())
+    digest.update(repr(next_cursor).encode())
+    return f'"{kind}-list-{digest.hexdigest()}"'
+
+
+def _headers(kind: str, etag: Optional[str]) -> Dict[str, str]:
+    headers = {"Cache-Control": CACHE_CONTROL[kind]}
+    if etag is not None:
+        headers["ETag"] = etag
+    return headers
+
+
+def _matches(request: Request, etag: Optional[str]) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so a W/ prefix is ignored.
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(request: Request, kind: str, etag: Optional[str]) -> Optional[Response]:
+    """A 304 response if the request's If-None-Match covers ``etag``, else None."""
+    if not _matches(request, etag):
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_headers(kind, etag))
+
+
+def check(request: Request, kind: str, pk, probe: Callable[[], Optional[int]]) -> Optional[Response]:
+    """
+    Answer a revalidation of item ``pk`` from ``probe()``, its current version.
+
+    The probe only runs when the request carries If-None-Match. None means the
+    client's copy is stale (or the row is gone) and the full read must run.
+    """
+    if "if-none-match" not in request.headers:
+        return None
+    return not_modified(request, kind, etag_for(kind, pk, probe()))
+
+
+async def check_async(request: Request, kind: str, pk, probe: Callable[[], Awaitable[Optional[int]]]) -> Optional[Response]:
+    if "if-none-match" not in request.headers:
+        return None
+    return not_modified(request, kind, etag_for(kind, pk, await probe()))
+
+
+def set_headers(response: Response, kind: str, etag: Optional[str]) -> None:
+    response.headers.update(_headers(kind, etag))
+
+
+def set_etag(response: Response, etag: Optional[str]) -> None:
+    """ETag only, for private resources and write responses that must not be cached."""
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+
+def if_match_version(request: Request, kind: str, pk) -> Optional[int]:
+    """
+    The version a write to item ``pk`` must find, from If-Match.
+
+    None means the write is unconditional (no header, or "*"). A header that
+    cannot match this item (another item's tag, a weak tag) fails at once.
+    """
+    header = request.headers.get("if-match")
+    if not header or header.strip() == "*":
+        return None
+    prefix = f'"{kind}-{pk}-'
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith(prefix) and candidate.endswith('"') and candidate[len(prefix):-1].isdigit():
+            return int(candidate[len(prefix):-1])
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="If-Match does not name a version of this resource"
+    )
@@ -1,58 +1,112 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from ..crud import customer as crud_customer
-from ..schemas import CustomerCreate, CustomerUpdate, CustomerResponse
-from ..database import get_db
+from datetime import datetime
+from typing import List, Optional
+from crud import customers as crud_customer
+from crud import bookings as crud_bookings
+from schemas import CustomerCreate, CustomerUpdate, CustomerResponse
+from database import get_db
+from config import FAST_LIST_RESPONSES
+from responses import FastJSONResponse
+from .pagination import Batch, BatchRequest, Page, page_limit
+from . import conditional
 
 router = APIRouter()
 
+
+class BookingResponse(BaseModel):
+    ticket_id: int
+    seat_number: Optional[str] = None
+    status: str
+    showtime_id: int
+    show_date: datetime
+    location: Optional[str] = None
+    play_id: Optional[int] = None
+    play_title: Optional[str] = None
+
+
+class BookingHistoryResponse(BaseModel):
+    customer_id: int
+    upcoming: List[BookingResponse]
+    past: List[BookingResponse]
+
 @router.post("/", response_model=CustomerResponse, status_code=status.HTTP_201_CREATED)
 def create_customer(customer: CustomerCreate, db: Session = Depends(get_db)):
     return crud_customer.create_customer(db=db, customer=customer)
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
-def read_customer(customer_id: int, db: Session = Depends(get_db)):
+def read_customer(customer_id: int, response: Response, db: Session = Depends(get_db)):
     db_customer = crud_customer.get_customer(db, customer_id=customer_id)
     if not db_customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found"
         )
+    conditional.set_etag(response, conditional.etag_for("customers", db_customer.id, db_customer.version))
     return db_customer
 
-@router.get("/", response_model=list[CustomerResponse])
+@router.get("/{customer_id}/tickets", response_model=BookingHistoryResponse)
+def read_booking_history(customer_id: int, db: Session = Depends(get_db)):
+    return crud_bookings.get_booking_history(db, customer_id)
+
+@router.post("/batch", response_model=Batch[CustomerResponse])
+def read_customers_batch(request: BatchRequest, db: Session = Depends(get_db)):
+    items, missing = crud_customer.get_customers_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/", response_model=Page[CustomerResponse])
 def list_customers(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str = None,
+    limit: int = page_limit(),
     name: str = None,
     email: str = None,
     db: Session = Depends(get_db)
 ):
-    return crud_customer.get_customers(
+    if FAST_LIST_RESPONSES:
+        rows, next_cursor = crud_customer.get_customer_rows(
+            db,
+            cursor=cursor,
+            limit=limit,
+            name=name,
+            email=email
+        )
+        return FastJSONResponse({"items": rows, "next_cursor": next_cursor})
+    customers, next_cursor = crud_customer.get_customers(
         db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         name=name,
         email=email
     )
+    return Page(items=customers, next_cursor=next_cursor)
 
 @router.put("/{customer_id}", response_model=CustomerResponse)
 def update_customer(
     customer_id: int,
     customer: CustomerUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
-    updated_customer = crud_customer.update_customer(db, customer_id=customer_id, customer=customer)
+    updated_customer = crud_customer.update_customer(
+        db,
+        customer_id=customer_id,
+        update_data=customer,
+        expected_version=conditional.if_match_version(request, "customers", customer_id)
+    )
     if not updated_customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found"
         )
+    conditional.set_etag(response, conditional.etag_for("customers", updated_customer.id, updated_customer.version))
     return updated_customer
 
 @router.delete("/{customer_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_customer(customer_id: int, db: Session = Depends(get_db)):
-    if not crud_customer.delete_customer(db, customer_id=customer_id):
+def delete_customer(customer_id: int, request: Request, db: Session = Depends(get_db)):
+    expected_version = conditional.if_match_version(request, "customers", customer_id)
+    if not crud_customer.delete_customer(db, customer_id=customer_id, expected_version=expected_version):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found"
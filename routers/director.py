@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from ..crud import director as crud_director
-from ..schemas import DirectorCreate, DirectorUpdate, DirectorResponse
-from ..database import get_db
+from crud import directors as crud_director
+from crud import credits as crud_credits
+from schemas import DirectorCreate, DirectorUpdate, DirectorResponse
+from database import get_db
+import schemas
+from .pagination import Batch, BatchRequest, Page, page_limit
+from . import conditional
 
 router = APIRouter()
 
@@ -11,23 +15,38 @@ def create_director(director: DirectorCreate, db: Session = Depends(get_db)):
     return crud_director.create_director(db=db, director=director)
 
 @router.get("/{director_id}", response_model=DirectorResponse)
-def read_director(director_id: int, db: Session = Depends(get_db)):
+def read_director(director_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    not_modified = conditional.check(request, "directors", director_id, lambda: crud_director.get_director_version(db, director_id))
+    if not_modified is not None:
+        return not_modified
     db_director = crud_director.get_director(db, director_id=director_id)
     if not db_director:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Director not found"
         )
+    conditional.set_headers(response, "directors", conditional.etag_for("directors", db_director.id, db_director.version))
     return db_director
 
-@router.get("/", response_model=list[DirectorResponse])
+@router.post("/batch", response_model=Batch[DirectorResponse])
+def read_directors_batch(request: BatchRequest, db: Session = Depends(get_db)):
+    items, missing = crud_director.get_directors_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/{director_id}/plays", response_model=Page[schemas.Play])
+def list_director_plays(director_id: int, cursor: str = None, limit: int = page_limit(), db: Session = Depends(get_db)):
+    plays, next_cursor = crud_credits.get_plays_for(db, "directors", director_id, cursor=cursor, limit=limit)
+    return Page(items=plays, next_cursor=next_cursor)
+
+@router.get("/", response_model=Page[DirectorResponse])
 def list_directors(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str = None,
+    limit: int = page_limit(),
     name: str = None,
     db: Session = Depends(get_db)
 ):
-    return crud_director.get_directors(db, skip=skip, limit=limit, name=name)
+    directors, next_cursor = crud_director.get_directors(db, cursor=cursor, limit=limit, name=name)
+    return Page(items=directors, next_cursor=next_cursor)
 
 @router.put("/{director_id}", response_model=DirectorResponse)
 def update_director(
@@ -35,7 +54,7 @@ def update_director(
     director: DirectorUpdate,
     db: Session = Depends(get_db)
 ):
-    updated_director = crud_director.update_director(db, director_id=director_id, director=director)
+    updated_director = crud_director.update_director(db, director_id=director_id, update_data=director)
     if not updated_director:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
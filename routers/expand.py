@@ -0,0 +1,18 @@
+from typing import List, Optional
+import schemas
+from schemas import CustomerResponse, ShowtimeResponse, TicketResponse
+
+
+class ShowtimeWithPlay(ShowtimeResponse):
+    play: Optional[schemas.Play] = None
+
+
+class ShowtimeExpandedResponse(ShowtimeWithPlay):
+    tickets: List[TicketResponse] = []
+    # More confirmed tickets exist than EXPAND_TICKETS_LIMIT let into ``tickets``.
+    tickets_truncated: bool = False
+
+
+class TicketExpandedResponse(TicketResponse):
+    showtime: Optional[ShowtimeWithPlay] = None
+    customer: Optional[CustomerResponse] = None
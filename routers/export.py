@@ -0,0 +1,52 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from crud import exports as crud_exports
+from database import SessionLocal
+
+router = APIRouter()
+
+_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _stream(stmt, columns, fmt: str, filename: str) -> StreamingResponse:
+    if fmt not in _MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'csv'")
+
+    # The session is owned by the generator rather than Depends(get_db): it
+    # must stay open until the last chunk is sent, after the endpoint returns.
+    def body():
+        with SessionLocal() as db:
+            rows = crud_exports.stream_rows(db, stmt)
+            if fmt == "csv":
+                yield from crud_exports.csv_lines(rows, columns)
+            else:
+                yield from crud_exports.ndjson_lines(rows, columns)
+
+    return StreamingResponse(
+        body(),
+        media_type=_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    )
+
+@router.get("/tickets")
+def export_tickets(
+    format: str = "ndjson",
+    showtime_id: int = None,
+    play_id: int = None,
+    date_from: datetime = None,
+    date_to: datetime = None
+):
+    stmt = crud_exports.ticket_export_query(showtime_id, play_id, date_from, date_to)
+    return _stream(stmt, crud_exports.TICKET_COLUMNS, format, "tickets")
+
+@router.get("/customers")
+def export_customers(
+    format: str = "ndjson",
+    showtime_id: int = None,
+    play_id: int = None,
+    date_from: datetime = None,
+    date_to: datetime = None
+):
+    stmt = crud_exports.customer_export_query(showtime_id, play_id, date_from, date_to)
+    return _stream(stmt, crud_exports.CUSTOMER_COLUMNS, format, "customers")
@@ -0,0 +1,24 @@
+import os
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+from database import engine
+
+router = APIRouter()
+
+@router.get("/healthz", include_in_schema=False)
+def read_liveness():
+    """The process is up and serving; says nothing about the database."""
+    return {"status": "ok", "pid": os.getpid()}
+
+@router.get("/readyz", include_in_schema=False)
+def read_readiness(request: Request):
+    """200 once this worker is warmed up and can reach the database, 503 otherwise."""
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse({"status": "starting", "pid": os.getpid()}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
+    except SQLAlchemyError:
+        return JSONResponse({"status": "database unavailable", "pid": os.getpid()}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return {"status": "ready", "pid": os.getpid()}
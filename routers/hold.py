@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List
+from crud import holds as crud_holds
+from database import get_db
+
+router = APIRouter()
+
+
+class HoldCreate(BaseModel):
+    customer_id: int
+    showtime_id: int
+    seats: List[str]
+
+
+class HoldResponse(BaseModel):
+    ticket_ids: List[int]
+    seats: List[str]
+    expires_at: datetime
+    hold_token: str
+
+
+class HoldTickets(BaseModel):
+    customer_id: int
+    hold_token: str
+    ticket_ids: List[int]
+
+@router.post("/", response_model=HoldResponse, status_code=status.HTTP_201_CREATED)
+def create_hold(hold: HoldCreate, db: Session = Depends(get_db)):
+    return crud_holds.create_hold(db, hold.customer_id, hold.showtime_id, hold.seats)
+
+@router.post("/confirm", response_model=List[int])
+def confirm_hold(hold: HoldTickets, db: Session = Depends(get_db)):
+    return crud_holds.confirm_hold(db, hold.customer_id, hold.hold_token, hold.ticket_ids)
+
+@router.post("/release", status_code=status.HTTP_204_NO_CONTENT)
+def release_hold(hold: HoldTickets, db: Session = Depends(get_db)):
+    crud_holds.release_hold(db, hold.customer_id, hold.hold_token, hold.ticket_ids)
+
+@router.get("/metrics")
+def read_hold_metrics():
+    return crud_holds.hold_metrics.snapshot()
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, File, UploadFile
+from sqlalchemy.orm import Session
+import io
+from crud import importer as crud_importer
+from database import get_db
+
+router = APIRouter()
+
+@router.post("/{kind}")
+def import_file(
+    kind: str,
+    file: UploadFile = File(...),
+    chunk_size: int = crud_importer.DEFAULT_CHUNK_SIZE,
+    use_copy: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Load a CSV of plays, customers or showtimes; returns per-row errors."""
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    report = crud_importer.import_csv(db, kind, stream, chunk_size=chunk_size, use_copy=use_copy)
+    return report.as_dict()
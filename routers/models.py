@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Index, LargeBinary, UniqueConstraint
+from sqlalchemy import DDL, event, func, literal_column, text
 from sqlalchemy.orm import relationship
 from database import Base
 import datetime
 
+# Ticket.status values. Held tickets only reserve their seat; everything that
+# counts sales (counters, rollups, exports, ticket lists) looks at confirmed ones.
+HELD = "held"
+CONFIRMED = "confirmed"
+
 class Play(Base):
     __tablename__ = "plays"
 
@@ -10,10 +16,18 @@ class Play(Base):
     title = Column(String, unique=True, index=True, nullable=False)
     description = Column(Text)
     duration_minutes = Column(Integer)
+    genre = Column(String, index=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    # Bumped by crud.versions on every change; the ETag of the resource.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow)
 
     # Relationships
     showtimes = relationship("Showtime", back_populates="play")
+    # Read-only views of the association tables; crud.credits writes the
+    # links with set-based INSERT/DELETE statements instead of collections.
+    directors = relationship("Director", secondary="play_directors", viewonly=True)
+    actors = relationship("Actor", secondary="play_actors", viewonly=True)
 
 
 class Director(Base):
@@ -22,8 +36,11 @@ class Director(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     bio = Column(Text)
+    # Bumped by crud.versions on every change; the ETag of the resource.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow)
 
-    # You can link director to plays if needed (one-to-many)
+    plays = relationship("Play", secondary="play_directors", viewonly=True)
 
 
 class Actor(Base):
@@ -32,6 +49,33 @@ class Actor(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     bio = Column(Text)
+    # Bumped by crud.versions on every change; the ETag of the resource.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    plays = relationship("Play", secondary="play_actors", viewonly=True)
+
+
+class PlayDirector(Base):
+    __tablename__ = "play_directors"
+    __table_args__ = (
+        # The primary key serves play -> directors; this serves director -> plays.
+        Index("ix_play_directors_director_id_play_id", "director_id", "play_id"),
+    )
+
+    play_id = Column(Integer, ForeignKey("plays.id", ondelete="CASCADE"), primary_key=True)
+    director_id = Column(Integer, ForeignKey("directors.id", ondelete="CASCADE"), primary_key=True)
+
+
+class PlayActor(Base):
+    __tablename__ = "play_actors"
+    __table_args__ = (
+        # The primary key serves play -> actors; this serves actor -> plays.
+        Index("ix_play_actors_actor_id_play_id", "actor_id", "play_id"),
+    )
+
+    play_id = Column(Integer, ForeignKey("plays.id", ondelete="CASCADE"), primary_key=True)
+    actor_id = Column(Integer, ForeignKey("actors.id", ondelete="CASCADE"), primary_key=True)
 
 
 class Customer(Base):
@@ -40,27 +84,214 @@ class Customer(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     email = Column(String, unique=True, index=True)
+    # Optimistic concurrency: writes with If-Match must name the current version.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
 
 class Showtime(Base):
     __tablename__ = "showtimes"
+    __table_args__ = (
+        # Keyset pagination order for list_showtimes.
+        Index("ix_showtimes_show_date_id", "show_date", "id"),
+        # list_showtimes?play_id=...&start_time_from=...: equality, range, then keyset order.
+        Index("ix_showtimes_play_id_show_date", "play_id", "show_date", "id"),
+        # "What's on at this venue between two times".
+        Index("ix_showtimes_location_show_date", "location", "show_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     play_id = Column(Integer, ForeignKey("plays.id"))
-    show_date = Column(DateTime)
+    show_date = Column(DateTime, nullable=False)
     location = Column(String)
+    # Bumped by crud.versions on every change; the ETag of the resource.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow)
 
     play = relationship("Play", back_populates="showtimes")
     tickets = relationship("Ticket", back_populates="showtime")
+    seat_inventory = relationship("SeatInventory", back_populates="showtime", uselist=False)
 
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Also serves list_tickets?showtime_id=... as its leading column.
+        UniqueConstraint("showtime_id", "seat_number", name="uq_tickets_showtime_seat"),
+        Index("ix_tickets_customer_id_id", "customer_id", "id"),
+        # Booking history: covering on PostgreSQL, so the ticket side of the
+        # history join never visits the heap.
+        Index(
+            "ix_tickets_customer_showtime",
+            "customer_id",
+            "showtime_id",
+            postgresql_include=["id", "seat_number", "status"]
+        ),
+        # Only held tickets are indexed; the hold sweeper scans this in expiry order.
+        Index(
+            "ix_tickets_hold_expires_at",
+            "hold_expires_at",
+            postgresql_where=text("status = 'held'"),
+            sqlite_where=text("status = 'held'")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     customer_id = Column(Integer, ForeignKey("customers.id"))
     showtime_id = Column(Integer, ForeignKey("showtimes.id"))
     seat_number = Column(String)
+    # "held" tickets block their seat until hold_expires_at, then the sweeper
+    # removes them unless they were confirmed. hold_token is the secret that
+    # confirming or releasing the hold has to present.
+    status = Column(String, nullable=False, default=CONFIRMED)
+    hold_expires_at = Column(DateTime)
+    hold_token = Column(String)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     customer = relationship("Customer")
     showtime = relationship("Showtime", back_populates="tickets")
+
+
+class SeatInventory(Base):
+    __tablename__ = "seat_inventory"
+
+    # One row per showtime; seat state is kept as two bitmaps over the
+    # auditorium layout (bit i = row i // seats_per_row, seat i % seats_per_row).
+    showtime_id = Column(Integer, ForeignKey("showtimes.id"), primary_key=True)
+    rows = Column(Integer, nullable=False)
+    seats_per_row = Column(Integer, nullable=False)
+    reserved = Column(LargeBinary, nullable=False)
+    sold = Column(LargeBinary, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
+
+    showtime = relationship("Showtime", back_populates="seat_inventory")
+
+
+class ShowtimeAvailability(Base):
+    __tablename__ = "showtime_availability"
+
+    # Maintained in the same transaction as every ticket write; rebuilt from
+    # the tickets table by crud.availability.rebuild_availability().
+    showtime_id = Column(Integer, ForeignKey("showtimes.id"), primary_key=True)
+    capacity = Column(Integer)
+    sold = Column(Integer, nullable=False, default=0)
+    # Seats under unexpired or unswept holds; not part of ``sold``.
+    held = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+class ScheduleEntry(Base):
+    __tablename__ = "schedule_entries"
+    __table_args__ = (
+        # Day/week grids are one range scan on (show_day, location, show_date)
+        # and never touch showtimes or plays.
+        Index("ix_schedule_entries_day_location", "show_day", "location", "show_date"),
+    )
+
+    # Denormalized copy of a showtime and its play title, bucketed by day.
+    # Kept in sync by crud.schedule in the same transaction as showtime and
+    # play writes.
+    showtime_id = Column(Integer, ForeignKey("showtimes.id", ondelete="CASCADE"), primary_key=True)
+    show_day = Column(Date, nullable=False)
+    location = Column(String)
+    show_date = Column(DateTime, nullable=False)
+    play_id = Column(Integer, ForeignKey("plays.id"))
+    play_title = Column(String)
+
+
+# Sales rollups, maintained by crud.analytics in the same transaction as the
+# availability counters and rebuilt from tickets by rebuild_analytics().
+class PlaySales(Base):
+    __tablename__ = "play_sales"
+    __table_args__ = (
+        # Top-N plays is a backwards scan of this index.
+        Index("ix_play_sales_sold", "sold"),
+    )
+
+    play_id = Column(Integer, ForeignKey("plays.id"), primary_key=True)
+    sold = Column(Integer, nullable=False, default=0)
+
+
+class LocationOccupancy(Base):
+    __tablename__ = "location_occupancy"
+
+    location = Column(String, primary_key=True)
+    sold = Column(Integer, nullable=False, default=0)
+    # Sum of the seat capacities of this location's showtimes.
+    capacity = Column(Integer, nullable=False, default=0)
+
+
+class DailySales(Base):
+    __tablename__ = "daily_sales"
+
+    # UTC day the tickets were issued (Ticket.created_at).
+    day = Column(Date, primary_key=True)
+    sold = Column(Integer, nullable=False, default=0)
+
+
+class SalesDelta(Base):
+    __tablename__ = "sales_deltas"
+
+    # Pending changes to the three rollups above. Ticket writes only append
+    # here, so no purchase waits on a shared rollup row; the analytics folder
+    # sums them into the rollups and deletes them. play_id and location are
+    # the showtime's when the change was made, so a later move of the
+    # showtime cannot count it twice. day is NULL for changes that do not
+    # belong to the daily series.
+    id = Column(Integer, primary_key=True)
+    play_id = Column(Integer)
+    location = Column(String)
+    day = Column(Date)
+    sold = Column(Integer, nullable=False, default=0)
+    capacity = Column(Integer, nullable=False, default=0)
+
+
+class IdempotencyRecord(Base):
+    __tablename__ = "idempotency_keys"
+
+    # Response of a POST made with an Idempotency-Key header, replayed to
+    # retries of the same request until expires_at. status_code is NULL while
+    # the first request is still running, which it claimed at claimed_at; body
+    # is NULL when the response was too large to keep.
+    key = Column(String, primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer)
+    content_type = Column(String)
+    body = Column(LargeBinary)
+    claimed_at = Column(DateTime)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
+# Full-text and trigram search (PostgreSQL only; other dialects skip the DDL
+# and crud.search falls back to ILIKE).
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
+def _search_vector(name, body):
+    return func.to_tsvector(
+        literal_column("'english'"),
+        func.coalesce(name, "") + " " + func.coalesce(body, "")
+    )
+
+
+# model -> (name column, body column, tsvector expression). crud.search must
+# use these exact expressions for the planner to pick the GIN indexes below.
+SEARCH_FIELDS = {
+    Play: (Play.title, Play.description, _search_vector(Play.title, Play.description)),
+    Actor: (Actor.name, Actor.bio, _search_vector(Actor.name, Actor.bio)),
+    Director: (Director.name, Director.bio, _search_vector(Director.name, Director.bio)),
+}
+
+for _model, (_name, _body, _vector) in SEARCH_FIELDS.items():
+    _table = _model.__tablename__
+    Index(f"ix_{_table}_search", _vector, postgresql_using="gin").ddl_if(dialect="postgresql")
+    Index(
+        f"ix_{_table}_{_name.key}_trgm",
+        _name,
+        postgresql_using="gin",
+        postgresql_ops={_name.key: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+
@@ -0,0 +1,26 @@
+from fastapi import Query
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+from crud.keyset import MAX_PAGE_SIZE
+
+T = TypeVar("T")
+
+
+def page_limit(default: int = 100):
+    """The ``limit`` parameter of a keyset page; values outside 1..MAX_PAGE_SIZE are a 422."""
+    return Query(default, ge=1, le=MAX_PAGE_SIZE)
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class BatchRequest(BaseModel):
+    ids: List[int]
+
+
+class Batch(BaseModel, Generic[T]):
+    # Same order as the requested ids; null where no row exists.
+    items: List[Optional[T]]
+    missing: List[int] = []
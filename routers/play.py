@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from .. import schemas
+from typing import List
+import schemas
+from .pagination import Batch, BatchRequest, Page, page_limit
+from . import conditional
 from database import get_db
+from config import FAST_LIST_RESPONSES
+from responses import FastJSONResponse
 from crud import play as crud_play
+from crud import credits as crud_credits
 
 router = APIRouter()
 
@@ -14,25 +21,82 @@ def create_play_endpoint(
     return crud_play.create_play(db=db, play=play)
 
 @router.get('/{play_id}', response_model=schemas.Play)
-def read_play(play_id: int, db: Session = Depends(get_db)):
+def read_play(play_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    not_modified = conditional.check(request, 'plays', play_id, lambda: crud_play.get_play_version(db, play_id))
+    if not_modified is not None:
+        return not_modified
     play = crud_play.get_play(db, play_id=play_id)
     if not play:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail='Play not found'
         )
+    conditional.set_headers(response, 'plays', conditional.etag_for('plays', play.id, play.version))
     return play
 
-@router.get('/', response_model=list[schemas.Play])
+@router.post('/batch', response_model=Batch[schemas.Play])
+def read_plays_batch(request: BatchRequest, db: Session = Depends(get_db)):
+    items, missing = crud_play.get_plays_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get('/', response_model=Page[schemas.Play])
 def read_plays(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    cursor: str = None,
+    limit: int = page_limit(),
     genre: str = None,
     db: Session = Depends(get_db)
 ):
-    return crud_play.get_plays(
+    # The page's (id, version) pairs decide the ETag; a match skips the full read.
+    versions, next_cursor = crud_play.get_play_versions(db, cursor=cursor, limit=limit, genre=genre)
+    etag = conditional.list_etag('plays', versions, next_cursor)
+    not_modified = conditional.not_modified(request, 'plays', etag)
+    if not_modified is not None:
+        return not_modified
+    if FAST_LIST_RESPONSES:
+        rows, next_cursor = crud_play.get_play_rows(
+            db,
+            cursor=cursor,
+            limit=limit,
+            genre=genre
+        )
+        fast = FastJSONResponse({'items': rows, 'next_cursor': next_cursor})
+        conditional.set_headers(fast, 'plays', etag)
+        return fast
+    plays, next_cursor = crud_play.get_plays(
         db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         genre=genre
     )
+    conditional.set_headers(response, 'plays', etag)
+    return Page(items=plays, next_cursor=next_cursor)
+
+class CreditChange(BaseModel):
+    play_id: int
+    changed: int
+
+@router.post('/{play_id}/directors', response_model=CreditChange)
+def add_play_directors(play_id: int, request: BatchRequest, db: Session = Depends(get_db)):
+    return CreditChange(play_id=play_id, changed=crud_credits.add_credits(db, play_id, 'directors', request.ids))
+
+@router.post('/{play_id}/directors/remove', response_model=CreditChange)
+def remove_play_directors(play_id: int, request: BatchRequest, db: Session = Depends(get_db)):
+    return CreditChange(play_id=play_id, changed=crud_credits.remove_credits(db, play_id, 'directors', request.ids))
+
+@router.get('/{play_id}/directors', response_model=List[schemas.DirectorResponse])
+def read_play_directors(play_id: int, db: Session = Depends(get_db)):
+    return crud_credits.get_credits(db, play_id, 'directors')
+
+@router.post('/{play_id}/actors', response_model=CreditChange)
+def add_play_actors(play_id: int, request: BatchRequest, db: Session = Depends(get_db)):
+    return CreditChange(play_id=play_id, changed=crud_credits.add_credits(db, play_id, 'actors', request.ids))
+
+@router.post('/{play_id}/actors/remove', response_model=CreditChange)
+def remove_play_actors(play_id: int, request: BatchRequest, db: Session = Depends(get_db)):
+    return CreditChange(play_id=play_id, changed=crud_credits.remove_credits(db, play_id, 'actors', request.ids))
+
+@router.get('/{play_id}/actors', response_model=List[schemas.ActorResponse])
+def read_play_actors(play_id: int, db: Session = Depends(get_db)):
+    return crud_credits.get_credits(db, play_id, 'actors')
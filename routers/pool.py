@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from database import get_pool_stats
+
+router = APIRouter()
+
+@router.get("/")
+def read_pool_stats():
+    """Checked-out/overflow counts and checkout wait-time histogram per engine."""
+    return get_pool_stats()
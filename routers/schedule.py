@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.orm import Session
+from datetime import date, datetime
+from typing import Dict, List
+from crud import schedule as crud_schedule
+from database import get_db
+
+router = APIRouter()
+
+
+class ScheduleEntryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    showtime_id: int
+    show_date: datetime
+    location: str = None
+    play_id: int = None
+    play_title: str = None
+
+
+ScheduleGrid = Dict[str, Dict[str, List[ScheduleEntryResponse]]]
+
+@router.get("/day", response_model=ScheduleGrid)
+def read_day(day: date, location: str = None, db: Session = Depends(get_db)):
+    return crud_schedule.get_grid(db, day, 1, location)
+
+@router.get("/week", response_model=ScheduleGrid)
+def read_week(start: date, location: str = None, db: Session = Depends(get_db)):
+    return crud_schedule.get_grid(db, start, 7, location)
+
+@router.get("/between", response_model=List[ScheduleEntryResponse])
+def read_between(location: str, start: datetime, end: datetime, db: Session = Depends(get_db)):
+    return crud_schedule.get_between(db, location, start, end)
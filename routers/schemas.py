@@ -0,0 +1,132 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# Request and response models. Responses read straight from ORM rows
+# (from_attributes) and carry ``version``, the number behind each ETag.
+
+
+class PlayBase(BaseModel):
+    title: str
+    description: Optional[str] = None
+    duration_minutes: Optional[int] = None
+    genre: Optional[str] = None
+
+
+class PlayCreate(PlayBase):
+    pass
+
+
+class PlayUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    duration_minutes: Optional[int] = None
+    genre: Optional[str] = None
+
+
+class Play(PlayBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    created_at: Optional[datetime] = None
+    version: int = 1
+
+
+class DirectorCreate(BaseModel):
+    name: str
+    bio: Optional[str] = None
+
+
+class DirectorUpdate(BaseModel):
+    name: Optional[str] = None
+    bio: Optional[str] = None
+
+
+class DirectorResponse(DirectorCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    version: int = 1
+
+
+class ActorCreate(BaseModel):
+    name: str
+    bio: Optional[str] = None
+
+
+class ActorUpdate(BaseModel):
+    name: Optional[str] = None
+    bio: Optional[str] = None
+
+
+class ActorResponse(ActorCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    version: int = 1
+
+
+class CustomerCreate(BaseModel):
+    name: str
+    email: Optional[str] = None
+
+
+class CustomerUpdate(BaseModel):
+    name: Optional[str] = None
+    email: Optional[str] = None
+
+
+class CustomerResponse(CustomerCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    version: int = 1
+
+
+class ShowtimeCreate(BaseModel):
+    play_id: int
+    show_date: datetime
+    location: Optional[str] = None
+
+
+class ShowtimeUpdate(BaseModel):
+    play_id: Optional[int] = None
+    show_date: Optional[datetime] = None
+    location: Optional[str] = None
+
+
+class ShowtimeResponse(ShowtimeCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    version: int = 1
+
+
+class TicketCreate(BaseModel):
+    customer_id: int
+    showtime_id: int
+    seat_number: str
+
+
+class TicketUpdate(BaseModel):
+    customer_id: Optional[int] = None
+    showtime_id: Optional[int] = None
+    seat_number: Optional[str] = None
+
+    @field_validator("customer_id", "showtime_id", "seat_number")
+    @classmethod
+    def not_null(cls, value):
+        # Fields are optional so they can be left out, but a ticket always has
+        # all three: an explicit null is a client error, not a way to clear one.
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class TicketResponse(TicketCreate):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    seat_number: Optional[str] = None
+    status: str = "confirmed"
+    version: int = 1
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from typing import List
+from crud import search as crud_search
+from database import get_db
+
+router = APIRouter()
+
+
+class SearchResult(BaseModel):
+    type: str
+    id: int
+    name: str
+    score: float
+
+@router.get("/", response_model=List[SearchResult])
+def search(
+    q: str,
+    types: str = None,
+    limit: int = Query(20, ge=1, le=crud_search.MAX_RESULTS),
+    db: Session = Depends(get_db)
+):
+    """Ranked, typo-tolerant search over plays, actors and directors."""
+    kinds = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    rows = crud_search.search(db, q, types=kinds, limit=limit)
+    return [SearchResult(type=row.type, id=row.id, name=row.name, score=row.score) for row in rows]
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from typing import List
+from crud import holds as crud_holds
+from crud import seats as crud_seats
+from database import get_db
+from .hold import HoldResponse, HoldTickets
+
+router = APIRouter()
+
+
+class SeatLayout(BaseModel):
+    rows: int
+    seats_per_row: int
+
+
+class SeatSelection(BaseModel):
+    customer_id: int
+    seats: List[str]
+
+
+class SeatMapResponse(BaseModel):
+    showtime_id: int
+    rows: int
+    seats_per_row: int
+    capacity: int
+    available: int
+    reserved: List[str]
+    sold: List[str]
+
+
+def _seat_map_response(inventory) -> SeatMapResponse:
+    reserved = crud_seats.SeatMap(inventory.rows, inventory.seats_per_row, inventory.reserved)
+    sold = crud_seats.SeatMap(inventory.rows, inventory.seats_per_row, inventory.sold)
+    return SeatMapResponse(
+        showtime_id=inventory.showtime_id,
+        rows=inventory.rows,
+        seats_per_row=inventory.seats_per_row,
+        capacity=reserved.capacity,
+        available=reserved.capacity - reserved.count() - sold.count(),
+        reserved=reserved.labels(),
+        sold=sold.labels()
+    )
+
+@router.post("/{showtime_id}/seats", response_model=SeatMapResponse, status_code=status.HTTP_201_CREATED)
+def create_seat_map(showtime_id: int, layout: SeatLayout, db: Session = Depends(get_db)):
+    inventory = crud_seats.create_seat_inventory(
+        db,
+        showtime_id=showtime_id,
+        rows=layout.rows,
+        seats_per_row=layout.seats_per_row
+    )
+    return _seat_map_response(inventory)
+
+@router.get("/{showtime_id}/seats", response_model=SeatMapResponse)
+def read_seat_map(showtime_id: int, db: Session = Depends(get_db)):
+    return _seat_map_response(crud_seats.get_seat_inventory(db, showtime_id))
+
+# Reservations are holds on this showtime: owned by a customer, secured by
+# the returned hold_token and released by the sweeper when they expire.
+@router.post("/{showtime_id}/seats/reserve", response_model=HoldResponse, status_code=status.HTTP_201_CREATED)
+def reserve_seats(showtime_id: int, selection: SeatSelection, db: Session = Depends(get_db)):
+    return crud_holds.create_hold(db, selection.customer_id, showtime_id, selection.seats)
+
+@router.post("/{showtime_id}/seats/release", status_code=status.HTTP_204_NO_CONTENT)
+def release_seats(showtime_id: int, hold: HoldTickets, db: Session = Depends(get_db)):
+    crud_holds.release_hold(db, hold.customer_id, hold.hold_token, hold.ticket_ids, showtime_id)
+
+@router.post("/{showtime_id}/seats/confirm", response_model=List[int])
+def confirm_seats(showtime_id: int, hold: HoldTickets, db: Session = Depends(get_db)):
+    return crud_holds.confirm_hold(db, hold.customer_id, hold.hold_token, hold.ticket_ids, showtime_id)
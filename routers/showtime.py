@@ -1,61 +1,118 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
-from ..crud import showtime as crud_showtime
-from ..schemas import ShowtimeCreate, ShowtimeUpdate, ShowtimeResponse
-from ..database import get_db
+from crud import showtime as crud_showtime
+from crud import availability as crud_availability
+from schemas import ShowtimeCreate, ShowtimeUpdate, ShowtimeResponse
+from database import get_db
+from .pagination import Batch, BatchRequest, Page, page_limit
+from . import conditional
+from .expand import ShowtimeExpandedResponse
 
 router = APIRouter()
 
+
+class AvailabilityResponse(BaseModel):
+    showtime_id: int
+    show_date: datetime
+    location: Optional[str] = None
+    capacity: Optional[int] = None
+    sold: int
+    held: int = 0
+    available: Optional[int] = None
+
+
+def availability_response(rows) -> List[AvailabilityResponse]:
+    return [
+        AvailabilityResponse(
+            showtime_id=row.showtime_id,
+            show_date=row.show_date,
+            location=row.location,
+            capacity=row.capacity,
+            sold=row.sold,
+            held=row.held,
+            available=None if row.capacity is None else max(row.capacity - row.sold - row.held, 0)
+        )
+        for row in rows
+    ]
+
+
 @router.post("/", response_model=ShowtimeResponse, status_code=status.HTTP_201_CREATED)
 def create_showtime(showtime: ShowtimeCreate, db: Session = Depends(get_db)):
     return crud_showtime.create_showtime(db=db, showtime=showtime)
 
+@router.get("/availability", response_model=List[AvailabilityResponse])
+def read_availability(play_id: int, db: Session = Depends(get_db)):
+    return availability_response(crud_availability.get_availability(db, play_id))
+
 @router.get("/{showtime_id}", response_model=ShowtimeResponse)
-def read_showtime(showtime_id: int, db: Session = Depends(get_db)):
+def read_showtime(showtime_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    not_modified = conditional.check(request, "showtimes", showtime_id, lambda: crud_showtime.get_showtime_version(db, showtime_id))
+    if not_modified is not None:
+        return not_modified
     db_showtime = crud_showtime.get_showtime(db, showtime_id=showtime_id)
     if not db_showtime:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Showtime not found"
         )
+    conditional.set_headers(response, "showtimes", conditional.etag_for("showtimes", db_showtime.id, db_showtime.version))
     return db_showtime
 
-@router.get("/", response_model=list[ShowtimeResponse])
+@router.post("/batch", response_model=Batch[ShowtimeResponse])
+def read_showtimes_batch(request: BatchRequest, db: Session = Depends(get_db)):
+    items, missing = crud_showtime.get_showtimes_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/", response_model=Page[ShowtimeExpandedResponse])
 def list_showtimes(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str = None,
+    limit: int = page_limit(),
     play_id: int = None,
     start_time_from: datetime = None,
     start_time_to: datetime = None,
+    expand: str = None,
     db: Session = Depends(get_db)
 ):
-    return crud_showtime.get_showtimes(
+    showtimes, next_cursor = crud_showtime.get_showtimes(
         db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         play_id=play_id,
         start_time_from=start_time_from,
-        start_time_to=start_time_to
+        start_time_to=start_time_to,
+        expand=expand
     )
+    return Page(items=showtimes, next_cursor=next_cursor)
 
 @router.put("/{showtime_id}", response_model=ShowtimeResponse)
 def update_showtime(
     showtime_id: int,
     showtime: ShowtimeUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
-    updated_showtime = crud_showtime.update_showtime(db, showtime_id=showtime_id, showtime=showtime)
+    updated_showtime = crud_showtime.update_showtime(
+        db,
+        showtime_id=showtime_id,
+        update_data=showtime,
+        expected_version=conditional.if_match_version(request, "showtimes", showtime_id)
+    )
     if not updated_showtime:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Showtime not found"
         )
+    conditional.set_etag(response, conditional.etag_for("showtimes", updated_showtime.id, updated_showtime.version))
     return updated_showtime
 
 @router.delete("/{showtime_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_showtime(showtime_id: int, db: Session = Depends(get_db)):
-    if not crud_showtime.delete_showtime(db, showtime_id=showtime_id):
+def delete_showtime(showtime_id: int, request: Request, db: Session = Depends(get_db)):
+    expected_version = conditional.if_match_version(request, "showtimes", showtime_id)
+    if not crud_showtime.delete_showtime(db, showtime_id=showtime_id, expected_version=expected_version):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Showtime not found"
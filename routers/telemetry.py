@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from crud import catalog_cache
+from crud import holds as crud_holds
+from database import get_pool_stats
+from idempotency import idempotency_store
+from instrumentation import render_prometheus
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def read_metrics():
+    """Request, SQL, pool, cache and hold metrics in the Prometheus text format."""
+    counters = {
+        "catalog_cache": catalog_cache.cache_stats(),
+        "seat_holds": crud_holds.hold_metrics.snapshot(),
+    }
+    if idempotency_store is not None:
+        counters["idempotency"] = idempotency_store.stats.snapshot()
+    return PlainTextResponse(
+        render_prometheus(counters, get_pool_stats()),
+        media_type="text/plain; version=0.0.4"
+    )
@@ -1,58 +1,113 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from ..crud import ticket as crud_ticket
-from ..schemas import TicketCreate, TicketUpdate, TicketResponse
-from ..database import get_db
+from typing import List
+from crud import tickets as crud_ticket
+from schemas import TicketCreate, TicketUpdate, TicketResponse
+from models import CONFIRMED
+from database import get_db
+from config import FAST_LIST_RESPONSES
+from responses import FastJSONResponse
+from .pagination import Batch, BatchRequest, Page, page_limit
+from . import conditional
+from .expand import TicketExpandedResponse
 
 router = APIRouter()
 
+
+class TicketBulkCreate(BaseModel):
+    tickets: List[TicketCreate]
+
+
+class TicketBulkResponse(BaseModel):
+    ticket_ids: List[int]
+
+
 @router.post("/", response_model=TicketResponse, status_code=status.HTTP_201_CREATED)
 def create_ticket(ticket: TicketCreate, db: Session = Depends(get_db)):
     return crud_ticket.create_ticket(db=db, ticket=ticket)
 
+@router.post("/bulk", response_model=TicketBulkResponse, status_code=status.HTTP_201_CREATED)
+def create_tickets_bulk(order: TicketBulkCreate, db: Session = Depends(get_db)):
+    return TicketBulkResponse(ticket_ids=crud_ticket.create_tickets_bulk(db, order.tickets))
+
 @router.get("/{ticket_id}", response_model=TicketResponse)
-def read_ticket(ticket_id: int, db: Session = Depends(get_db)):
+def read_ticket(ticket_id: int, response: Response, db: Session = Depends(get_db)):
     db_ticket = crud_ticket.get_ticket(db, ticket_id=ticket_id)
     if not db_ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
         )
+    conditional.set_etag(response, conditional.etag_for("tickets", db_ticket.id, db_ticket.version))
     return db_ticket
 
-@router.get("/", response_model=list[TicketResponse])
+@router.post("/batch", response_model=Batch[TicketResponse])
+def read_tickets_batch(request: BatchRequest, db: Session = Depends(get_db)):
+    items, missing = crud_ticket.get_tickets_by_ids(db, request.ids)
+    return Batch(items=items, missing=missing)
+
+@router.get("/", response_model=Page[TicketExpandedResponse])
 def list_tickets(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str = None,
+    limit: int = page_limit(),
     showtime_id: int = None,
     customer_id: int = None,
+    ticket_status: str = Query(CONFIRMED, alias="status"),
+    expand: str = None,
     db: Session = Depends(get_db)
 ):
-    return crud_ticket.get_tickets(
+    if FAST_LIST_RESPONSES and not expand:
+        # Expanded pages nest related objects and keep the ORM path.
+        rows, next_cursor = crud_ticket.get_ticket_rows(
+            db,
+            cursor=cursor,
+            limit=limit,
+            showtime_id=showtime_id,
+            customer_id=customer_id,
+            ticket_status=ticket_status
+        )
+        for row in rows:
+            # Same keys as TicketExpandedResponse with nothing expanded.
+            row["showtime"] = row["customer"] = None
+        return FastJSONResponse({"items": rows, "next_cursor": next_cursor})
+    tickets, next_cursor = crud_ticket.get_tickets(
         db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         showtime_id=showtime_id,
-        customer_id=customer_id
+        customer_id=customer_id,
+        ticket_status=ticket_status,
+        expand=expand
     )
+    return Page(items=tickets, next_cursor=next_cursor)
 
 @router.put("/{ticket_id}", response_model=TicketResponse)
 def update_ticket(
     ticket_id: int,
     ticket: TicketUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
-    updated_ticket = crud_ticket.update_ticket(db, ticket_id=ticket_id, ticket=ticket)
+    updated_ticket = crud_ticket.update_ticket(
+        db,
+        ticket_id=ticket_id,
+        update_data=ticket,
+        expected_version=conditional.if_match_version(request, "tickets", ticket_id)
+    )
     if not updated_ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
         )
+    conditional.set_etag(response, conditional.etag_for("tickets", updated_ticket.id, updated_ticket.version))
     return updated_ticket
 
 @router.delete("/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_ticket(ticket_id: int, db: Session = Depends(get_db)):
-    if not crud_ticket.delete_ticket(db, ticket_id=ticket_id):
+def delete_ticket(ticket_id: int, request: Request, db: Session = Depends(get_db)):
+    expected_version = conditional.if_match_version(request, "tickets", ticket_id)
+    if not crud_ticket.delete_ticket(db, ticket_id=ticket_id, expected_version=expected_version):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found"
@@ -0,0 +1,99 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "app"), os.path.join(ROOT, "routers")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Settings are read at import time, so they are pinned before the app is
+# imported: a throwaway SQLite file, no background jobs or warm-up, and no
+# catalog cache between the tests and the database.
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="cinema-tests-"), "test.db")
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["HOLD_SWEEPER_ENABLED"] = "false"
+os.environ["ANALYTICS_FOLD_ENABLED"] = "false"
+os.environ["WARMUP_ENABLED"] = "false"
+os.environ["CACHE_BACKEND"] = "none"
+os.environ["IDEMPOTENCY_BACKEND"] = "none"
+
+import datetime
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    from database import Base, engine
+    import models  # noqa: F401  (registers the tables)
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def db(db_engine):
+    from database import SessionLocal
+
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def catalog(db_engine):
+    """Plays with showtimes, customers and confirmed tickets spread across them."""
+    from database import SessionLocal
+    from models import Customer, Play, Showtime, Ticket
+
+    with SessionLocal() as session:
+        plays = [Play(title=f"Play {i}") for i in range(3)]
+        customers = [Customer(name=f"Customer {i}", email=f"customer{i}@example.com") for i in range(5)]
+        session.add_all(plays + customers)
+        session.flush()
+        showtimes = [
+            Showtime(play_id=play.id, show_date=datetime.datetime(2030, 1, 1 + i, 20), location="Main")
+            for play in plays for i in range(2)
+        ]
+        session.add_all(showtimes)
+        session.flush()
+        session.add_all([
+            Ticket(customer_id=customers[i % len(customers)].id, showtime_id=showtime.id, seat_number=f"A{i + 1}")
+            for showtime in showtimes for i in range(4)
+        ])
+        session.commit()
+        return {
+            "plays": [play.id for play in plays],
+            "showtimes": [showtime.id for showtime in showtimes],
+            "customers": [customer.id for customer in customers],
+        }
+
+
+@pytest.fixture(scope="session")
+def client(db_engine):
+    from fastapi.testclient import TestClient
+    from main import create_app
+
+    with TestClient(create_app("sync")) as test_client:
+        yield test_client
+
+
+@pytest.fixture()
+def seated(client, db, catalog):
+    """A showtime of its own with a 2 x 5 seat map, deleted afterwards with its tickets."""
+    from crud import seats as crud_seats
+    from crud import tickets as crud_tickets
+    from models import Ticket
+
+    showtime_id = client.post("/showtimes/", json={
+        "play_id": catalog["plays"][0],
+        "show_date": "2030-04-01T20:00:00",
+        "location": "Seat map hall",
+    }).json()["id"]
+    crud_seats.create_seat_inventory(db, showtime_id, 2, 5)
+    yield showtime_id
+    db.rollback()
+    for (ticket_id,) in db.query(Ticket.id).filter(Ticket.showtime_id == showtime_id).all():
+        crud_tickets.delete_ticket(db, ticket_id)
+    client.delete(f"/showtimes/{showtime_id}")
@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import func, select
+
+from crud import analytics as crud_analytics
+from models import LocationOccupancy, PlaySales, SalesDelta
+
+
+def sold(db, model, **key):
+    db.rollback()
+    column, value = next(iter(key.items()))
+    return db.execute(select(model.sold).where(getattr(model, column) == value)).scalar() or 0
+
+
+def pending(db):
+    db.rollback()
+    return db.execute(select(func.count()).select_from(SalesDelta)).scalar()
+
+
+@pytest.fixture()
+def created(client):
+    """Paths of the rows a test made, deleted afterwards so other tests see the plain catalog."""
+    paths = []
+    yield paths
+    for path in reversed(paths):
+        client.delete(path)
+
+
+def new_showtime(client, created, play_id, location):
+    response = client.post("/showtimes/", json={
+        "play_id": play_id,
+        "show_date": "2030-03-01T20:00:00",
+        "location": location,
+    })
+    assert response.status_code in (200, 201), response.text
+    created.append(f"/showtimes/{response.json()['id']}")
+    return response.json()["id"]
+
+
+def sell(client, created, catalog, showtime_id, seats):
+    for seat in seats:
+        response = client.post("/tickets/", json={
+            "customer_id": catalog["customers"][0],
+            "showtime_id": showtime_id,
+            "seat_number": seat,
+        })
+        assert response.status_code in (200, 201), response.text
+        created.append(f"/tickets/{response.json()['id']}")
+
+
+def test_sales_reach_the_rollups_only_when_folded(client, db, catalog, created):
+    play_id = catalog["plays"][0]
+    crud_analytics.fold_deltas(db)
+    before = sold(db, PlaySales, play_id=play_id)
+
+    sell(client, created, catalog, new_showtime(client, created, play_id, "Fold hall"), ["F1", "F2"])
+    assert sold(db, PlaySales, play_id=play_id) == before
+    assert pending(db) > 0
+
+    assert crud_analytics.fold_deltas(db) > 0
+    assert pending(db) == 0
+    assert sold(db, PlaySales, play_id=play_id) == before + 2
+    assert sold(db, LocationOccupancy, location="Fold hall") == 2
+
+
+def test_moving_a_showtime_before_the_fold_counts_its_sales_once(client, db, catalog, created):
+    old_play, new_play = catalog["plays"][1], catalog["plays"][2]
+    crud_analytics.fold_deltas(db)
+    old_before = sold(db, PlaySales, play_id=old_play)
+    new_before = sold(db, PlaySales, play_id=new_play)
+
+    showtime_id = new_showtime(client, created, old_play, "Move hall")
+    sell(client, created, catalog, showtime_id, ["M1", "M2", "M3"])
+    response = client.put(f"/showtimes/{showtime_id}", json={"play_id": new_play, "location": "Moved hall"})
+    assert response.status_code == 200, response.text
+
+    crud_analytics.fold_deltas(db)
+    assert sold(db, PlaySales, play_id=old_play) == old_before
+    assert sold(db, PlaySales, play_id=new_play) == new_before + 3
+    assert sold(db, LocationOccupancy, location="Move hall") == 0
+    assert sold(db, LocationOccupancy, location="Moved hall") == 3
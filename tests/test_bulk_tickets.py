@@ -0,0 +1,33 @@
+from crud import availability as crud_availability
+from crud import seats as crud_seats
+from crud import tickets as crud_tickets
+from schemas import TicketCreate
+
+
+def test_bulk_orders_lock_showtimes_in_id_order(db, catalog, monkeypatch):
+    claimed, counted = [], []
+    claim_seats, adjust_sold = crud_seats.claim_seats, crud_availability.adjust_sold
+
+    def record_claim(db, showtime_id, seats):
+        claimed.append(showtime_id)
+        return claim_seats(db, showtime_id, seats)
+
+    def record_count(db, showtime_id, delta, sold_on=None):
+        counted.append(showtime_id)
+        return adjust_sold(db, showtime_id, delta, sold_on)
+
+    monkeypatch.setattr(crud_seats, "claim_seats", record_claim)
+    monkeypatch.setattr(crud_availability, "adjust_sold", record_count)
+
+    showtimes = list(reversed(catalog["showtimes"][:3]))
+    tickets = [
+        TicketCreate(customer_id=catalog["customers"][0], showtime_id=showtime_id, seat_number=f"O{n}")
+        for n, showtime_id in enumerate(showtimes + showtimes)
+    ]
+    ticket_ids = crud_tickets.create_tickets_bulk(db, tickets)
+    try:
+        assert claimed == sorted(showtimes)
+        assert counted == sorted(showtimes)
+    finally:
+        for ticket_id in ticket_ids:
+            crud_tickets.delete_ticket(db, ticket_id)
@@ -0,0 +1,40 @@
+from caching import MISSING, LRUCache
+
+# A reader that loaded a row just before a write committed must not put that
+# row back into the cache after the write invalidated it.
+
+
+def test_catalog_fill_racing_a_write_is_not_served(db, catalog, monkeypatch):
+    from crud import catalog_cache
+    from models import Play
+
+    monkeypatch.setattr(catalog_cache, "catalog_cache", LRUCache())
+    pk = catalog["plays"][0]
+    stale = db.get(Play, pk)
+
+    def loader_overtaken_by_write():
+        catalog_cache.invalidate(Play, pk)
+        return stale
+
+    assert catalog_cache.get_one(db, Play, pk, loader_overtaken_by_write) is stale
+    assert catalog_cache.peek(Play, pk) is None
+    assert catalog_cache.get_many(db, Play, [pk], lambda pks: [stale]) == {pk: stale}
+    catalog_cache.invalidate(Play, pk)
+    assert catalog_cache.peek(Play, pk) is None
+
+
+def test_booking_fill_racing_a_write_is_not_served(db, catalog, monkeypatch):
+    from crud import bookings as crud_bookings
+
+    monkeypatch.setattr(crud_bookings, "booking_cache", LRUCache())
+    customer_id = catalog["customers"][0]
+    history_query = crud_bookings.history_query
+
+    def history_overtaken_by_write(cid):
+        db.info[crud_bookings._DIRTY] = {cid}
+        crud_bookings._invalidate_after_commit(db)
+        return history_query(cid)
+
+    monkeypatch.setattr(crud_bookings, "history_query", history_overtaken_by_write)
+    crud_bookings.get_booking_history(db, customer_id)
+    assert crud_bookings.booking_cache.get(crud_bookings._key(customer_id)) is MISSING
@@ -0,0 +1,15 @@
+import pytest
+
+
+@pytest.mark.parametrize("kind", ["directors", "actors"])
+def test_removing_credits_from_a_missing_play_is_404(client, kind):
+    response = client.post(f"/plays/999999/{kind}/remove", json={"ids": [1]})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Play not found"
+
+
+@pytest.mark.parametrize("kind", ["directors", "actors"])
+def test_removing_unlinked_credits_changes_nothing(client, catalog, kind):
+    response = client.post(f"/plays/{catalog['plays'][0]}/{kind}/remove", json={"ids": [1]})
+    assert response.status_code == 200
+    assert response.json() == {"play_id": catalog["plays"][0], "changed": 0}
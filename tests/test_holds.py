@@ -0,0 +1,83 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+import sweeper
+from crud import holds as crud_holds
+from crud import seats as crud_seats
+from models import HELD, ShowtimeAvailability, Ticket
+
+
+def reserved(db, showtime_id, seat):
+    db.rollback()
+    inventory = crud_seats.get_seat_inventory(db, showtime_id)
+    seats = crud_seats.SeatMap(inventory.rows, inventory.seats_per_row, inventory.reserved)
+    return seats.is_set(seats.index(seat))
+
+
+def held(db, showtime_id):
+    db.rollback()
+    return db.execute(
+        select(ShowtimeAvailability.held).where(ShowtimeAvailability.showtime_id == showtime_id)
+    ).scalar() or 0
+
+
+def held_tickets(db, ticket_ids):
+    db.rollback()
+    return db.query(Ticket.id).filter(Ticket.id.in_(ticket_ids), Ticket.status == HELD).count()
+
+
+def test_expired_holds_are_removed_and_their_seats_freed(db, catalog, seated):
+    live = crud_holds.create_hold(db, catalog["customers"][0], seated, ["A1"])
+    stale = crud_holds.create_hold(db, catalog["customers"][1], seated, ["A2"], ttl_seconds=-1)
+    assert reserved(db, seated, "A2")
+    assert held(db, seated) == 2
+
+    assert crud_holds.expire_holds(db) >= 1
+
+    assert held_tickets(db, stale["ticket_ids"]) == 0
+    assert not reserved(db, seated, "A2")
+    assert held(db, seated) == 1
+    # An unexpired hold is left alone.
+    assert held_tickets(db, live["ticket_ids"]) == 1
+    assert reserved(db, seated, "A1")
+
+
+def test_an_expired_hold_cannot_be_confirmed(db, catalog, seated):
+    customer_id = catalog["customers"][0]
+    hold = crud_holds.create_hold(db, customer_id, seated, ["A3"], ttl_seconds=-1)
+
+    with pytest.raises(HTTPException) as error:
+        crud_holds.confirm_hold(db, customer_id, hold["hold_token"], hold["ticket_ids"])
+    assert error.value.status_code == 409
+
+    # Nothing was sold; the seat waits for the sweeper.
+    assert held_tickets(db, hold["ticket_ids"]) == 1
+    assert reserved(db, seated, "A3")
+
+
+def test_a_hold_is_released_once(db, catalog, seated):
+    customer_id = catalog["customers"][0]
+    hold = crud_holds.create_hold(db, customer_id, seated, ["A4", "A5"])
+    assert held(db, seated) == 2
+
+    assert crud_holds.release_hold(db, customer_id, hold["hold_token"], hold["ticket_ids"]) == 2
+    assert crud_holds.release_hold(db, customer_id, hold["hold_token"], hold["ticket_ids"]) == 0
+
+    assert held(db, seated) == 0
+    assert not reserved(db, seated, "A4")
+    assert not reserved(db, seated, "A5")
+
+
+def test_the_sweeper_gives_expired_seats_back_to_the_map(db, catalog, seated):
+    hold = crud_holds.create_hold(db, catalog["customers"][0], seated, ["B1", "B2"], ttl_seconds=-1)
+    db.commit()
+
+    assert sweeper.sweep_once() >= 2
+
+    assert held_tickets(db, hold["ticket_ids"]) == 0
+    assert not reserved(db, seated, "B1")
+    assert not reserved(db, seated, "B2")
+    # The seats can be held again straight away.
+    again = crud_holds.create_hold(db, catalog["customers"][1], seated, ["B1", "B2"])
+    assert again["seats"] == ["B1", "B2"]
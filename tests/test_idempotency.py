@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+import config
+from idempotency import (
+    DONE, NEW, PENDING, DatabaseIdempotencyStore, IdempotencyMiddleware, MemoryIdempotencyStore, StoredResponse
+)
+
+
+@pytest.fixture()
+def counting_client():
+    app = FastAPI()
+    calls = []
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        calls.append(await request.body())
+        return {"size": len(calls[-1]), "padding": "x" * 200}
+
+    app.add_middleware(IdempotencyMiddleware, store=MemoryIdempotencyStore())
+    with TestClient(app) as client:
+        yield client, calls
+
+
+def test_expired_claim_is_taken_over_once(db_engine):
+    from database import SessionLocal
+    from models import IdempotencyRecord
+
+    store = DatabaseIdempotencyStore(SessionLocal, lease=60)
+    assert store.begin("/tickets/|lease", "f")[0] == NEW
+    assert store.begin("/tickets/|lease", "f")[0] == PENDING
+    with SessionLocal() as db:
+        db.query(IdempotencyRecord).filter(IdempotencyRecord.key == "/tickets/|lease").update(
+            {IdempotencyRecord.claimed_at: datetime.datetime.utcnow() - datetime.timedelta(seconds=120)}
+        )
+        db.commit()
+    assert store.begin("/tickets/|lease", "f")[0] == NEW
+    assert store.begin("/tickets/|lease", "f")[0] == PENDING
+
+
+def test_oversized_response_is_not_run_twice(counting_client, monkeypatch):
+    client, calls = counting_client
+    monkeypatch.setattr(config, "IDEMPOTENCY_MAX_BODY_BYTES", 50)
+    first = client.post("/echo", content=b"{}", headers={"Idempotency-Key": "big"})
+    retry = client.post("/echo", content=b"{}", headers={"Idempotency-Key": "big"})
+    assert first.status_code == 200
+    assert retry.status_code == 409
+    assert len(calls) == 1
+
+
+def test_small_response_is_replayed(counting_client):
+    client, calls = counting_client
+    first = client.post("/echo", content=b"{}", headers={"Idempotency-Key": "small"})
+    retry = client.post("/echo", content=b"{}", headers={"Idempotency-Key": "small"})
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(calls) == 1
+
+
+def test_multipart_upload_skips_idempotency(counting_client):
+    client, calls = counting_client
+    for _ in range(2):
+        response = client.post("/echo", files={"file": ("rows.csv", b"a,b\n")}, headers={"Idempotency-Key": "upload"})
+        assert "Idempotent-Replayed" not in response.headers
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("make_store", [MemoryIdempotencyStore, lambda: DatabaseIdempotencyStore()])
+def test_stores_keep_the_too_large_marker(db_engine, make_store):
+    store = make_store()
+    assert store.begin("/tickets/|marker", "f")[0] == NEW
+    store.complete("/tickets/|marker", StoredResponse(201, "application/json", None))
+    state, stored = store.begin("/tickets/|marker", "f")
+    assert state == DONE
+    assert stored.body is None
@@ -0,0 +1,78 @@
+import io
+
+import pytest
+from sqlalchemy import text
+
+from crud import importer
+
+
+@pytest.fixture()
+def reject_name_bad(db):
+    """A trigger that makes the database itself refuse customers named "bad"."""
+    db.execute(text(
+        "CREATE TRIGGER reject_bad BEFORE INSERT ON customers WHEN NEW.name = 'bad' "
+        "BEGIN SELECT RAISE(ABORT, 'bad customer'); END"
+    ))
+    db.commit()
+    yield
+    db.execute(text("DROP TRIGGER reject_bad"))
+    db.commit()
+
+
+def test_rejected_row_is_reported_and_the_rest_of_the_chunk_loads(db, reject_name_bad):
+    csv = "name,email\nAnn,ann@import.test\nbad,bad@import.test\nCid,cid@import.test\nAnna,ann@import.test\n"
+    report = importer.import_csv(db, "customers", io.StringIO(csv)).as_dict()
+    assert report["rows_read"] == 4
+    assert report["rows_loaded"] == 2
+    assert [error["line"] for error in report["errors"]] == [3]
+    assert "bad customer" in report["errors"][0]["error"]
+
+
+def test_rows_loaded_counts_upserted_rows(db):
+    csv = "name,email\nDee,dee@import.test\nEve,eve@import.test\n"
+    assert importer.import_csv(db, "customers", io.StringIO(csv)).rows_loaded == 2
+    assert importer.import_csv(db, "customers", io.StringIO(csv), chunk_size=1).rows_loaded == 2
+
+
+def test_rows_without_a_key_are_not_collapsed(db):
+    csv = "name,email\nAnn,\nBob,\nCat,\nDan,dan@import.test\n"
+    report = importer.import_csv(db, "customers", io.StringIO(csv)).as_dict()
+    assert report["rows_read"] == 4
+    assert report["rows_loaded"] == 4
+    assert report["errors"] == []
+    names = db.execute(text("SELECT name FROM customers WHERE name IN ('Ann', 'Bob', 'Cat', 'Dan')")).scalars()
+    assert sorted(names) == ["Ann", "Bob", "Cat", "Dan"]
+
+
+def test_copy_from_prefers_psycopg3():
+    class Copy:
+        def __init__(self, sink):
+            self.sink = sink
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def write(self, data):
+            self.sink.append(data)
+
+    class Psycopg3Cursor:
+        written = []
+
+        def copy(self, sql):
+            return Copy(self.written)
+
+        def close(self):
+            pass
+
+    class Conn:
+        class connection:
+            class dbapi_connection:
+                @staticmethod
+                def cursor():
+                    return Psycopg3Cursor()
+
+    importer._copy_from(Conn, "COPY t FROM STDIN", io.StringIO("a,b\n"))
+    assert Psycopg3Cursor.written == ["a,b\n"]
@@ -0,0 +1,34 @@
+import pytest
+
+from routers import customer, play, ticket
+
+# The column-only list path (FAST_LIST_RESPONSES) skips the response models
+# on the way out, so it has to produce exactly what the ORM path produces.
+
+
+@pytest.fixture(scope="module")
+def held_ticket(client, catalog):
+    showtime_id = catalog["showtimes"][0]
+    client.post(f"/showtimes/{showtime_id}/seats", json={"rows": 5, "seats_per_row": 10})
+    hold = client.post(
+        f"/showtimes/{showtime_id}/seats/reserve",
+        json={"customer_id": catalog["customers"][0], "seats": ["E1"]}
+    )
+    assert hold.status_code == 201, hold.text
+    return hold.json()["ticket_ids"][0]
+
+
+@pytest.mark.parametrize("path,router", [
+    ("/plays/", play),
+    ("/customers/", customer),
+    ("/tickets/", ticket),
+    ("/tickets/?status=held", ticket),
+])
+def test_fast_list_matches_orm_list(client, held_ticket, monkeypatch, path, router):
+    monkeypatch.setattr(router, "FAST_LIST_RESPONSES", True)
+    fast = client.get(path, params={"limit": 5})
+    monkeypatch.setattr(router, "FAST_LIST_RESPONSES", False)
+    orm = client.get(path, params={"limit": 5})
+    assert fast.status_code == orm.status_code == 200
+    assert fast.json()["items"], fast.json()
+    assert fast.json() == orm.json()
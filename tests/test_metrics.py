@@ -0,0 +1,27 @@
+def route_labels(client, method):
+    return {
+        line.split('route="', 1)[1].split('"', 1)[0]
+        for line in client.get("/metrics").text.splitlines()
+        if line.startswith("http_responses_total{") and f'method="{method}"' in line
+    }
+
+
+def test_routes_are_labelled_with_their_prefix(client, catalog):
+    client.post("/plays/", json={"title": "Metrics play"})
+    client.post("/customers/", json={"name": "Metrics customer", "email": "metrics@example.com"})
+    client.get(f"/plays/{catalog['plays'][0]}")
+    client.get(f"/customers/{catalog['customers'][0]}")
+    client.get(f"/showtimes/{catalog['showtimes'][0]}/seats")
+
+    assert {"/plays/", "/customers/"} <= route_labels(client, "POST")
+    assert {
+        "/plays/{play_id}",
+        "/customers/{customer_id}",
+        "/showtimes/{showtime_id}/seats",
+    } <= route_labels(client, "GET")
+    assert "/" not in route_labels(client, "POST")
+
+
+def test_unknown_paths_share_one_label(client):
+    client.get("/no-such-thing/42")
+    assert "unmatched" in route_labels(client, "GET")
@@ -0,0 +1,38 @@
+import pytest
+
+from crud.keyset import MAX_PAGE_SIZE
+
+LISTS = ["/plays/", "/actors/", "/directors/", "/customers/", "/showtimes/", "/tickets/"]
+
+
+@pytest.fixture(scope="module")
+def async_client(db_engine):
+    from fastapi.testclient import TestClient
+    from main import create_app
+
+    with TestClient(create_app("async")) as test_client:
+        yield test_client
+
+
+@pytest.mark.parametrize("limit", [0, -1, MAX_PAGE_SIZE + 1])
+@pytest.mark.parametrize("path", LISTS)
+def test_out_of_range_limits_are_rejected(client, async_client, path, limit):
+    for api in (client, async_client):
+        response = api.get(path, params={"limit": limit})
+        assert response.status_code == 422, (path, limit, response.text)
+
+
+def test_limit_bounds_are_accepted(client, catalog):
+    first = client.get("/showtimes/", params={"limit": 1})
+    assert first.status_code == 200
+    assert len(first.json()["items"]) == 1
+    assert first.json()["next_cursor"]
+
+    everything = client.get("/showtimes/", params={"limit": MAX_PAGE_SIZE})
+    assert everything.status_code == 200
+    assert len(everything.json()["items"]) == len(catalog["showtimes"])
+
+
+@pytest.mark.parametrize("path", ["/search/?q=play", "/analytics/top-plays"])
+def test_other_limited_lists_reject_zero(client, path):
+    assert client.get(path, params={"limit": 0}).status_code == 422
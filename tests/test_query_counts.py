@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from querycount import assert_max_queries
+from routers.expand import ShowtimeExpandedResponse, TicketExpandedResponse
+from routers.pagination import Page
+
+# Every expanded list page is a fixed number of statements, however many rows
+# it holds: many-to-one relations are joined into the page query and each
+# collection costs one more SELECT. Serializing the page through its response
+# model is part of the block, so a lazy load per row fails the test.
+
+TICKET_EXPANSIONS = [
+    (None, 1),
+    ("showtime", 1),
+    ("customer", 1),
+    ("showtime.play", 1),
+    ("showtime,customer", 1),
+    ("showtime.play,customer", 1),
+]
+
+SHOWTIME_EXPANSIONS = [
+    (None, 1),
+    ("play", 1),
+    ("tickets", 2),
+    ("play,tickets", 2),
+]
+
+
+@pytest.mark.parametrize("expand,limit", TICKET_EXPANSIONS)
+def test_ticket_list_queries(db, db_engine, catalog, expand, limit):
+    from crud import tickets as crud_tickets
+
+    with assert_max_queries(limit, db_engine):
+        tickets, next_cursor = crud_tickets.get_tickets(db, expand=expand)
+        page = Page[TicketExpandedResponse](items=tickets, next_cursor=next_cursor).model_dump()
+    assert len(page["items"]) == 4 * len(catalog["showtimes"])
+    if expand and "showtime.play" in expand:
+        assert all(item["showtime"]["play"] for item in page["items"])
+
+
+@pytest.mark.parametrize("expand,limit", SHOWTIME_EXPANSIONS)
+def test_showtime_list_queries(db, db_engine, catalog, expand, limit):
+    from crud import showtime as crud_showtime
+
+    with assert_max_queries(limit, db_engine):
+        showtimes, next_cursor = crud_showtime.get_showtimes(db, expand=expand)
+        page = Page[ShowtimeExpandedResponse](items=showtimes, next_cursor=next_cursor).model_dump()
+    assert len(page["items"]) == len(catalog["showtimes"])
+    if expand and "tickets" in expand:
+        assert all(len(item["tickets"]) == 4 for item in page["items"])
+
+
+def test_expanded_tickets_are_capped(db, catalog, monkeypatch):
+    import config
+    from crud import showtime as crud_showtime
+
+    monkeypatch.setattr(config, "EXPAND_TICKETS_LIMIT", 3)
+    showtimes, _ = crud_showtime.get_showtimes(db, expand="tickets")
+    page = Page[ShowtimeExpandedResponse](items=showtimes, next_cursor=None).model_dump()
+    assert all(len(item["tickets"]) == 3 and item["tickets_truncated"] for item in page["items"])
+
+
+@pytest.mark.parametrize("expand,limit", SHOWTIME_EXPANSIONS)
+def test_async_showtime_list_queries(catalog, expand, limit):
+    from crud.aio import showtime as crud_showtime
+    from database import AsyncSessionLocal, get_async_engine
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            with assert_max_queries(limit, get_async_engine().sync_engine):
+                showtimes, next_cursor = await crud_showtime.get_showtimes(db, expand=expand)
+                return Page[ShowtimeExpandedResponse](items=showtimes, next_cursor=next_cursor).model_dump()
+
+    assert len(asyncio.run(run())["items"]) == len(catalog["showtimes"])
+
+
+@pytest.mark.parametrize("expand,limit", TICKET_EXPANSIONS)
+def test_async_ticket_list_queries(catalog, expand, limit):
+    from crud.aio import tickets as crud_tickets
+    from database import AsyncSessionLocal, get_async_engine
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            with assert_max_queries(limit, get_async_engine().sync_engine):
+                tickets, next_cursor = await crud_tickets.get_tickets(db, expand=expand)
+                return Page[TicketExpandedResponse](items=tickets, next_cursor=next_cursor).model_dump()
+
+    assert len(asyncio.run(run())["items"]) == 4 * len(catalog["showtimes"])
@@ -0,0 +1,66 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from crud import seats as crud_seats
+from models import SeatInventory
+
+
+def version(db, showtime_id):
+    return db.execute(select(SeatInventory.version).where(SeatInventory.showtime_id == showtime_id)).scalar()
+
+
+def racing(db, showtime_id, losses, calls):
+    """A reserve that loses the race ``losses`` times: another writer moves the version under it."""
+    def mutate(reserved, sold, indexes):
+        calls.append(indexes)
+        if len(calls) <= losses:
+            db.execute(
+                update(SeatInventory)
+                .where(SeatInventory.showtime_id == showtime_id)
+                .values(version=SeatInventory.version + 1)
+            )
+        crud_seats._do_reserve(reserved, sold, indexes)
+    return mutate
+
+
+def test_a_claimed_seat_cannot_be_claimed_again(db, seated):
+    assert crud_seats.claim_seats(db, seated, ["a1"]) == ["A1"]
+    db.commit()
+
+    with pytest.raises(HTTPException) as error:
+        crud_seats.claim_seats(db, seated, ["A1", "A2"])
+    assert error.value.status_code == 409
+    assert "A1" in error.value.detail
+    db.rollback()
+
+    # All or nothing: A2 stayed free.
+    assert crud_seats.claim_seats(db, seated, ["A2"]) == ["A2"]
+    db.commit()
+
+
+def test_a_lost_race_is_retried_on_the_new_version(db, seated, monkeypatch):
+    monkeypatch.setattr(crud_seats, "backoff", lambda attempt: 0)
+    before = version(db, seated)
+    calls = []
+
+    reserved, _ = crud_seats._swap(db, seated, ["B1"], racing(db, seated, 2, calls))
+    db.commit()
+
+    assert len(calls) == 3
+    assert reserved.is_set(reserved.index("B1"))
+    # Two versions moved by the "other writer", one by the swap that won.
+    assert version(db, seated) == before + 3
+
+
+def test_a_seat_map_that_keeps_moving_gives_up_with_503(db, seated, monkeypatch):
+    monkeypatch.setattr(crud_seats, "backoff", lambda attempt: 0)
+    monkeypatch.setattr(crud_seats, "MAX_CAS_RETRIES", 4)
+    calls = []
+
+    with pytest.raises(HTTPException) as error:
+        crud_seats._swap(db, seated, ["B2"], racing(db, seated, 10, calls))
+    db.rollback()
+
+    assert error.value.status_code == 503
+    assert len(calls) == 4
@@ -0,0 +1,38 @@
+import pytest
+
+import config
+import serve
+
+
+@pytest.fixture()
+def shared_backends(monkeypatch):
+    monkeypatch.setattr(config, "CACHE_BACKEND", "redis")
+    monkeypatch.setattr(config, "IDEMPOTENCY_BACKEND", "db")
+
+
+@pytest.fixture()
+def per_process_backends(monkeypatch):
+    monkeypatch.setattr(config, "CACHE_BACKEND", "local")
+    monkeypatch.setattr(config, "IDEMPOTENCY_BACKEND", "memory")
+
+
+def test_one_worker_per_cpu_with_shared_backends(shared_backends, monkeypatch):
+    monkeypatch.setattr(config, "WEB_WORKERS", 0)
+    monkeypatch.setattr(serve.os, "cpu_count", lambda: 8)
+    assert serve.default_workers() == 8
+
+
+def test_a_single_worker_with_per_process_backends(per_process_backends, monkeypatch):
+    monkeypatch.setattr(config, "WEB_WORKERS", 0)
+    monkeypatch.setattr(serve.os, "cpu_count", lambda: 8)
+    assert serve.default_workers() == 1
+
+
+def test_web_workers_wins(per_process_backends, monkeypatch):
+    monkeypatch.setattr(config, "WEB_WORKERS", 3)
+    assert serve.default_workers() == 3
+
+
+def test_several_workers_with_per_process_backends_are_refused(per_process_backends):
+    with pytest.raises(SystemExit):
+        serve.main(["--workers", "2"])
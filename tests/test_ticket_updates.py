@@ -0,0 +1,38 @@
+import pytest
+
+
+@pytest.fixture()
+def ticket(client, catalog):
+    # A showtime of its own, so no seat map from another test is in the way.
+    showtime = client.post("/showtimes/", json={
+        "play_id": catalog["plays"][0],
+        "show_date": "2030-02-01T20:00:00",
+        "location": "Studio",
+    }).json()
+    response = client.post("/tickets/", json={
+        "customer_id": catalog["customers"][0],
+        "showtime_id": showtime["id"],
+        "seat_number": "N1",
+    })
+    assert response.status_code in (200, 201), response.text
+    ticket = response.json()
+    yield ticket
+    client.delete(f"/tickets/{ticket['id']}")
+
+
+@pytest.mark.parametrize("field", ["seat_number", "showtime_id", "customer_id"])
+def test_explicit_null_is_rejected(client, ticket, field):
+    response = client.put(f"/tickets/{ticket['id']}", json={field: None})
+    assert response.status_code == 422
+
+    stored = client.get(f"/tickets/{ticket['id']}")
+    assert stored.status_code == 200
+    assert stored.json()[field] == ticket[field]
+
+
+def test_omitted_fields_are_left_alone(client, catalog, ticket):
+    response = client.put(f"/tickets/{ticket['id']}", json={"customer_id": catalog["customers"][1]})
+    assert response.status_code == 200
+    assert response.json()["customer_id"] == catalog["customers"][1]
+    assert response.json()["seat_number"] == ticket["seat_number"]
+    assert response.json()["showtime_id"] == ticket["showtime_id"]